@@ -157,6 +157,11 @@ class AppContext:
         Raises:
             The last encountered exception if all retries fail
         """
+        # Queued writes hold the write lock and must not run twice in a group transaction
+        from modules.core.database.writer import in_writer
+        if in_writer():
+            return await coro
+        
         attempts = 0
         max_retries = self.max_retries if retries is None else retries
         delay_base = self.retry_delay_base if retry_delay is None else retry_delay
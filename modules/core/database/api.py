@@ -12,7 +12,7 @@ import json
 import logging
 import os
 import sys
-from typing import Optional, List, Dict, Any, Type
+from typing import Optional, List, Dict, Any, Type, Callable
 
 from fastapi import APIRouter, Depends, Body, Path, Query, HTTPException
 from fastapi.responses import JSONResponse
@@ -124,6 +124,22 @@ from .api_schemas import (
         ],
         tags=["session", "integrity", "database-access"]
     ),
+    ServiceMethod(
+        name="write",
+        description="Run a write through the database's single-writer queue with group commit",
+        params=[
+            ServiceParam("database_name", str, required=True, description="Database name to write to"),
+            ServiceParam("work", Callable, required=True,
+                        description="Async function taking the writer session"),
+            ServiceParam("purpose", str, required=False, default="write",
+                        description="Purpose of the write for logging")
+        ],
+        returns=ServiceReturn("Any", "Value returned by work, after its transaction has committed"),
+        examples=[
+            ServiceExample("await write('framework', save_event, 'record_event')", "Result of save_event(session)")
+        ],
+        tags=["session", "write", "database-access"]
+    ),
     ServiceMethod(
         name="execute_raw_query",
         description="Execute raw SQL query with safety checks and error handling",
@@ -182,6 +198,102 @@ from .api_schemas import (
         ],
         tags=["crud", "read", "query"]
     ),
+    ServiceMethod(
+        name="read_page",
+        description="Read one page of records with keyset (cursor) pagination",
+        params=[
+            ServiceParam("db", "AsyncSession", required=True, description="Database session"),
+            ServiceParam("model_class", Type, required=True, description="SQLAlchemy model class"),
+            ServiceParam("filters", Dict[str, Any], required=False, description="Filter conditions"),
+            ServiceParam("limit", int, required=False, default=100, description="Page size"),
+            ServiceParam("order_by", List[str], required=False, description="Sort fields, '-' prefix for descending"),
+            ServiceParam("cursor", str, required=False, description="next_cursor from the previous page"),
+            ServiceParam("include_total", bool, required=False, default=False,
+                        description="Exact COUNT(*) instead of a cheap row count estimate")
+        ],
+        returns=ServiceReturn("Result", "Result with items, next_cursor, has_more, total and total_estimated"),
+        examples=[
+            ServiceExample("read_page(session, EventModel, limit=500, order_by=['-created_at'])",
+                          "Result.success(data={'items': [...], 'next_cursor': 'eyJr...', 'has_more': True, ...})"),
+        ],
+        tags=["crud", "read", "query", "pagination"]
+    ),
+    ServiceMethod(
+        name="stream",
+        description="Async generator yielding records in chunks through a server-side cursor",
+        params=[
+            ServiceParam("db", "AsyncSession", required=True, description="Database session"),
+            ServiceParam("model_class", Type, required=True, description="SQLAlchemy model class"),
+            ServiceParam("filters", Dict[str, Any], required=False, description="Filter conditions"),
+            ServiceParam("order_by", List[str], required=False, description="Sort fields, '-' prefix for descending"),
+            ServiceParam("columns", List[str], required=False, description="Specific columns to retrieve"),
+            ServiceParam("as_dict", bool, required=False, default=False, description="Yield dictionaries"),
+            ServiceParam("chunk_size", int, required=False, default=1000, description="Records per chunk")
+        ],
+        returns=ServiceReturn("AsyncIterator[List]", "Chunks of model instances, rows or dictionaries"),
+        examples=[
+            ServiceExample("async for chunk in stream(session, EventModel, as_dict=True, chunk_size=2000):",
+                          "[{'id': 1, ...}, ...] per chunk"),
+        ],
+        tags=["crud", "read", "query", "streaming"]
+    ),
+    ServiceMethod(
+        name="bulk_insert",
+        description="Insert many records with batched Core INSERTs, without per-row refresh",
+        params=[
+            ServiceParam("db", "AsyncSession", required=True, description="Database session"),
+            ServiceParam("model_class", Type, required=True, description="SQLAlchemy model class"),
+            ServiceParam("objects_data", List[Dict[str, Any]], required=True, description="Data for new records"),
+            ServiceParam("return_ids", bool, required=False, default=False,
+                        description="Return primary keys of inserted rows via RETURNING"),
+            ServiceParam("chunk_size", int, required=False, description="Maximum rows per statement")
+        ],
+        returns=ServiceReturn("Result", "Result with inserted_count and ids"),
+        examples=[
+            ServiceExample("bulk_insert(session, EventModel, events, return_ids=True)",
+                          "Result.success(data={'inserted_count': 50000, 'ids': [...]})"),
+        ],
+        tags=["crud", "create", "bulk"]
+    ),
+    ServiceMethod(
+        name="upsert",
+        description="Insert a record or update the one identified by filters (INSERT ... ON CONFLICT DO UPDATE)",
+        params=[
+            ServiceParam("db", "AsyncSession", required=True, description="Database session"),
+            ServiceParam("model_class", Type, required=True, description="SQLAlchemy model class"),
+            ServiceParam("filters", Dict[str, Any], required=True,
+                        description="Field values of the primary key or a UNIQUE constraint"),
+            ServiceParam("obj_data", Dict[str, Any], required=True, description="Data for the record"),
+            ServiceParam("update_fields", List[str], required=False,
+                        description="Fields to overwrite on conflict (default: all of obj_data)")
+        ],
+        returns=ServiceReturn("Result", "Result with the created or updated object"),
+        examples=[
+            ServiceExample("upsert(session, PrefModel, {'module_id': 'core.database', 'setting_key': 'pool_size'}, {'value': 20})",
+                          "Result.success(data=<PrefModel>)"),
+        ],
+        tags=["crud", "create", "update", "upsert"]
+    ),
+    ServiceMethod(
+        name="bulk_upsert",
+        description="Insert or update many records with batched INSERT ... ON CONFLICT DO UPDATE",
+        params=[
+            ServiceParam("db", "AsyncSession", required=True, description="Database session"),
+            ServiceParam("model_class", Type, required=True, description="SQLAlchemy model class"),
+            ServiceParam("objects_data", List[Dict[str, Any]], required=True, description="Data for the records"),
+            ServiceParam("conflict_fields", List[str], required=False,
+                        description="Primary key or UNIQUE constraint fields (default: primary key)"),
+            ServiceParam("update_fields", List[str], required=False,
+                        description="Fields to overwrite on conflict (default: all non-conflict fields)"),
+            ServiceParam("chunk_size", int, required=False, description="Maximum rows per statement")
+        ],
+        returns=ServiceReturn("Result", "Result with upserted_count"),
+        examples=[
+            ServiceExample("bulk_upsert(session, ErrorCodeModel, rows, conflict_fields=['module_id', 'code'])",
+                          "Result.success(data={'upserted_count': 120})"),
+        ],
+        tags=["crud", "bulk", "upsert"]
+    ),
     ServiceMethod(
         name="update", 
         description="Update existing records in database table",
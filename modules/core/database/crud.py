@@ -7,7 +7,7 @@ Generic CRUD operations for database models with enhanced filtering capabilities
 import logging
 import random
 import asyncio
-from typing import Dict, List, Any, Optional, Type, Union, TypeVar, Callable, Awaitable
+from typing import Dict, List, Any, Optional, Type, Union, TypeVar, Callable, Awaitable, AsyncIterator
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -16,6 +16,7 @@ from .crud_filters import FilterParser
 from .crud_operations import CRUDOperations
 from .crud_transactions import TransactionManager
 from .crud_utils import ModelUtils
+from .pagination import InvalidCursorError
 
 # Import utilities for error handling
 from core.error_utils import Result, error_message
@@ -378,6 +379,154 @@ class CRUDService:
                 details={"error": str(e), "filters": filters}
             )
     
+    async def read_page(self, db: AsyncSession, model_class: Type[ModelType],
+                        filters: Optional[Dict[str, Any]] = None,
+                        limit: int = 100,
+                        order_by: Optional[List[str]] = None,
+                        columns: Optional[List[str]] = None,
+                        as_dict: bool = False,
+                        cursor: Optional[str] = None,
+                        include_total: bool = False) -> Result:
+        """
+        Read one page of records using keyset (cursor) pagination.
+        
+        Unlike read_many's skip/limit, each page continues after the last row of
+        the previous page, so deep pages cost the same as the first one. Rows are
+        ordered by order_by plus the primary key as a tie-breaker.
+        
+        Args:
+            db: Database session
+            model_class: SQLAlchemy model class
+            filters: Dictionary of field:value filters or operator-based filters
+            limit: Maximum number of records to return
+            order_by: Field(s) to order by (list of strings, prefix with "-" for descending)
+            columns: Specific columns to retrieve (None for all)
+            as_dict: Whether to return results as dictionaries
+            cursor: Opaque next_cursor from the previous page (None for the first page)
+            include_total: Count matching rows exactly; otherwise total is a cheap
+                           estimate of the table's row count (total_estimated=True)
+            
+        Returns:
+            Result object with {"items", "next_cursor", "has_more", "total",
+            "total_estimated"} or error information (INVALID_CURSOR for a bad cursor)
+            
+        Examples:
+            ```python
+            cursor = None
+            while True:
+                result = await crud_service.read_page(
+                    session, Event, {"type": "click"},
+                    limit=500, order_by=["-created_at"], cursor=cursor
+                )
+                process(result.data["items"])
+                cursor = result.data["next_cursor"]
+                if cursor is None:
+                    break
+            ```
+        """
+        # Check initialization
+        if not self.initialized and not await self.initialize():
+            return Result.error(
+                code="SERVICE_NOT_INITIALIZED",
+                message=f"{COMPONENT_ID} service not initialized"
+            )
+        
+        try:
+            page = await self.operations.read_page(
+                db, model_class, filters, limit, order_by, columns, as_dict, cursor, include_total
+            )
+            if page is None:
+                return Result.error(
+                    code="READ_PAGE_ERROR",
+                    message=f"Error reading page of {model_class.__name__} records",
+                    details={"filters": filters}
+                )
+            
+            return Result.success(data=page)
+            
+        except InvalidCursorError as e:
+            return Result.error(
+                code="INVALID_CURSOR",
+                message=str(e),
+                details={"order_by": order_by}
+            )
+        except Exception as e:
+            self.logger.error(error_message(
+                module_id=COMPONENT_ID,
+                error_type="READ_PAGE_ERROR",
+                details=f"Error reading page of {model_class.__name__} records: {str(e)}",
+                location="read_page()"
+            ))
+            
+            return Result.error(
+                code="READ_PAGE_ERROR",
+                message=f"Error reading page of {model_class.__name__} records",
+                details={"error": str(e), "filters": filters}
+            )
+    
+    async def stream(self, db: AsyncSession, model_class: Type[ModelType],
+                     filters: Optional[Dict[str, Any]] = None,
+                     order_by: Optional[List[str]] = None,
+                     columns: Optional[List[str]] = None,
+                     as_dict: bool = False,
+                     chunk_size: int = 1000) -> AsyncIterator[List[Any]]:
+        """
+        Stream records in chunks with bounded memory.
+        
+        Takes the same filters, ordering and column selection as read_many, but
+        reads through a server-side cursor and yields chunk_size records at a
+        time instead of materializing the whole result. Use it for exports and
+        other full-table passes.
+        
+        As an async generator it cannot return a Result: errors are logged and
+        raised to the caller. The session must not run other queries until the
+        iteration finishes.
+        
+        Args:
+            db: Database session
+            model_class: SQLAlchemy model class
+            filters: Dictionary of field:value filters or operator-based filters
+            order_by: Field(s) to order by (list of strings, prefix with "-" for descending)
+            columns: Specific columns to retrieve (None for all)
+            as_dict: Whether to yield dictionaries
+            chunk_size: Records per yielded chunk
+            
+        Yields:
+            Lists of up to chunk_size model instances, rows or dictionaries
+            
+        Raises:
+            RuntimeError: If the service is not initialized
+            SQLAlchemyError: If the query fails
+            
+        Examples:
+            ```python
+            async with app_context.database.integrity_session("analytics", "export") as session:
+                async for chunk in crud_service.stream(
+                    session, Event, {"type": "click"},
+                    order_by=["created_at"], as_dict=True, chunk_size=2000
+                ):
+                    writer.writerows(chunk)
+            ```
+        """
+        # Check initialization
+        if not self.initialized and not await self.initialize():
+            raise RuntimeError(f"{COMPONENT_ID} service not initialized")
+        
+        try:
+            async for chunk in self.operations.stream(
+                db, model_class, filters, order_by, columns, as_dict, chunk_size
+            ):
+                yield chunk
+                
+        except Exception as e:
+            self.logger.error(error_message(
+                module_id=COMPONENT_ID,
+                error_type="STREAM_ERROR",
+                details=f"Error streaming {model_class.__name__} records: {str(e)}",
+                location="stream()"
+            ))
+            raise
+    
     async def update(self, db: AsyncSession, model_class: Type[ModelType], 
                    id: Any, obj_data: Dict[str, Any],
                    params: Optional[Dict[str, Any]] = None) -> Result:
@@ -658,6 +807,10 @@ class CRUDService:
         """
         Create a record if it doesn't exist, or update it if it does.
         
+        Uses a single INSERT ... ON CONFLICT DO UPDATE when unique_field has a
+        PRIMARY KEY or UNIQUE constraint, otherwise a read followed by an update
+        or insert.
+        
         Args:
             db: Database session
             model_class: SQLAlchemy model class
@@ -725,6 +878,71 @@ class CRUDService:
                 }
             )
     
+    async def upsert(self, db: AsyncSession, model_class: Type[ModelType],
+                     filters: Dict[str, Any], obj_data: Dict[str, Any],
+                     update_fields: Optional[List[str]] = None,
+                     params: Optional[Dict[str, Any]] = None) -> Result:
+        """
+        Insert a record or update the one identified by filters.
+        
+        When the filter fields form the primary key or a UNIQUE constraint, this
+        is one INSERT ... ON CONFLICT DO UPDATE statement: no read first and no
+        race between concurrent writers. Operator filters, or fields without such
+        a constraint, fall back to reading the first match.
+        
+        Args:
+            db: Database session
+            model_class: SQLAlchemy model class
+            filters: Field values identifying the record
+            obj_data: Data for the new or updated record
+            update_fields: Fields to overwrite on conflict (default: all of
+                           obj_data; [] keeps an existing record unchanged)
+            
+        Returns:
+            Result object with created or updated object or error information
+            
+        Example:
+            ```python
+            result = await crud_service.upsert(
+                session, UserPreferences,
+                {"user_id": "default", "module_id": "core.database", "setting_key": "pool_size"},
+                {"value": 20}
+            )
+            ```
+        """
+        # Check initialization
+        if not self.initialized and not await self.initialize():
+            return Result.error(
+                code="SERVICE_NOT_INITIALIZED",
+                message=f"{COMPONENT_ID} service not initialized"
+            )
+        
+        try:
+            obj = await self.operations.upsert(db, model_class, filters, obj_data, update_fields)
+            
+            if obj is None:
+                return Result.error(
+                    code="UPSERT_FAILED",
+                    message=f"Failed to upsert {model_class.__name__}",
+                    details={"filters": filters}
+                )
+            
+            return Result.success(data=obj)
+            
+        except Exception as e:
+            self.logger.error(error_message(
+                module_id=COMPONENT_ID,
+                error_type="UPSERT_ERROR",
+                details=f"Error in upsert for {model_class.__name__}: {str(e)}",
+                location="upsert()"
+            ))
+            
+            return Result.error(
+                code="UPSERT_ERROR",
+                message=f"Error in upsert for {model_class.__name__}",
+                details={"error": str(e), "filters": filters}
+            )
+    
     # Batch operations
     
     async def bulk_create(self, db: AsyncSession, model_class: Type[ModelType], 
@@ -733,6 +951,9 @@ class CRUDService:
         """
         Create multiple records in a single transaction.
         
+        Every object is refreshed after the commit, one query each. For large
+        batches where the ORM objects aren't needed, use bulk_insert().
+        
         Args:
             db: Database session
             model_class: SQLAlchemy model class
@@ -786,6 +1007,138 @@ class CRUDService:
                 details={"error": str(e), "count": len(objects_data)}
             )
     
+    async def bulk_insert(self, db: AsyncSession, model_class: Type[ModelType],
+                          objects_data: List[Dict[str, Any]],
+                          return_ids: bool = False,
+                          chunk_size: Optional[int] = None,
+                          params: Optional[Dict[str, Any]] = None) -> Result:
+        """
+        Insert many records quickly with Core INSERT statements.
+        
+        Rows go out as batched executemany INSERTs in one transaction, without
+        building ORM objects or refreshing them afterwards. Batches stay within
+        SQLite's bound variable limit.
+        
+        Args:
+            db: Database session
+            model_class: SQLAlchemy model class
+            objects_data: List of data dictionaries for the new records
+            return_ids: Return primary keys of the inserted rows (uses RETURNING;
+                        their order is not guaranteed to match objects_data)
+            chunk_size: Maximum rows per statement (default: SQLite variable limit)
+            
+        Returns:
+            Result object with {"inserted_count", "ids"} or error information
+            
+        Example:
+            ```python
+            result = await crud_service.bulk_insert(session, Event, events, return_ids=True)
+            if result.success:
+                print(f"Inserted {result.data['inserted_count']} events")
+                new_ids = set(result.data["ids"])
+            ```
+        """
+        # Check initialization
+        if not self.initialized and not await self.initialize():
+            return Result.error(
+                code="SERVICE_NOT_INITIALIZED",
+                message=f"{COMPONENT_ID} service not initialized"
+            )
+
+        try:
+            inserted = await self.operations.bulk_insert(db, model_class, objects_data, return_ids, chunk_size)
+            
+            if inserted is None:
+                return Result.error(
+                    code="BULK_INSERT_FAILED",
+                    message=f"Failed to bulk insert {model_class.__name__} records",
+                    details={"count": len(objects_data)}
+                )
+            
+            return Result.success(data=inserted)
+            
+        except Exception as e:
+            self.logger.error(error_message(
+                module_id=COMPONENT_ID,
+                error_type="BULK_INSERT_ERROR",
+                details=f"Error in bulk_insert for {model_class.__name__}: {str(e)}",
+                location="bulk_insert()"
+            ))
+            
+            return Result.error(
+                code="BULK_INSERT_ERROR",
+                message=f"Error in bulk_insert for {model_class.__name__}",
+                details={"error": str(e), "count": len(objects_data)}
+            )
+    
+    async def bulk_upsert(self, db: AsyncSession, model_class: Type[ModelType],
+                          objects_data: List[Dict[str, Any]],
+                          conflict_fields: Optional[List[str]] = None,
+                          update_fields: Optional[List[str]] = None,
+                          chunk_size: Optional[int] = None,
+                          params: Optional[Dict[str, Any]] = None) -> Result:
+        """
+        Insert or update many records with batched INSERT ... ON CONFLICT DO UPDATE.
+        
+        Runs in one transaction without reading existing records. The conflict
+        fields must match the primary key or a UNIQUE constraint in the database.
+        
+        Args:
+            db: Database session
+            model_class: SQLAlchemy model class
+            objects_data: List of data dictionaries
+            conflict_fields: Fields identifying existing records (default: primary key)
+            update_fields: Fields to overwrite on conflict (default: every given
+                           field outside conflict_fields; [] keeps existing records)
+            chunk_size: Maximum rows per statement (default: SQLite variable limit)
+            
+        Returns:
+            Result object with {"upserted_count"} or error information
+            
+        Example:
+            ```python
+            result = await crud_service.bulk_upsert(
+                session, ErrorCode, rows,
+                conflict_fields=["module_id", "code"],
+                update_fields=["last_seen", "count"]
+            )
+            ```
+        """
+        # Check initialization
+        if not self.initialized and not await self.initialize():
+            return Result.error(
+                code="SERVICE_NOT_INITIALIZED",
+                message=f"{COMPONENT_ID} service not initialized"
+            )
+
+        try:
+            upserted = await self.operations.bulk_upsert(
+                db, model_class, objects_data, conflict_fields, update_fields, chunk_size
+            )
+            
+            if upserted is None:
+                return Result.error(
+                    code="BULK_UPSERT_FAILED",
+                    message=f"Failed to bulk upsert {model_class.__name__} records",
+                    details={"count": len(objects_data), "conflict_fields": conflict_fields}
+                )
+            
+            return Result.success(data=upserted)
+            
+        except Exception as e:
+            self.logger.error(error_message(
+                module_id=COMPONENT_ID,
+                error_type="BULK_UPSERT_ERROR",
+                details=f"Error in bulk_upsert for {model_class.__name__}: {str(e)}",
+                location="bulk_upsert()"
+            ))
+            
+            return Result.error(
+                code="BULK_UPSERT_ERROR",
+                message=f"Error in bulk_upsert for {model_class.__name__}",
+                details={"error": str(e), "count": len(objects_data)}
+            )
+    
     async def bulk_update(self, db: AsyncSession, model_class: Type[ModelType],
                          ids: List[Any], obj_data: Dict[str, Any],
                          params: Optional[Dict[str, Any]] = None) -> Result:
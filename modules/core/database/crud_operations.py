@@ -7,20 +7,31 @@ Core CRUD operation implementations with standardized error handling
 import logging
 import random
 import asyncio
-from typing import Dict, Any, List, Type, Optional, TypeVar, Union, Callable, Awaitable
+import sqlite3
+from typing import Dict, Any, List, Type, Optional, TypeVar, Union, Callable, Awaitable, AsyncIterator, Iterator
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import SQLAlchemyError, OperationalError
-from sqlalchemy import select, delete, update, func, inspect, text
+from sqlalchemy import select, insert, delete, update, func, inspect, text, PrimaryKeyConstraint, UniqueConstraint
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 
 # Import error handling utilities
 from core.error_utils import error_message, Result
 
+from .writer import in_writer
+from .pagination import (
+    InvalidCursorError, SortKey, decode_cursor, encode_cursor, estimate_row_count,
+    keyset_condition, order_clauses
+)
+
 # Type variable for SQLAlchemy models
 ModelType = TypeVar("ModelType")
 
 # Component ID for consistent error codes
 COMPONENT_ID = "core.database.crud"
 
+# Bound parameters allowed per statement (SQLITE_MAX_VARIABLE_NUMBER default, raised in 3.32)
+SQLITE_MAX_VARIABLES = 32766 if sqlite3.sqlite_version_info >= (3, 32, 0) else 999
+
 class CRUDOperations:
     """Implementation of CRUD operations."""
     
@@ -113,6 +124,10 @@ class CRUDOperations:
         Raises:
             The last encountered exception if all retries fail
         """
+        # Queued writes hold the write lock and must not run twice in a group transaction
+        if in_writer():
+            return await func(*args, **kwargs)
+        
         # If database service is available, use its retry function
         if hasattr(self, 'db_service') and self.db_service and hasattr(self.db_service, 'execute_with_retry'):
             return await self.db_service.execute_with_retry(func(*args, **kwargs))
@@ -329,45 +344,11 @@ class CRUDOperations:
             List of matching objects or dictionaries
         """
         try:
-            # Build query
-            query = None
-            if columns:
-                # Select specific columns
-                valid_columns = self.model_utils.validate_columns(model_class, columns)
-                if not valid_columns:
-                    self.logger.warning(error_message(
-                        module_id=COMPONENT_ID,
-                        error_type="INVALID_COLUMNS",
-                        details=f"No valid columns specified for {model_class.__name__}",
-                        location="read_many()"
-                    ))
-                    # Fall back to selecting all columns
-                    query = select(model_class)
-                else:
-                    # Select specific columns
-                    query = select(*[getattr(model_class, col) for col in valid_columns])
-            else:
-                # Select all columns
-                query = select(model_class)
-            
-            # Apply filters if provided
-            if filters:
-                filter_expr = self.filter_parser.parse_filters(model_class, filters)
-                if filter_expr is not None:
-                    query = query.filter(filter_expr)
+            # Build query with filters
+            query, valid_columns = self._build_select(model_class, filters, columns, "read_many()")
             
             # Apply ordering if provided
-            if order_by:
-                for field in order_by:
-                    desc_order = field.startswith("-")
-                    field_name = field[1:] if desc_order else field
-                    
-                    if hasattr(model_class, field_name):
-                        order_field = getattr(model_class, field_name)
-                        if desc_order:
-                            query = query.order_by(order_field.desc())
-                        else:
-                            query = query.order_by(order_field)
+            query = query.order_by(*order_clauses(self._sort_key(model_class, order_by)))
             
             # Apply pagination
             if limit > 0:
@@ -377,7 +358,7 @@ class CRUDOperations:
             async def _execute_query():
                 result = await db.execute(query)
                 
-                if columns and len(columns) > 0:
+                if valid_columns:
                     # When selecting specific columns, result is a Row object
                     rows = result.all()
                     
@@ -414,6 +395,228 @@ class CRUDOperations:
             ))
             return []
     
+    def _build_select(self, model_class: Type[ModelType], filters: Optional[Dict[str, Any]],
+                      columns: Optional[List[str]], location: str):
+        """
+        Build the filtered SELECT shared by read_many(), read_page() and stream().
+        
+        Args:
+            model_class: SQLAlchemy model class
+            filters: Dictionary of field:value filters or operator-based filters
+            columns: Specific columns to retrieve (None for all)
+            location: Calling method, for warnings
+            
+        Returns:
+            Tuple of (query, valid column names or None when selecting whole models)
+        """
+        valid_columns = None
+        if columns:
+            valid_columns = self.model_utils.validate_columns(model_class, columns)
+            if not valid_columns:
+                self.logger.warning(error_message(
+                    module_id=COMPONENT_ID,
+                    error_type="INVALID_COLUMNS",
+                    details=f"No valid columns specified for {model_class.__name__}",
+                    location=location
+                ))
+        
+        if valid_columns:
+            # Select specific columns
+            query = select(*[getattr(model_class, col) for col in valid_columns])
+        else:
+            # Select all columns
+            query = select(model_class)
+        
+        # Apply filters if provided
+        if filters:
+            filter_expr = self.filter_parser.parse_filters(model_class, filters)
+            if filter_expr is not None:
+                query = query.filter(filter_expr)
+        
+        return query, valid_columns
+    
+    def _sort_key(self, model_class: Type[ModelType], order_by: Optional[List[str]],
+                  unique: bool = False) -> List[SortKey]:
+        """
+        Resolve order_by fields ("-" prefix for descending) to a sort key.
+        
+        Unknown fields are ignored, as in read_many().
+        
+        Args:
+            model_class: SQLAlchemy model class
+            order_by: Field(s) to order by
+            unique: Append primary key columns so every row has a unique position
+            
+        Returns:
+            List of (column, descending, field name)
+        """
+        sort_key = []
+        for field in order_by or []:
+            desc_order = field.startswith("-")
+            field_name = field[1:] if desc_order else field
+            if hasattr(model_class, field_name):
+                sort_key.append((getattr(model_class, field_name), desc_order, field_name))
+        
+        if unique:
+            mapper = inspect(model_class)
+            names = {name for _, _, name in sort_key}
+            for pk_column in mapper.primary_key:
+                key = mapper.get_property_by_column(pk_column).key
+                if key not in names:
+                    sort_key.append((getattr(model_class, key), False, key))
+        return sort_key
+    
+    async def read_page(self, db: AsyncSession, model_class: Type[ModelType],
+                        filters: Optional[Dict[str, Any]] = None,
+                        limit: int = 100,
+                        order_by: Optional[List[str]] = None,
+                        columns: Optional[List[str]] = None,
+                        as_dict: bool = False,
+                        cursor: Optional[str] = None,
+                        include_total: bool = False) -> Optional[Dict[str, Any]]:
+        """
+        Read one page of records using keyset (cursor) pagination.
+        
+        Rows are ordered by order_by plus the primary key as a tie-breaker.
+        Each page continues after the last row of the previous one, so the
+        cost of a page does not grow with its depth.
+        
+        Args:
+            db: Database session
+            model_class: SQLAlchemy model class
+            filters: Dictionary of field:value filters or operator-based filters
+            limit: Maximum number of records to return
+            order_by: Field(s) to order by (list of strings, "-" prefix for descending)
+            columns: Specific columns to retrieve (sort key columns are always selected)
+            as_dict: Whether to return results as dictionaries
+            cursor: next_cursor of the previous page (None for the first page)
+            include_total: Run an exact COUNT(*) with the filters; otherwise the
+                           total is a cheap estimate of the table's row count
+            
+        Returns:
+            Dict with items, next_cursor (None on the last page), has_more, total
+            and total_estimated, or None if the query failed
+            
+        Raises:
+            InvalidCursorError: If the cursor is malformed or from another ordering
+        """
+        sort_key = self._sort_key(model_class, order_by, unique=True)
+        after_values = decode_cursor(sort_key, cursor) if cursor else None
+        
+        try:
+            select_columns = None
+            if columns:
+                select_columns = list(columns) + [name for _, _, name in sort_key if name not in columns]
+            query, valid_columns = self._build_select(model_class, filters, select_columns, "read_page()")
+            # Only the requested columns are returned as dicts
+            output_columns = [col for col in valid_columns if col in columns] if valid_columns else None
+            count_query = select(func.count()).select_from(query.subquery())
+            
+            if after_values is not None:
+                query = query.where(keyset_condition(sort_key, after_values))
+            query = query.order_by(*order_clauses(sort_key))
+            if limit > 0:
+                # One extra row tells whether another page follows
+                query = query.limit(limit + 1)
+            
+            async def _execute_query():
+                result = await db.execute(query)
+                items = result.all() if valid_columns else list(result.scalars().all())
+                
+                has_more = limit > 0 and len(items) > limit
+                if has_more:
+                    items = items[:limit]
+                next_cursor = None
+                if has_more:
+                    last = items[-1]
+                    next_cursor = encode_cursor(sort_key, [getattr(last, name) for _, _, name in sort_key])
+                
+                if include_total:
+                    total = (await db.execute(count_query)).scalar() or 0
+                else:
+                    total = await estimate_row_count(db, model_class.__table__.name)
+                
+                if as_dict:
+                    if valid_columns:
+                        items = [{col: getattr(row, col) for col in output_columns or valid_columns} for row in items]
+                    else:
+                        items = self.model_utils.model_instances_to_dicts(items)
+                
+                return {
+                    "items": items,
+                    "next_cursor": next_cursor,
+                    "has_more": has_more,
+                    "total": total,
+                    "total_estimated": not include_total
+                }
+            
+            return await self.execute_with_retry(_execute_query)
+            
+        except SQLAlchemyError as e:
+            self.logger.error(error_message(
+                module_id=COMPONENT_ID,
+                error_type="READ_PAGE_ERROR",
+                details=f"Error reading page of {model_class.__name__}: {str(e)}",
+                location="read_page()"
+            ))
+            return None
+    
+    async def stream(self, db: AsyncSession, model_class: Type[ModelType],
+                     filters: Optional[Dict[str, Any]] = None,
+                     order_by: Optional[List[str]] = None,
+                     columns: Optional[List[str]] = None,
+                     as_dict: bool = False,
+                     chunk_size: int = 1000) -> AsyncIterator[List[Any]]:
+        """
+        Stream matching records in chunks through a server-side cursor.
+        
+        Rows are fetched chunk_size at a time as the caller iterates, so memory
+        stays bounded by one chunk regardless of the result size. With as_dict
+        and no columns, all mapped columns are selected directly instead of
+        building ORM instances first.
+        
+        Args:
+            db: Database session (not usable for other queries until the stream ends)
+            model_class: SQLAlchemy model class
+            filters: Dictionary of field:value filters or operator-based filters
+            order_by: Field(s) to order by (list of strings, "-" prefix for descending)
+            columns: Specific columns to retrieve (None for all)
+            as_dict: Whether to yield dictionaries
+            chunk_size: Records per yielded chunk
+            
+        Yields:
+            Lists of up to chunk_size model instances, rows or dictionaries
+            
+        Raises:
+            SQLAlchemyError: If the query fails
+        """
+        if chunk_size < 1:
+            chunk_size = 1000
+        if as_dict and not columns:
+            # Same keys as ModelUtils.to_dict(), without materializing ORM instances
+            columns = [attr.key for attr in inspect(model_class).mapper.column_attrs]
+        
+        query, valid_columns = self._build_select(model_class, filters, columns, "stream()")
+        query = query.order_by(*order_clauses(self._sort_key(model_class, order_by)))
+        query = query.execution_options(yield_per=chunk_size)
+        
+        async def _open_stream():
+            return await db.stream(query)
+        
+        result = await self.execute_with_retry(_open_stream)
+        try:
+            source = result if valid_columns else result.scalars()
+            async for partition in source.partitions(chunk_size):
+                if valid_columns and as_dict:
+                    yield [{col: getattr(row, col) for col in valid_columns} for row in partition]
+                elif as_dict:
+                    yield self.model_utils.model_instances_to_dicts(partition)
+                else:
+                    yield list(partition)
+        finally:
+            # Release the cursor even if the caller stops iterating early
+            await result.close()
+    
     async def update(self, db: AsyncSession, model_class: Type[ModelType], 
                     id: Any, obj_data: Dict[str, Any]) -> Optional[ModelType]:
         """
@@ -674,6 +877,10 @@ class CRUDOperations:
         """
         Create a record if it doesn't exist, or update it if it does.
         
+        When unique_field has a PRIMARY KEY or UNIQUE constraint, this is a single
+        INSERT ... ON CONFLICT DO UPDATE statement. Otherwise the record is read
+        first and then updated or created.
+        
         Args:
             db: Database session
             model_class: SQLAlchemy model class
@@ -692,8 +899,12 @@ class CRUDOperations:
                     location="create_or_update()"
                 ))
                 return None
+            
+            key_data = {unique_field: obj_data[unique_field]}
+            if self._is_conflict_target(model_class, list(key_data)):
+                return await self._native_upsert(db, model_class, key_data, obj_data)
                 
-            # Check if record exists
+            # No constraint to conflict on: check if record exists
             existing = await self.get_by_field(db, model_class, unique_field, obj_data[unique_field])
             
             if existing:
@@ -732,22 +943,34 @@ class CRUDOperations:
             return None
 
     async def upsert(self, db: AsyncSession, model_class: Type[ModelType], 
-                    filters: Dict[str, Any], obj_data: Dict[str, Any]) -> Optional[ModelType]:
+                    filters: Dict[str, Any], obj_data: Dict[str, Any],
+                    update_fields: Optional[List[str]] = None) -> Optional[ModelType]:
         """
         Update records matching filters or create if none exists (Update or Insert = Upsert).
         This is particularly useful for composite key situations where multiple fields 
         together form a unique constraint.
         
+        When filters are plain field values covering a PRIMARY KEY or UNIQUE
+        constraint, the upsert is a single INSERT ... ON CONFLICT DO UPDATE
+        statement with no read first and no race between concurrent writers.
+        Other filters fall back to reading the first match, then updating or creating.
+        
         Args:
             db: Database session
             model_class: SQLAlchemy model class
             filters: Filter conditions to identify existing records
             obj_data: Data for the new or updated record
+            update_fields: Fields to overwrite on conflict (default: all fields in
+                           obj_data except the filter fields; [] keeps the existing row)
             
         Returns:
             Created or updated object, or None if operation failed
         """
         try:
+            plain_filters = all(not isinstance(value, (dict, list, tuple)) for value in filters.values())
+            if filters and plain_filters and self._is_conflict_target(model_class, list(filters)):
+                return await self._native_upsert(db, model_class, filters, obj_data, update_fields)
+            
             # Check if records exist
             existing_records = await self.read_many(
                 db, 
@@ -784,6 +1007,168 @@ class CRUDOperations:
             await db.rollback()
             return None
 
+    def _is_conflict_target(self, model_class: Type[ModelType], fields: List[str]) -> bool:
+        """
+        Check whether fields exactly match the model's primary key or a UNIQUE constraint or index.
+        
+        ON CONFLICT needs such a constraint; partial unique indexes are not used.
+        """
+        try:
+            target = set(self._column_keys(model_class, fields))
+        except ValueError:
+            return False
+        table = model_class.__table__
+        candidates = [constraint.columns for constraint in table.constraints
+                      if isinstance(constraint, (PrimaryKeyConstraint, UniqueConstraint))]
+        candidates += [index.columns for index in table.indexes
+                       if index.unique and not index.dialect_options["sqlite"].get("where")]
+        return any({column.key for column in columns} == target for columns in candidates)
+    
+    @staticmethod
+    def _upsert_statement(table, row_keys, conflict_keys: List[str],
+                          update_keys: Optional[List[str]] = None):
+        """
+        Build INSERT ... ON CONFLICT (conflict_keys) DO UPDATE for rows with the given keys.
+        
+        Args:
+            table: Table to insert into
+            row_keys: Column keys present in the rows
+            conflict_keys: Column keys of the conflict target
+            update_keys: Column keys to overwrite on conflict (None for every
+                         row key outside the conflict target). Keys missing from
+                         the rows are skipped; if none remain, conflicting rows
+                         are left unchanged (DO NOTHING)
+            
+        Returns:
+            SQLite INSERT statement
+        """
+        statement = sqlite_insert(table)
+        if update_keys is None:
+            update_keys = [key for key in row_keys if key not in conflict_keys]
+        else:
+            update_keys = [key for key in update_keys if key in row_keys]
+        if not update_keys:
+            return statement.on_conflict_do_nothing(index_elements=conflict_keys)
+        
+        set_ = {key: statement.excluded[key] for key in update_keys}
+        # DO UPDATE does not run Python-side onupdate defaults (e.g. updated_at)
+        for column in table.columns:
+            default = column.onupdate
+            if default is None or column.key in set_ or column.key in conflict_keys:
+                continue
+            if default.is_callable:
+                set_[column.key] = default.arg(None)
+            elif default.is_scalar or default.is_clause_element:
+                set_[column.key] = default.arg
+        return statement.on_conflict_do_update(index_elements=conflict_keys, set_=set_)
+    
+    async def _native_upsert(self, db: AsyncSession, model_class: Type[ModelType],
+                             key_data: Dict[str, Any], obj_data: Dict[str, Any],
+                             update_fields: Optional[List[str]] = None) -> Optional[ModelType]:
+        """
+        Upsert one record with INSERT ... ON CONFLICT DO UPDATE ... RETURNING and commit.
+        
+        Args:
+            db: Database session
+            model_class: SQLAlchemy model class
+            key_data: Values of the conflict target fields
+            obj_data: Data for the new or updated record
+            update_fields: Fields to overwrite on conflict (None for all of obj_data)
+            
+        Returns:
+            The inserted or updated object
+        """
+        table = model_class.__table__
+        row = self._column_rows(model_class, [{**obj_data, **key_data}])[0]
+        conflict_keys = self._column_keys(model_class, list(key_data))
+        update_keys = self._column_keys(model_class, update_fields) if update_fields is not None else None
+        
+        statement = self._upsert_statement(table, row.keys(), conflict_keys, update_keys)
+        statement = statement.values(row).returning(*table.columns)
+        query = select(model_class).from_statement(statement).execution_options(populate_existing=True)
+        
+        async def _upsert_and_commit():
+            try:
+                obj = (await db.execute(query)).scalars().first()
+                if obj is None:
+                    # DO NOTHING on conflict returns no row: load the existing one
+                    obj = (await db.execute(select(model_class).filter_by(**key_data))).scalars().first()
+                await db.commit()
+            except OperationalError:
+                await db.rollback()
+                raise
+            if db.sync_session.expire_on_commit:
+                await db.refresh(obj)
+            return obj
+        
+        return await self.execute_with_retry(_upsert_and_commit)
+    
+    async def bulk_upsert(self, db: AsyncSession, model_class: Type[ModelType],
+                          objects_data: List[Dict[str, Any]],
+                          conflict_fields: Optional[List[str]] = None,
+                          update_fields: Optional[List[str]] = None,
+                          chunk_size: Optional[int] = None) -> Optional[Dict[str, Any]]:
+        """
+        Insert or update many records with batched INSERT ... ON CONFLICT DO UPDATE.
+        
+        All batches run in one transaction with a single commit, and no record is
+        read first. Batches stay within the SQLite variable limit.
+        
+        Args:
+            db: Database session (committed on success, rolled back on error)
+            model_class: SQLAlchemy model class
+            objects_data: List of data dictionaries keyed by model attribute
+            conflict_fields: Fields of the PRIMARY KEY or UNIQUE constraint that
+                             identifies existing rows (default: primary key)
+            update_fields: Fields to overwrite on conflict (default: every given
+                           field outside conflict_fields; [] keeps existing rows)
+            chunk_size: Maximum rows per statement
+            
+        Returns:
+            Dict with upserted_count (rows sent), or None on error
+        """
+        try:
+            table = model_class.__table__
+            if conflict_fields:
+                conflict_keys = self._column_keys(model_class, conflict_fields)
+            else:
+                conflict_keys = [column.key for column in table.primary_key.columns]
+            update_keys = self._column_keys(model_class, update_fields) if update_fields is not None else None
+            rows = self._column_rows(model_class, objects_data)
+            
+            async def _upsert_and_commit():
+                try:
+                    for batch in self._row_batches(rows, chunk_size):
+                        statement = self._upsert_statement(table, batch[0].keys(), conflict_keys, update_keys)
+                        await db.execute(statement, batch)
+                    await db.commit()
+                except OperationalError:
+                    # Nothing is committed yet, so a retry starts from a clean transaction
+                    await db.rollback()
+                    raise
+                return {"upserted_count": len(rows)}
+            
+            return await self.execute_with_retry(_upsert_and_commit)
+            
+        except SQLAlchemyError as e:
+            self.logger.error(error_message(
+                module_id=COMPONENT_ID,
+                error_type="BULK_UPSERT_ERROR",
+                details=f"Error in bulk_upsert for {model_class.__name__}: {str(e)}",
+                location="bulk_upsert()"
+            ))
+            await db.rollback()
+            return None
+        except Exception as e:
+            self.logger.error(error_message(
+                module_id=COMPONENT_ID,
+                error_type="BULK_UPSERT_UNEXPECTED_ERROR",
+                details=f"Unexpected error in bulk_upsert for {model_class.__name__}: {str(e)}",
+                location="bulk_upsert()"
+            ))
+            await db.rollback()
+            return None
+    
     async def bulk_create(self, db: AsyncSession, model_class: Type[ModelType], 
                          objects_data: List[Dict[str, Any]]) -> List[ModelType]:
         """
@@ -837,6 +1222,151 @@ class CRUDOperations:
             await db.rollback()
             return []
     
+    @staticmethod
+    def _column_keys(model_class: Type[ModelType], fields: List[str]) -> List[str]:
+        """
+        Map model attribute names to table column keys for Core statements.
+        
+        Raises:
+            ValueError: If a field is not a mapped column
+        """
+        column_keys = {attr.key: attr.columns[0].key for attr in inspect(model_class).mapper.column_attrs}
+        unknown = [field for field in fields if field not in column_keys]
+        if unknown:
+            raise ValueError(f"Unknown columns for {model_class.__name__}: {unknown}")
+        return [column_keys[field] for field in fields]
+    
+    def _column_rows(self, model_class: Type[ModelType],
+                     objects_data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Convert attribute-keyed data dictionaries to table column keys for Core statements.
+        
+        Args:
+            model_class: SQLAlchemy model class
+            objects_data: Data dictionaries keyed by model attribute
+            
+        Returns:
+            Data dictionaries keyed by table column
+            
+        Raises:
+            ValueError: If a dictionary has a key that is not a mapped column
+        """
+        column_keys = {attr.key: attr.columns[0].key for attr in inspect(model_class).mapper.column_attrs}
+        rows = []
+        for obj_data in objects_data:
+            unknown = [key for key in obj_data if key not in column_keys]
+            if unknown:
+                raise ValueError(f"Unknown columns for {model_class.__name__}: {unknown}")
+            rows.append({column_keys[key]: value for key, value in obj_data.items()})
+        return rows
+    
+    @staticmethod
+    def _row_batches(rows: List[Dict[str, Any]], chunk_size: Optional[int] = None) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Split rows into consecutive batches for multi-row statements.
+        
+        Rows in a batch share the same keys, so a statement can bind them all,
+        and a batch never needs more than SQLITE_MAX_VARIABLES parameters. Input
+        order is preserved.
+        
+        Args:
+            rows: Column-keyed data dictionaries
+            chunk_size: Upper bound on rows per batch (None for the variable limit only)
+            
+        Yields:
+            Lists of rows
+        """
+        batch: List[Dict[str, Any]] = []
+        batch_keys = None
+        max_rows = 0
+        for row in rows:
+            keys = row.keys()
+            if batch and (keys != batch_keys or len(batch) >= max_rows):
+                yield batch
+                batch = []
+            if not batch:
+                batch_keys = keys
+                max_rows = max(1, SQLITE_MAX_VARIABLES // max(1, len(keys)))
+                if chunk_size:
+                    max_rows = min(max_rows, chunk_size)
+            batch.append(row)
+        if batch:
+            yield batch
+    
+    async def bulk_insert(self, db: AsyncSession, model_class: Type[ModelType],
+                          objects_data: List[Dict[str, Any]],
+                          return_ids: bool = False,
+                          chunk_size: Optional[int] = None) -> Optional[Dict[str, Any]]:
+        """
+        Insert many records with Core INSERT statements in a single transaction.
+        
+        Unlike bulk_create(), no ORM instances are built and nothing is refreshed
+        after the commit: rows are sent as batched executemany INSERTs, with
+        RETURNING for the primary keys when return_ids is set. Column defaults
+        apply; ORM-level hooks such as validators and relationship cascades don't.
+        
+        Args:
+            db: Database session (committed on success, rolled back on error)
+            model_class: SQLAlchemy model class
+            objects_data: List of data dictionaries keyed by model attribute
+            return_ids: Return the primary keys of the inserted rows
+            chunk_size: Maximum rows per statement (default: as many as the
+                        SQLite variable limit allows)
+            
+        Returns:
+            Dict with inserted_count and ids (primary keys of the inserted rows,
+            tuples for composite keys, None unless return_ids; SQLite does not
+            guarantee RETURNING order, so don't match them to objects_data by
+            position), or None on error
+        """
+        try:
+            rows = self._column_rows(model_class, objects_data)
+            table = model_class.__table__
+            pk_columns = list(table.primary_key.columns)
+            
+            if return_ids and not db.bind.dialect.insert_returning:
+                raise ValueError("return_ids requires INSERT ... RETURNING (SQLite 3.35+)")
+            
+            async def _insert_and_commit():
+                ids = [] if return_ids else None
+                try:
+                    for batch in self._row_batches(rows, chunk_size):
+                        if return_ids:
+                            # sort_by_parameter_order would make SQLAlchemy insert SQLite rows one at a time
+                            statement = insert(table).returning(*pk_columns)
+                            result = await db.execute(statement, batch)
+                            for row in result.all():
+                                ids.append(row[0] if len(pk_columns) == 1 else tuple(row))
+                        else:
+                            await db.execute(insert(table), batch)
+                    await db.commit()
+                except OperationalError:
+                    # Nothing is committed yet, so a retry starts from a clean transaction
+                    await db.rollback()
+                    raise
+                return {"inserted_count": len(rows), "ids": ids}
+            
+            return await self.execute_with_retry(_insert_and_commit)
+            
+        except SQLAlchemyError as e:
+            self.logger.error(error_message(
+                module_id=COMPONENT_ID,
+                error_type="BULK_INSERT_ERROR",
+                details=f"Error in bulk_insert for {model_class.__name__}: {str(e)}",
+                location="bulk_insert()"
+            ))
+            await db.rollback()
+            return None
+        except Exception as e:
+            self.logger.error(error_message(
+                module_id=COMPONENT_ID,
+                error_type="BULK_INSERT_UNEXPECTED_ERROR",
+                details=f"Unexpected error in bulk_insert for {model_class.__name__}: {str(e)}",
+                location="bulk_insert()"
+            ))
+            await db.rollback()
+            return None
+    
     async def bulk_update(self, db: AsyncSession, model_class: Type[ModelType],
                          ids: List[Any], obj_data: Dict[str, Any]) -> int:
         """
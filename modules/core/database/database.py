@@ -14,13 +14,15 @@ from datetime import datetime
 import decimal
 import uuid
 from typing import Optional, List, Dict, Any, Tuple, Union
-from sqlalchemy import create_engine, inspect, text, func
+from sqlalchemy import create_engine, inspect, text, func, select, table, column, literal_column
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.exc import OperationalError, SQLAlchemyError
 
 from modules.core.database.database_infrastructure import get_database_base, get_database_metadata, get_all_database_names
 from .utils import execute_with_retry, ensure_db_directory_exists, redact_connection_url
+from .writer import DatabaseWriter
+from .pagination import InvalidCursorError, decode_cursor, encode_cursor, estimate_row_count, keyset_condition, order_clauses
 
 # Import from core error utilities
 from core.error_utils import error_message
@@ -28,6 +30,9 @@ from core.error_utils import error_message
 # Module ID for error codes
 MODULE_ID = "core.database"
 
+# Result label for rowid, used as the sort tie-breaker for tables without a primary key
+ROWID_KEY = "__rowid__"
+
 class DatabaseOperations:
     """Handles direct database operations for SQLite."""
     
@@ -53,6 +58,11 @@ class DatabaseOperations:
         self.pool_timeout = 30
         self.pool_recycle = 3600
         
+        # Single-writer queue per database (see writer.py)
+        self.writer_enabled = True
+        self.writer_max_batch = 64
+        self.writer_batch_window = 0.0
+        
         # Standard SQLite pragmas for all databases
         self.sqlite_pragmas = [
             "PRAGMA journal_mode=WAL",      # Use Write-Ahead Logging for better concurrency
@@ -596,6 +606,11 @@ class DatabaseOperations:
                 self.logger.info(f"Cleaning up database: {database_name}")
                 db_info = db_data["engine_info"]
                 
+                # Finish queued writes before the engines go away
+                if db_info.get("writer"):
+                    await db_info["writer"].close()
+                    self.logger.info(f"CLOSED writer for database: {database_name}")
+                
                 # Dispose of async engine
                 if "engine" in db_info and db_info["engine"]:
                     await db_info["engine"].dispose()
@@ -645,6 +660,54 @@ class DatabaseOperations:
         
         self.logger.info(f"Force database cleanup complete. Cleaned up {cleanup_count} databases.")
 
+    def get_writer(self, database_name: str) -> DatabaseWriter:
+        """
+        Get the single-writer queue of a database, creating it on first use.
+        
+        Args:
+            database_name: Name of the database
+            
+        Returns:
+            DatabaseWriter for the database
+            
+        Raises:
+            ValueError: If the database is not registered
+        """
+        if database_name not in self.registered_databases:
+            available = list(self.registered_databases.keys())
+            raise ValueError(f"Database '{database_name}' not found. Available databases: {available}")
+        
+        db_info = self.registered_databases[database_name]["engine_info"]
+        writer = db_info.get("writer")
+        if writer is None:
+            db_url = db_info.get("url") or self.get_database_url(database_name)
+            writer = DatabaseWriter(
+                database_name, db_url, self.sqlite_pragmas,
+                max_batch=self.writer_max_batch,
+                batch_window=self.writer_batch_window,
+                connection_timeout=self.connection_timeout
+            )
+            db_info["writer"] = writer
+        return writer
+    
+    def configure_writer(self, enabled: bool, max_batch: int, batch_window: float):
+        """
+        Apply write queue settings to new and already running writers.
+        
+        Args:
+            enabled: Route DatabaseService.write() through the writer queues
+            max_batch: Maximum units of work per transaction
+            batch_window: Seconds to wait for more work before committing a batch
+        """
+        self.writer_enabled = enabled
+        self.writer_max_batch = max_batch
+        self.writer_batch_window = batch_window
+        for db_data in self.registered_databases.values():
+            writer = db_data.get("engine_info", {}).get("writer")
+            if writer is not None:
+                writer.max_batch = max(1, max_batch)
+                writer.batch_window = max(0.0, batch_window)
+    
     def get_database_url(self, database_name: str) -> str:
         """
         Generate database URL for a specific database.
@@ -1170,12 +1233,15 @@ class DatabaseOperations:
                         "name": row[1],  # column name
                         "type": row[2],  # data type
                         "nullable": row[3] == 0,  # notnull is 1 if NOT NULL
-                        "primary_key": row[5] == 1  # pk is 1 for primary key
+                        "primary_key": row[5] > 0  # pk is the 1-based position in the primary key, 0 otherwise
                     }
                     columns.append(col_info)
                     
                     if col_info["primary_key"]:
-                        primary_keys.append(col_info["name"])
+                        primary_keys.append((row[5], col_info["name"]))
+                
+                # Composite primary keys in key order
+                primary_keys = [name for _, name in sorted(primary_keys)]
                 
                 schema_info = {
                     "columns": columns,
@@ -1198,22 +1264,35 @@ class DatabaseOperations:
     async def get_table_data(self, table_name: str, page: int, page_size: int, 
                             sort_by: Optional[str] = None, sort_desc: bool = False,
                             filter_column: Optional[str] = None, filter_value: Optional[str] = None,
-                            database_name: str = "framework") -> Tuple[List[Dict[str, Any]], int]:
+                            database_name: str = "framework", cursor: Optional[str] = None,
+                            exact_total: bool = True) -> Tuple[List[Dict[str, Any]], Optional[int], Dict[str, Any]]:
         """
         Get data from a specific table with pagination, sorting, and filtering.
         
+        Rows are ordered by sort_by, then the primary key (rowid for tables
+        without one). Every page returns a next_cursor; passing it back
+        continues after the page's last row (keyset pagination) instead of
+        skipping (page - 1) * page_size rows, so deep pages stay fast.
+        
         Args:
             table_name: Name of the table
-            page: Page number (1-based)
+            page: Page number (1-based, ignored when cursor is given)
             page_size: Number of records per page
             sort_by: Column to sort by
             sort_desc: Sort in descending order
             filter_column: Column to filter by
             filter_value: Value to filter for
             database_name: Name of the database (defaults to framework)
+            cursor: next_cursor of the previous page
+            exact_total: Run COUNT(*) for the total; otherwise estimate the table's
+                         row count cheaply
         
         Returns:
-            Tuple of (list of records, total count) or ([], 0) on error
+            Tuple of (list of records, total count, page info with next_cursor,
+            has_more and total_estimated) or ([], 0, {}) on error
+            
+        Raises:
+            InvalidCursorError: If the cursor is malformed or from another ordering
         """
         try:
             # Check if database exists
@@ -1224,24 +1303,35 @@ class DatabaseOperations:
                         details=f"Framework database not initialized",
                         module_id=MODULE_ID
                     ))
-                    return [], 0
+                    return [], 0, {}
             elif database_name not in self.registered_databases:
                 self.logger.error(error_message(
                     error_type="DATABASE_NOT_FOUND",
                     details=f"Database {database_name} not found",
                     module_id=MODULE_ID
                 ))
-                return [], 0
+                return [], 0, {}
             
-            # Validate table name
-            tables = await self.get_all_tables(database_name)
-            if table_name not in tables:
+            # Validate table name (get_table_schema returns {} for unknown tables)
+            schema = await self.get_table_schema(table_name, database_name)
+            if not schema:
                 self.logger.error(error_message(
                     error_type="TABLE_NOT_FOUND",
                     details=f"Table {table_name} not found in {database_name}",
                     module_id=MODULE_ID
                 ))
-                return [], 0
+                return [], 0, {}
+            
+            # Validate column names against the table schema
+            column_names = [col["name"] for col in schema["columns"]]
+            for requested in (sort_by, filter_column):
+                if requested and requested not in column_names:
+                    self.logger.error(error_message(
+                        error_type="INVALID_COLUMN",
+                        details=f"Column {requested} not found in {table_name}",
+                        module_id=MODULE_ID
+                    ))
+                    return [], 0, {}
             
             # Validate page parameters
             if page < 1:
@@ -1249,43 +1339,54 @@ class DatabaseOperations:
             if page_size < 1:
                 page_size = 50
             
-            # Get the database engine
-            if database_name == "framework":
-                db_info = self.framework_database
-            else:
-                db_info = self.registered_databases[database_name]["engine_info"]
+            # Sort key: requested column, then the primary key (or rowid) as tie-breaker
+            sort_key = []
+            if sort_by:
+                sort_key.append((column(sort_by), sort_desc, sort_by))
+            primary_keys = schema["primary_keys"]
+            for pk in primary_keys:
+                if pk != sort_by:
+                    sort_key.append((column(pk), False, pk))
+            if not primary_keys:
+                sort_key.append((column("rowid"), False, ROWID_KEY))
+            
+            # Raises InvalidCursorError before touching the database
+            after_values = decode_cursor(sort_key, cursor) if cursor else None
             
             # Use Phase 4 integrity_session pattern for session-level operations
             async with self.app_context.database.integrity_session(database_name, f"get_table_data_{table_name}") as session:
-                # Build base query for data
-                base_query = f"FROM {table_name}"
-                params = {}
+                # Build base query
+                query = select(literal_column("*")).select_from(table(table_name))
+                if not primary_keys:
+                    query = query.add_columns(column("rowid").label(ROWID_KEY))
                 
                 # Add filter condition if provided
                 if filter_column and filter_value is not None:
-                    base_query += f" WHERE {filter_column} LIKE :filter_value"
-                    params["filter_value"] = f"%{filter_value}%"
+                    query = query.where(column(filter_column).like(f"%{filter_value}%"))
                 
-                # Get total count
-                count_query = text(f"SELECT COUNT(*) {base_query}")
-                count_result = await session.execute(count_query, params)
-                total = count_result.scalar() or 0
-                
-                # Build data query with pagination and sorting
-                data_query = f"SELECT * {base_query}"
-                
-                # Add sorting
-                if sort_by:
-                    data_query += f" ORDER BY {sort_by} {'DESC' if sort_desc else 'ASC'}"
+                # Get total count, or a cheap estimate of the table size
+                if exact_total:
+                    count_result = await session.execute(select(func.count()).select_from(query.subquery()))
+                    total = count_result.scalar() or 0
+                else:
+                    total = await estimate_row_count(session, table_name)
                 
-                # Add pagination
-                data_query += " LIMIT :limit OFFSET :offset"
-                params["limit"] = page_size
-                params["offset"] = (page - 1) * page_size
+                # Continue after the cursor row, or fall back to OFFSET for page numbers
+                query = query.order_by(*order_clauses(sort_key))
+                if after_values is not None:
+                    query = query.where(keyset_condition(sort_key, after_values))
+                else:
+                    query = query.offset((page - 1) * page_size)
                 
-                # Execute data query
-                result = await session.execute(text(data_query), params)
+                # Fetch one extra row to know whether another page follows
+                result = await session.execute(query.limit(page_size + 1))
                 rows = result.mappings().all()
+                has_more = len(rows) > page_size
+                rows = rows[:page_size]
+                
+                next_cursor = None
+                if has_more:
+                    next_cursor = encode_cursor(sort_key, [rows[-1][name] for _, _, name in sort_key])
                 
                 # Convert rows to dictionaries with proper JSON handling
                 data = []
@@ -1293,6 +1394,8 @@ class DatabaseOperations:
                     # Process row data
                     processed_row = {}
                     for key, value in row.items():
+                        if key == ROWID_KEY:
+                            continue
                         # Handle special data types
                         if value is None:
                             processed_row[key] = None
@@ -1302,8 +1405,15 @@ class DatabaseOperations:
                             processed_row[key] = value
                     data.append(processed_row)
                 
-                return data, total
+                page_info = {
+                    "next_cursor": next_cursor,
+                    "has_more": has_more,
+                    "total_estimated": not exact_total
+                }
+                return data, total, page_info
                 
+        except InvalidCursorError:
+            raise
         except Exception as e:
             self.logger.error(error_message(
                 error_type="TABLE_DATA_FAILED",
@@ -1312,7 +1422,7 @@ class DatabaseOperations:
             ))
             import traceback
             self.logger.error(traceback.format_exc())
-            return [], 0
+            return [], 0, {}
         
     async def execute_raw_query(self, query_text: str, params: Optional[Dict[str, Any]] = None, database_name: str = "framework") -> Union[List[Dict[str, Any]], int]:
         """
@@ -23,6 +23,11 @@ DEFAULT_SETTINGS = {
     "pool_timeout": 30,
     "pool_recycle": 3600,
     
+    # Write queue settings
+    "writer_enabled": True,
+    "writer_max_batch": 64,
+    "writer_batch_window_ms": 0.0,
+    
     # SQLite settings - Advanced users only
     "sqlite_journal_mode": "WAL",
     "sqlite_synchronous": "NORMAL",
@@ -86,6 +91,22 @@ VALIDATION_SCHEMA = {
         "max": 86400,
         "description": "Seconds after which a connection is recycled"
     },
+    "writer_enabled": {
+        "type": "bool",
+        "description": "Serialize queued writes through one connection per database"
+    },
+    "writer_max_batch": {
+        "type": "int",
+        "min": 1,
+        "max": 10000,
+        "description": "Maximum queued writes per transaction"
+    },
+    "writer_batch_window_ms": {
+        "type": "float",
+        "min": 0.0,
+        "max": 1000.0,
+        "description": "Milliseconds to wait for more writes before committing a batch"
+    },
     "sqlite_journal_mode": {
         "type": "string",
         "enum": ["DELETE", "TRUNCATE", "PERSIST", "MEMORY", "WAL", "OFF"],
@@ -181,6 +202,27 @@ UI_METADATA = {
         "category": "Connection Pool",
         "order": 40
     },
+    "writer_enabled": {
+        "display_name": "Write Queue",
+        "description": "Group-commit queued writes on a dedicated connection per database",
+        "input_type": "checkbox",
+        "category": "Write Queue",
+        "order": 10
+    },
+    "writer_max_batch": {
+        "display_name": "Max Writes per Commit",
+        "description": "Maximum queued writes committed in one transaction",
+        "input_type": "number",
+        "category": "Write Queue",
+        "order": 20
+    },
+    "writer_batch_window_ms": {
+        "display_name": "Batch Window",
+        "description": "Time to wait for more writes before committing (milliseconds)",
+        "input_type": "number",
+        "category": "Write Queue",
+        "order": 30
+    },
     "sqlite_journal_mode": {
         "display_name": "Journal Mode",
         "description": "SQLite journal mode (WAL recommended for concurrency)",
@@ -0,0 +1,184 @@
+"""
+modules/core/database/pagination.py
+Keyset (cursor) pagination helpers
+
+OFFSET pagination makes SQLite step over every skipped row, so deep pages get
+linearly slower. Keyset pagination instead remembers the sort key of the last
+row on a page and asks for rows strictly after it, which an index on the sort
+columns answers directly. The sort key is the requested order columns followed
+by the primary key (or rowid) as a tie-breaker, so every row has a unique,
+stable position.
+
+Continuation tokens are opaque to callers: URL-safe base64 of the last row's
+key values plus a signature of the sort specification, so a token cannot be
+reused with a different ordering.
+"""
+
+import base64
+import datetime
+import decimal
+import hashlib
+import json
+import uuid
+from typing import Any, List, Optional, Sequence, Tuple
+
+from sqlalchemy import and_, false, or_, text
+from sqlalchemy.sql.elements import ColumnElement
+
+# A sort key part: (column expression, descending, column name)
+SortKey = Tuple[ColumnElement, bool, str]
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a continuation token is malformed or belongs to another ordering."""
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, datetime.datetime):
+        return {"$dt": value.isoformat()}
+    if isinstance(value, datetime.date):
+        return {"$d": value.isoformat()}
+    if isinstance(value, decimal.Decimal):
+        return {"$dec": str(value)}
+    if isinstance(value, uuid.UUID):
+        return {"$uuid": str(value)}
+    if isinstance(value, bytes):
+        return {"$b": base64.b64encode(value).decode("ascii")}
+    return value
+
+
+def _decode_value(value: Any) -> Any:
+    if not isinstance(value, dict):
+        return value
+    if "$dt" in value:
+        return datetime.datetime.fromisoformat(value["$dt"])
+    if "$d" in value:
+        return datetime.date.fromisoformat(value["$d"])
+    if "$dec" in value:
+        return decimal.Decimal(value["$dec"])
+    if "$uuid" in value:
+        return uuid.UUID(value["$uuid"])
+    if "$b" in value:
+        return base64.b64decode(value["$b"])
+    raise InvalidCursorError("Unknown value type in cursor")
+
+
+def sort_signature(sort_key: Sequence[SortKey]) -> str:
+    """Short digest identifying a sort specification (column names and directions)."""
+    spec = ",".join(f"{'-' if desc else ''}{name}" for _, desc, name in sort_key)
+    return hashlib.sha1(spec.encode("utf-8")).hexdigest()[:12]
+
+
+def encode_cursor(sort_key: Sequence[SortKey], values: Sequence[Any]) -> str:
+    """
+    Build a continuation token for the row with the given sort key values.
+
+    Args:
+        sort_key: Sort key the page was read with
+        values: The last row's values for each sort key column
+
+    Returns:
+        Opaque URL-safe token
+    """
+    payload = {"k": sort_signature(sort_key), "v": [_encode_value(value) for value in values]}
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(sort_key: Sequence[SortKey], cursor: str) -> List[Any]:
+    """
+    Read the sort key values from a continuation token.
+
+    Args:
+        sort_key: Sort key of the current request
+        cursor: Token returned with the previous page
+
+    Returns:
+        Sort key values of the last row of the previous page
+
+    Raises:
+        InvalidCursorError: If the token is malformed or was issued for another ordering
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload = json.loads(raw)
+        signature, values = payload["k"], payload["v"]
+    except (ValueError, TypeError, KeyError) as e:
+        raise InvalidCursorError(f"Malformed cursor: {e}")
+
+    if signature != sort_signature(sort_key) or len(values) != len(sort_key):
+        raise InvalidCursorError("Cursor was issued for a different ordering")
+    return [_decode_value(value) for value in values]
+
+
+def _after(column: ColumnElement, desc: bool, value: Any) -> ColumnElement:
+    """Rows strictly after value in this column's order (SQLite sorts NULLs first ascending, last descending)."""
+    if value is None:
+        return false() if desc else column.is_not(None)
+    if desc:
+        return or_(column < value, column.is_(None))
+    return column > value
+
+
+def _equal(column: ColumnElement, value: Any) -> ColumnElement:
+    return column.is_(None) if value is None else column == value
+
+
+def keyset_condition(sort_key: Sequence[SortKey], values: Sequence[Any]) -> ColumnElement:
+    """
+    WHERE condition selecting the rows that come after a row in sort key order.
+
+    Expands to (a after va) OR (a = va AND b after vb) OR ..., which handles
+    mixed sort directions and NULL values.
+
+    Args:
+        sort_key: Sort key parts in order
+        values: Sort key values of the last row already returned
+
+    Returns:
+        SQLAlchemy boolean expression
+    """
+    clauses = []
+    for position, (column, desc, _) in enumerate(sort_key):
+        prefix = [_equal(sort_key[i][0], values[i]) for i in range(position)]
+        clauses.append(and_(*prefix, _after(column, desc, values[position])))
+    return or_(*clauses)
+
+
+def order_clauses(sort_key: Sequence[SortKey]) -> List[ColumnElement]:
+    """ORDER BY clauses matching a sort key."""
+    return [column.desc() if desc else column.asc() for column, desc, _ in sort_key]
+
+
+async def estimate_row_count(session, table_name: str) -> Optional[int]:
+    """
+    Cheap row count estimate for a SQLite table, without a full COUNT(*) scan.
+
+    Uses the row count recorded by ANALYZE in sqlite_stat1 when available,
+    otherwise MAX(rowid), which is exact for tables that never had rows
+    deleted and an upper bound otherwise.
+
+    Args:
+        session: Async database session
+        table_name: Table to estimate
+
+    Returns:
+        Estimated row count, or None if it cannot be estimated (e.g. WITHOUT ROWID tables)
+    """
+    try:
+        result = await session.execute(
+            text("SELECT stat FROM sqlite_stat1 WHERE tbl = :table LIMIT 1"),
+            {"table": table_name}
+        )
+        stat = result.scalar()
+        if stat:
+            return int(str(stat).split()[0])
+    except Exception:
+        # sqlite_stat1 only exists after ANALYZE
+        pass
+
+    try:
+        result = await session.execute(text(f'SELECT MAX(rowid) FROM "{table_name}"'))
+        return int(result.scalar() or 0)
+    except Exception:
+        return None
@@ -10,6 +10,7 @@ from typing import Dict, Any, List, Optional, Union, Tuple
 
 # Import database operations
 from .database import DatabaseOperations
+from .pagination import InvalidCursorError
 from .module_settings import get_sqlite_pragmas
 
 # Import from error handler module
@@ -40,6 +41,7 @@ class DatabaseService:
         
         # Initialize state
         self.config = {}
+        self._writer_settings_loaded = False
         
         self.logger.info(f"{MODULE_ID} service created (pre-Phase 2)")
     
@@ -320,22 +322,27 @@ class DatabaseService:
     
     async def get_table_data(self, table_name: str, page: int, page_size: int, 
                            database: str = "framework", sort_by: Optional[str] = None, sort_desc: bool = False,
-                           filter_column: Optional[str] = None, filter_value: Optional[str] = None) -> Result:
+                           filter_column: Optional[str] = None, filter_value: Optional[str] = None,
+                           cursor: Optional[str] = None, exact_total: bool = True) -> Result:
         """
         Get data from a specific table with pagination, sorting, and filtering.
         
         Args:
             table_name: Name of the table
-            page: Page number (1-based)
+            page: Page number (1-based, ignored when cursor is given)
             page_size: Number of records per page
             database: Name of the database (default: "framework")
             sort_by: Column to sort by
             sort_desc: Sort in descending order
             filter_column: Column to filter by
             filter_value: Value to filter for
+            cursor: next_cursor from the previous page, to continue after it
+                    without an OFFSET scan
+            exact_total: Count matching rows exactly; otherwise return a cheap
+                         estimate of the table size as total
         
         Returns:
-            Result object with data and total count, or error information
+            Result object with data, total count and next_cursor, or error information
         """
         
         try:
@@ -352,8 +359,9 @@ class DatabaseService:
                     details={"operation": "get_table_data"})
             
             # Get data from operations for specified database
-            data, total = await self.db_operations.get_table_data(
-                table_name, page, page_size, sort_by, sort_desc, filter_column, filter_value, database_name=database)
+            data, total, page_info = await self.db_operations.get_table_data(
+                table_name, page, page_size, sort_by, sort_desc, filter_column, filter_value,
+                database_name=database, cursor=cursor, exact_total=exact_total)
             
             # Check if data was retrieved
             if data is None:
@@ -368,9 +376,18 @@ class DatabaseService:
                 "total": total,
                 "page": page,
                 "page_size": page_size,
-                "total_pages": (total + page_size - 1) // page_size}
+                "total_pages": (total + page_size - 1) // page_size if total is not None else None,
+                "next_cursor": page_info.get("next_cursor"),
+                "has_more": page_info.get("has_more", False),
+                "total_estimated": page_info.get("total_estimated", False)}
                 
             return Result.success(data=result_data)
+        
+        except InvalidCursorError as e:
+            return Result.error(
+                code="INVALID_CURSOR",
+                message=str(e),
+                details={"table": table_name})
                 
         except Exception as e:
             self.logger.error(error_message(
@@ -508,6 +525,94 @@ class DatabaseService:
             finally:
                 self.logger.debug(f"Closing integrity session for {database_name} (purpose: {purpose})")
     
+    async def write(self, database_name: str, work, purpose: str = "write"):
+        """
+        Run a write through the database's single-writer queue.
+        
+        Writes queued at the same time are committed together in one
+        transaction on a dedicated connection, so concurrent writers never
+        compete for the SQLite lock and never need "database is locked"
+        retries. Each unit of work runs in its own savepoint: if it raises,
+        only its changes are rolled back and only this call fails. Reads
+        should keep using integrity_session().
+        
+        Usage:
+            async def _save(session):
+                session.add(Event(type="click"))
+                await session.commit()  # flushes; the writer commits the group
+                
+            await app_context.database.write("analytics", _save, "record_click")
+            
+            # CRUD operations work unchanged on the writer session
+            await app_context.database.write(
+                "analytics", lambda session: crud_service.bulk_insert(session, Event, rows))
+        
+        Args:
+            database_name: Name of the database
+            work: Async function taking the session; keep it short, as it
+                  holds up every queued write while it runs
+            purpose: Description of the operation for logging/debugging
+            
+        Returns:
+            The value returned by work, after its transaction has committed
+            
+        Raises:
+            ValueError: If database not found
+            Exception: Whatever work raised, or the commit error
+        """
+        await self._load_writer_settings()
+        if not self.db_operations.writer_enabled:
+            async with self.integrity_session(database_name, purpose) as session:
+                result = await work(session)
+                await session.commit()
+                return result
+        
+        self.logger.debug(f"Queueing write for {database_name} (purpose: {purpose})")
+        return await self.db_operations.get_writer(database_name).submit(work, purpose)
+    
+    async def _load_writer_settings(self):
+        """
+        Apply the Write Queue settings on first use.
+        
+        The settings service depends on this module, so it is not available
+        while the database module initializes; the settings are loaded the
+        first time a write runs after it has registered.
+        """
+        if self._writer_settings_loaded:
+            return
+        if not self.app_context or "core.settings.service" not in getattr(self.app_context, "services", {}):
+            return
+        
+        # Set first: loading settings reads the database and must not recurse
+        self._writer_settings_loaded = True
+        from .settings import DatabaseSettings
+        
+        settings_service = self.app_context.get_service("core.settings.service")
+        result = await settings_service.get_typed_settings(MODULE_ID, DatabaseSettings)
+        if not result.success:
+            self.logger.warning(f"Using default write queue settings: {result.message}")
+            return
+        
+        writer_config = result.data.get_writer_config()
+        self.db_operations.configure_writer(
+            writer_config["enabled"], writer_config["max_batch"], writer_config["batch_window"]
+        )
+        self.logger.info(f"Write queue settings applied: {writer_config}")
+    
+    def get_writer_status(self) -> Dict[str, Any]:
+        """
+        Get single-writer queue status for databases whose writer has started.
+        
+        Returns:
+            Dict of database name to writer status (queue depth, batches, writes,
+            failures, largest batch, queue wait of the last batch)
+        """
+        return {
+            database_name: db_data["engine_info"]["writer"].get_status()
+            for database_name, db_data in self.db_operations.registered_databases.items()
+            if db_data.get("engine_info", {}).get("writer")
+        }
+    
     def _get_session_factory_internal(self, database_name: str):
         """
         Internal method to get session factory without deprecation warnings.
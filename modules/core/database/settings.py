@@ -158,6 +158,41 @@ class DatabaseSettings(BaseModel):
         }
     )
     
+    # Write Queue Configuration
+    writer_enabled: bool = Field(
+        default=True,
+        description="Serialize writes submitted via write() through one connection per database",
+        json_schema_extra={
+            "ui_component": "checkbox",
+            "ui_category": "Write Queue",
+            "ui_help": "Queued writes are group-committed on a dedicated connection instead of competing for the SQLite lock"
+        }
+    )
+    
+    writer_max_batch: int = Field(
+        default=64,
+        ge=1,
+        le=10000,
+        description="Maximum queued writes committed in one transaction",
+        json_schema_extra={
+            "ui_component": "number",
+            "ui_category": "Write Queue",
+            "ui_help": "Larger batches mean fewer commits under load; a failing write only rolls back itself"
+        }
+    )
+    
+    writer_batch_window_ms: float = Field(
+        default=0.0,
+        ge=0.0,
+        le=1000.0,
+        description="Milliseconds to wait for more writes before committing a batch",
+        json_schema_extra={
+            "ui_component": "number",
+            "ui_category": "Write Queue",
+            "ui_help": "0 commits whatever queued up during the previous commit; higher values trade latency for fewer commits"
+        }
+    )
+    
     # SQLite-Specific Performance Settings
     sqlite_journal_mode: SQLiteJournalMode = Field(
         default=SQLiteJournalMode.WAL,
@@ -243,6 +278,19 @@ class DatabaseSettings(BaseModel):
             "pool_pre_ping": True,  # Validate connections before use
         }
     
+    def get_writer_config(self) -> dict:
+        """
+        Get single-writer queue configuration.
+        
+        Returns:
+            Dictionary of writer parameters
+        """
+        return {
+            "enabled": self.writer_enabled,
+            "max_batch": self.writer_max_batch,
+            "batch_window": self.writer_batch_window_ms / 1000.0
+        }
+    
     def get_retry_config(self) -> dict:
         """
         Get retry configuration for database operations.
@@ -12,6 +12,7 @@ import asyncio
 from typing import Optional, Any, Dict, Callable, Awaitable
 from sqlalchemy.exc import OperationalError
 from core.error_utils import error_message
+from .writer import in_writer
 
 def redact_connection_url(url):
     """
@@ -127,6 +128,10 @@ async def execute_with_retry(coro, max_retries=5, base_delay=0.1, max_delay=2.0)
     Raises:
         The last encountered exception if all retries fail
     """
+    # Queued writes hold the write lock and must not run twice in a group transaction
+    if in_writer():
+        return await coro
+    
     logger = logging.getLogger("modular.database.utils")
     
     attempts = 0
@@ -0,0 +1,358 @@
+"""
+modules/core/database/writer.py
+Single-writer queue with group commit for SQLite databases
+
+SQLite allows one writer per database at a time. When many pooled
+connections write concurrently, the losers get "database is locked" and
+back off and retry, which shows up as tail latency. A DatabaseWriter gives a
+database one dedicated write connection and a queue instead: callers submit
+units of work, and one task runs them back to back, committing everything
+that queued up meanwhile in a single transaction (group commit). Each unit
+runs in its own SAVEPOINT, so a failing unit is rolled back alone and only
+its caller sees the error. Reads keep going through the connection pool.
+
+The writer connection starts its transactions with BEGIN IMMEDIATE. It takes
+the write lock up front and waits on busy_timeout while another process
+holds it, instead of failing when a read transaction upgrades to a write.
+"""
+
+import asyncio
+import contextvars
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from core.error_utils import error_message
+
+# Module ID for error codes
+MODULE_ID = "core.database"
+
+# A unit of work: receives the writer session, returns the caller's result
+WriteWork = Callable[[AsyncSession], Awaitable[Any]]
+
+# Database name while running inside a writer task
+_writer_database: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar("database_writer", default=None)
+
+
+def in_writer() -> bool:
+    """
+    Check whether the current task is a database writer.
+
+    Retry helpers use this to run operations once: the writer already holds
+    the write lock, and re-running a unit inside a group transaction would
+    apply it twice.
+    """
+    return _writer_database.get() is not None
+
+
+class GroupCommitSession(AsyncSession):
+    """
+    Session handed to queued units of work.
+
+    commit() only flushes, because the writer commits the whole group, and
+    rollback() rolls back the current unit's savepoint. Code written for a
+    normal session, including CRUD operations that commit themselves, runs
+    unchanged.
+    """
+
+    _savepoint = None
+
+    async def commit(self) -> None:
+        if self._savepoint is None:
+            return await super().commit()
+        await self.flush()
+
+    async def rollback(self) -> None:
+        if self._savepoint is None:
+            return await super().rollback()
+        await self._savepoint.rollback()
+        # Later statements of the unit stay isolated from the rest of the group
+        self._savepoint = await self.begin_nested()
+
+
+class _WriteRequest:
+    __slots__ = ("work", "purpose", "future", "enqueued_at")
+
+    def __init__(self, work: WriteWork, purpose: str, future: asyncio.Future):
+        self.work = work
+        self.purpose = purpose
+        self.future = future
+        self.enqueued_at = time.monotonic()
+
+
+class DatabaseWriter:
+    """Serializes writes to one SQLite database through a queue and a dedicated connection."""
+
+    def __init__(self, database_name: str, db_url: str, pragmas: List[str],
+                 max_batch: int = 64, batch_window: float = 0.0, connection_timeout: int = 30):
+        """
+        Initialize the writer. The connection and task start on first use.
+
+        Args:
+            database_name: Name of the database
+            db_url: SQLite URL of the database file
+            pragmas: PRAGMA statements to run on the writer connection
+            max_batch: Maximum units of work per transaction
+            batch_window: Seconds to wait for more work before committing a
+                          batch (0 commits whatever is already queued)
+            connection_timeout: sqlite3 lock wait timeout in seconds
+        """
+        self.database_name = database_name
+        self.db_url = db_url
+        self.pragmas = list(pragmas)
+        self.max_batch = max(1, max_batch)
+        self.batch_window = max(0.0, batch_window)
+        self.connection_timeout = connection_timeout
+        self.logger = logging.getLogger(f"{MODULE_ID}.writer")
+
+        self.engine = None
+        self._session_factory = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        self._batch: List[_WriteRequest] = []  # Requests the writer task has taken off the queue
+        self._closed = False
+
+        # Statistics
+        self.batches = 0
+        self.writes = 0
+        self.failed = 0
+        self.largest_batch = 0
+        self.last_wait = 0.0
+
+    def _create_engine(self):
+        """Create the single-connection engine with BEGIN IMMEDIATE transactions."""
+        async_url = self.db_url.replace('sqlite:///', 'sqlite+aiosqlite:///')
+        engine = create_async_engine(
+            async_url,
+            echo=False,
+            pool_size=1,
+            max_overflow=0,
+            pool_pre_ping=True,
+            connect_args={
+                "check_same_thread": False,
+                "timeout": self.connection_timeout
+            }
+        )
+        pragmas = self.pragmas
+
+        @event.listens_for(engine.sync_engine, "connect")
+        def _on_connect(dbapi_connection, connection_record):
+            # Take transaction control from the driver so BEGIN IMMEDIATE and SAVEPOINT work
+            dbapi_connection.isolation_level = None
+            cursor = dbapi_connection.cursor()
+            for pragma in pragmas:
+                cursor.execute(pragma)
+            cursor.close()
+
+        @event.listens_for(engine.sync_engine, "begin")
+        def _on_begin(conn):
+            conn.exec_driver_sql("BEGIN IMMEDIATE")
+
+        return engine
+
+    def _ensure_started(self):
+        if self._task is not None and not self._task.done():
+            return
+        if self.engine is None:
+            self.engine = self._create_engine()
+            self._session_factory = async_sessionmaker(
+                bind=self.engine,
+                expire_on_commit=False,
+                class_=GroupCommitSession
+            )
+        if self._queue is None:
+            # Kept across restarts so requests queued before a restart are not orphaned
+            self._queue = asyncio.Queue()
+        self._task = asyncio.create_task(self._run(), name=f"database-writer-{self.database_name}")
+
+    async def submit(self, work: WriteWork, purpose: str = "write") -> Any:
+        """
+        Queue a unit of work and wait until its transaction is committed.
+
+        Args:
+            work: Async function taking the writer session; it may call
+                  session.commit(), which only flushes
+            purpose: Description of the operation for logging
+
+        Returns:
+            The value returned by work, once committed
+
+        Raises:
+            RuntimeError: If the writer is closed, or work submits another write
+                          to the same writer (use the session it was given)
+            Exception: Whatever work raised, or the commit error
+        """
+        if self._closed:
+            raise RuntimeError(f"Writer for database '{self.database_name}' is closed")
+        if self._task is not None and asyncio.current_task() is self._task:
+            raise RuntimeError(f"Nested write to '{self.database_name}' from inside a queued write ({purpose})")
+
+        self._ensure_started()
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait(_WriteRequest(work, purpose, future))
+        return await future
+
+    async def _next_batch(self, first: _WriteRequest) -> List[Optional[_WriteRequest]]:
+        """Collect queued requests after first, up to max_batch (None marks close)."""
+        batch = [first]
+        deadline = time.monotonic() + self.batch_window
+        while len(batch) < self.max_batch:
+            try:
+                if self._queue.empty() and self.batch_window > 0:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    request = await asyncio.wait_for(self._queue.get(), timeout=remaining)
+                else:
+                    request = self._queue.get_nowait()
+            except (asyncio.QueueEmpty, asyncio.TimeoutError):
+                break
+            batch.append(request)
+            if request is None:
+                break
+        return batch
+
+    async def _run(self):
+        """Writer task: run queued work in batches, one transaction per batch."""
+        _writer_database.set(self.database_name)
+        try:
+            while True:
+                request = await self._queue.get()
+                if request is None:
+                    break
+                self._batch = [request]
+                batch = await self._next_batch(request)
+                stop = batch[-1] is None
+                self._batch = [item for item in batch if item is not None]
+                await self._commit_batch(self._batch)
+                self._batch = []
+                if stop:
+                    break
+        finally:
+            # However the task ends, no caller may be left waiting on it
+            error = RuntimeError(f"Writer for database '{self.database_name}' stopped before the write was committed")
+            for request in self._batch:
+                self._fail(request, error)
+            self._batch = []
+            while not self._queue.empty():
+                request = self._queue.get_nowait()
+                if request is not None:
+                    self._fail(request, error)
+
+    async def _commit_batch(self, batch: List[_WriteRequest]):
+        # Skip callers that gave up while queued
+        batch = [request for request in batch if not request.future.done()]
+        if not batch:
+            return
+
+        now = time.monotonic()
+        self.last_wait = max(now - request.enqueued_at for request in batch)
+        completed = []
+        try:
+            async with self._session_factory() as session:
+                for request in batch:
+                    session._savepoint = await session.begin_nested()
+                    try:
+                        result = await request.work(session)
+                        if session._savepoint.is_active:
+                            await session._savepoint.commit()
+                        completed.append((request, result))
+                    except BaseException as e:
+                        # Also needed after a failed flush, which deactivates the savepoint
+                        await session._savepoint.rollback()
+                        self.failed += 1
+                        self._fail(request, e)
+                        if self._must_propagate(e):
+                            raise
+                    finally:
+                        session._savepoint = None
+
+                await session.commit()
+        except Exception as e:
+            self.logger.error(error_message(
+                module_id=MODULE_ID,
+                error_type="WRITER_COMMIT_FAILED",
+                details=f"Group commit of {len(batch)} writes to {self.database_name} failed: {str(e)}",
+                location="DatabaseWriter._commit_batch()"
+            ))
+            self.failed += len(completed)
+            for request in batch:
+                self._fail(request, e)
+            return
+
+        self.batches += 1
+        self.writes += len(completed)
+        self.largest_batch = max(self.largest_batch, len(batch))
+        for request, result in completed:
+            if not request.future.done():
+                request.future.set_result(result)
+
+    @staticmethod
+    def _must_propagate(error: BaseException) -> bool:
+        """Check whether a unit's error must stop the writer rather than fail only that unit.
+
+        A CancelledError raised inside a unit fails just that unit, unless the
+        writer task itself is being cancelled. Interpreter exits always propagate.
+        """
+        if isinstance(error, asyncio.CancelledError):
+            task = asyncio.current_task()
+            return task is not None and task.cancelling() > 0
+        return isinstance(error, (KeyboardInterrupt, SystemExit))
+
+    @staticmethod
+    def _fail(request: _WriteRequest, error: BaseException):
+        if request.future.done():
+            return
+        if not isinstance(error, Exception):
+            # A CancelledError would look like the caller's own cancellation
+            interrupted = RuntimeError(f"Write ({request.purpose}) was interrupted: {error!r}")
+            interrupted.__cause__ = error
+            error = interrupted
+        request.future.set_exception(error)
+
+    def get_status(self) -> Dict[str, Any]:
+        """
+        Get writer status.
+
+        Returns:
+            Dict with running flag, queue depth, batch and write counters,
+            largest batch and queue wait of the last batch
+        """
+        return {
+            "database": self.database_name,
+            "running": self._task is not None and not self._task.done(),
+            "queued": self._queue.qsize() if self._queue else 0,
+            "batches": self.batches,
+            "writes": self.writes,
+            "failed": self.failed,
+            "largest_batch": self.largest_batch,
+            "last_wait_ms": round(self.last_wait * 1000, 2)
+        }
+
+    async def close(self, timeout: float = 10.0):
+        """
+        Finish queued writes, stop the writer task and dispose the connection.
+
+        Args:
+            timeout: Seconds to wait for queued writes before cancelling
+        """
+        self._closed = True
+        if self._task is not None and not self._task.done():
+            self._queue.put_nowait(None)
+            try:
+                await asyncio.wait_for(self._task, timeout=timeout)
+            except (asyncio.TimeoutError, asyncio.CancelledError):
+                self.logger.warning(f"Writer for {self.database_name} did not drain within {timeout}s")
+
+        # Anything still queued will never run
+        while self._queue is not None and not self._queue.empty():
+            request = self._queue.get_nowait()
+            if request is not None:
+                self._fail(request, RuntimeError(f"Writer for database '{self.database_name}' closed"))
+
+        if self.engine is not None:
+            await self.engine.dispose()
+            self.engine = None
@@ -9,6 +9,7 @@ Updated: August 9, 2025 - Migrated to decorator pattern
 Original: Generated by Module Scaffolder V2
 """
 
+import json
 import logging
 from typing import Dict, List, Any, Union, Optional
 
@@ -115,6 +116,31 @@ from .settings import ModelManagerSettings
         ],
         tags=["status", "workers", "monitoring"]
     ),
+    ServiceMethod(
+        name="get_metrics",
+        description="Get queue wait, inference and cache metrics in Prometheus text format",
+        params=[],
+        returns=ServiceReturn("Result", "Result with Prometheus exposition text"),
+        examples=[
+            ServiceExample("get_metrics()", "Result.success(data='# HELP model_manager_queue_wait_seconds ...')"),
+        ],
+        tags=["status", "workers", "monitoring"]
+    ),
+    ServiceMethod(
+        name="validate_precision",
+        description="Compare a reduced-precision embedding variant with fp32 on sample texts",
+        params=[
+            ServiceParam("model_name", str, required=True, description="Base embedding model name"),
+            ServiceParam("precision", str, required=True, description="int8, fp16 or bf16"),
+            ServiceParam("sample_texts", List[str], required=True, description="Representative texts"),
+            ServiceParam("device", str, required=False, description="Device for both models (default: cpu)")
+        ],
+        returns=ServiceReturn("Result", "Result with mean/min cosine similarity and max drift"),
+        examples=[
+            ServiceExample("validate_precision('BAAI/bge-small-en-v1.5', 'int8', texts)", "Result.success(data={'mean_cosine': 0.998, 'min_cosine': 0.991, 'max_drift': 0.009})"),
+        ],
+        tags=["models", "precision", "validation"]
+    ),
     ServiceMethod(
         name="release_model",
         description="Release a loaded model to free memory",
@@ -282,15 +308,17 @@ class ModelManagerModule(DataIntegrityModule):
 # FASTAPI ROUTES
 
 from fastapi import APIRouter, HTTPException, Depends, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse, PlainTextResponse
 
 from .api_schemas import (
     ReleaseModelRequest,
+    TextGenerationStreamRequest,
     ModelStatusResponse,
     ServiceStatusResponse,
     ModelReleaseResponse,
     ErrorResponse
 )
+from .workers.metrics import CONTENT_TYPE as METRICS_CONTENT_TYPE
 
 # Create router for this module
 router = APIRouter(tags=["model-manager"])
@@ -497,6 +525,86 @@ async def get_worker_status(service = Depends(get_model_service())):
             ).model_dump()
         )
 
+@router.get("/metrics", response_class=PlainTextResponse)
+async def get_metrics(service = Depends(get_model_service())):
+    """
+    Get inference metrics in Prometheus text format.
+
+    Includes per-model and per-worker histograms of queue wait, inference
+    time, texts per call and texts per second, plus worker counters, queue
+    depth and embedding cache hit ratio.
+
+    Args:
+        service: Model manager service dependency
+
+    Returns:
+        PlainTextResponse in Prometheus exposition format
+    """
+    result = await service.get_metrics()
+
+    if not result.success:
+        raise HTTPException(
+            status_code=500,
+            detail=ErrorResponse(
+                code=result.code or "METRICS_ERROR",
+                message=result.message or "Failed to collect metrics"
+            ).model_dump()
+        )
+
+    return PlainTextResponse(result.data, media_type=METRICS_CONTENT_TYPE)
+
+@router.post("/generate/stream")
+async def stream_text_generation(
+    request: TextGenerationStreamRequest,
+    service = Depends(get_model_service())
+):
+    """
+    Stream generated text as Server-Sent Events while the model produces it.
+
+    Emits "token" events with {"type": "token", "text": ...} as text is decoded,
+    then a single "done" event with the full generated text (or an "error" event).
+
+    Args:
+        request: Prompt, model and generation options
+        service: Model manager service dependency
+
+    Returns:
+        StreamingResponse with media type text/event-stream
+    """
+    params = {"max_length": request.max_length}
+    if request.generation_profile:
+        params["generation_profile"] = request.generation_profile
+
+    result = await service.task(
+        task_data=request.prompt,
+        task_type="text_generation",
+        model_name=request.model_name,
+        device=request.device,
+        priority=request.priority,
+        stream=True,
+        **params
+    )
+
+    if not result.success:
+        raise HTTPException(
+            status_code=400,
+            detail=ErrorResponse(
+                code=result.code or "STREAM_FAILED",
+                message=result.message or "Failed to start streaming text generation"
+            ).model_dump()
+        )
+
+    async def event_source():
+        async for event in result.data["stream"]:
+            yield f"event: {event['type']}\ndata: {json.dumps(event)}\n\n"
+
+    return StreamingResponse(
+        event_source(),
+        media_type="text/event-stream",
+        # Disable proxy buffering so tokens reach the client immediately
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
 
 # MODULE CONSTANTS
 
@@ -16,6 +16,15 @@ class ReleaseModelRequest(BaseModel):
     """Request schema for releasing model reference."""
     model_id: str = Field(..., description="Model ID to release")
 
+class TextGenerationStreamRequest(BaseModel):
+    """Request schema for streaming text generation."""
+    prompt: str = Field(..., description="Prompt text")
+    model_name: str = Field(..., description="HuggingFace model name (e.g., google-t5/t5-small)")
+    device: str = Field(default="gpu", description="Device specification: gpu or cpu")
+    max_length: int = Field(default=128, ge=1, le=4096, description="Maximum generated length in tokens")
+    generation_profile: Optional[str] = Field(None, description="Generation profile (default from settings)")
+    priority: int = Field(default=5, ge=0, le=9, description="Queue priority (0 = most urgent)")
+
 # Response Schemas
 
 class ModelInfo(BaseModel):
@@ -4,11 +4,16 @@ Caching system components for model results.
 
 Exports:
 - EmbeddingCache: Embedding result caching with TTL and memory management
+- EvictionPolicy, LRUEvictionPolicy, LFUEvictionPolicy: O(1) cache eviction policies
 """
 
 # Import extracted components
 from .embedding_cache import EmbeddingCache
+from .eviction import EvictionPolicy, LRUEvictionPolicy, LFUEvictionPolicy
 
 __all__ = [
     'EmbeddingCache',
+    'EvictionPolicy',
+    'LRUEvictionPolicy',
+    'LFUEvictionPolicy',
 ]
\ No newline at end of file
@@ -0,0 +1,225 @@
+"""
+modules/core/model_manager/cache/disk_tier.py
+Memory-mapped on-disk tier for the embedding cache.
+
+Each model gets three files in the cache directory:
+- <name>.json: static metadata (model_id, dimension, dtype, capacity)
+- <name>.vectors: np.memmap of shape (capacity, dimension)
+- <name>.keys: np.memmap of (digest, written_at) records, one per vector slot
+
+The key index is rebuilt from the .keys file on startup, so cached vectors
+survive restarts. Slots are reused ring-style once a model reaches capacity.
+"""
+
+import hashlib
+import json
+import logging
+import re
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+# Module identity for logging
+MODULE_ID = "core.model_manager.cache"
+
+# One record per vector slot; an all-zero digest marks an empty slot
+KEY_RECORD_DTYPE = np.dtype([("digest", "V16"), ("written_at", "<f8")])
+EMPTY_DIGEST = bytes(16)
+
+
+class _ModelDiskStore:
+    """Memory-mapped vectors and key records for a single model."""
+
+    def __init__(self, base_path: Path, model_id: str, dimension: int, dtype: str, capacity: int, create: bool):
+        self.model_id = model_id
+        self.dimension = dimension
+        self.dtype = np.dtype(dtype)
+        self.capacity = capacity
+
+        mode = "w+" if create else "r+"
+        self.vectors = np.memmap(
+            base_path.with_suffix(".vectors"), dtype=self.dtype, mode=mode, shape=(capacity, dimension)
+        )
+        self.keys = np.memmap(
+            base_path.with_suffix(".keys"), dtype=KEY_RECORD_DTYPE, mode=mode, shape=(capacity,)
+        )
+
+        # Rebuild the in-memory index from persisted key records
+        self.index: Dict[bytes, int] = {}
+        for slot in np.flatnonzero(self.keys["written_at"] > 0):
+            self.index[bytes(self.keys[slot]["digest"])] = int(slot)
+
+        # Continue the ring after the most recently written slot
+        if self.index:
+            self.next_slot = (int(np.argmax(self.keys["written_at"])) + 1) % capacity
+        else:
+            self.next_slot = 0
+
+    def get(self, digest: bytes, max_age: float) -> Optional[np.ndarray]:
+        slot = self.index.get(digest)
+        if slot is None:
+            return None
+        if max_age and (time.time() - float(self.keys[slot]["written_at"])) > max_age:
+            return None
+        return np.array(self.vectors[slot], dtype=np.float32)
+
+    def put(self, digest: bytes, vector: np.ndarray, written_at: float):
+        slot = self.index.get(digest)
+        if slot is None:
+            slot = self.next_slot
+            self.next_slot = (slot + 1) % self.capacity
+
+            # Slot reuse: drop whichever key previously lived here
+            previous = bytes(self.keys[slot]["digest"])
+            if previous != EMPTY_DIGEST:
+                self.index.pop(previous, None)
+            self.index[digest] = slot
+
+        self.vectors[slot] = vector
+        self.keys[slot] = (digest, written_at)
+
+    def flush(self):
+        self.vectors.flush()
+        self.keys.flush()
+
+
+class DiskEmbeddingStore:
+    """Persistent second tier for cached embeddings, one memmap per model."""
+
+    def __init__(self, directory: Path, dtype: str, capacity: int, ttl_seconds: int):
+        """Initialize the disk tier.
+
+        Args:
+            directory: Directory holding the memory-mapped files
+            dtype: Storage dtype ("float32" or "float16")
+            capacity: Maximum vectors stored per model
+            ttl_seconds: Maximum entry age (0 = never expire)
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.dtype = dtype
+        self.capacity = capacity
+        self.ttl_seconds = ttl_seconds
+        self.logger = logging.getLogger(f"{MODULE_ID}.disk_tier")
+
+        self._stores: Dict[str, _ModelDiskStore] = {}
+        # Models with no files on disk yet (avoids a stat per cache miss)
+        self._missing = set()
+
+        self.logger.info(f"Embedding disk tier at {self.directory} (capacity per model: {capacity})")
+
+    def get(self, cache_key: str, model_id: str) -> Optional[np.ndarray]:
+        """Read a vector from disk.
+
+        Args:
+            cache_key: EmbeddingCache key (hex digest)
+            model_id: Model identifier
+
+        Returns:
+            float32 copy of the vector, or None if absent or expired
+        """
+        store = self._get_store(model_id)
+        if store is None:
+            return None
+        return store.get(bytes.fromhex(cache_key), self.ttl_seconds)
+
+    def put(self, cache_key: str, model_id: str, vector: np.ndarray):
+        """Write a vector to disk.
+
+        Args:
+            cache_key: EmbeddingCache key (hex digest)
+            model_id: Model identifier
+            vector: 1D embedding vector
+        """
+        store = self._get_store(model_id, dimension=vector.shape[-1])
+        if store is None:
+            return
+        if store.dimension != vector.shape[-1]:
+            self.logger.warning(
+                f"Not persisting embedding for {model_id}: dimension {vector.shape[-1]} "
+                f"does not match stored dimension {store.dimension}"
+            )
+            return
+        store.put(bytes.fromhex(cache_key), vector, time.time())
+
+    def flush(self):
+        """Flush all memory-mapped files to disk."""
+        for store in self._stores.values():
+            store.flush()
+
+    def close(self):
+        """Flush and release all memory-mapped files."""
+        self.flush()
+        self._stores.clear()
+        self._missing.clear()
+
+    def get_status(self) -> Dict[str, Any]:
+        """Get disk tier status.
+
+        Returns:
+            Status dictionary with per-model entry counts
+        """
+        models = {model_id: len(store.index) for model_id, store in self._stores.items()}
+        return {
+            "directory": str(self.directory),
+            "capacity_per_model": self.capacity,
+            "entries": sum(models.values()),
+            "models": models
+        }
+
+    def _get_store(self, model_id: str, dimension: Optional[int] = None) -> Optional[_ModelDiskStore]:
+        """Open an existing store for model_id, or create one when dimension is known.
+
+        Args:
+            model_id: Model identifier
+            dimension: Embedding dimension (required to create a new store)
+
+        Returns:
+            Model store, or None if it does not exist yet and cannot be created
+        """
+        store = self._stores.get(model_id)
+        if store is not None:
+            return store
+        if dimension is None and model_id in self._missing:
+            return None
+
+        base_path = self.directory / self._file_stem(model_id)
+        meta_path = base_path.with_suffix(".json")
+
+        try:
+            if meta_path.exists():
+                meta = json.loads(meta_path.read_text())
+                store = _ModelDiskStore(
+                    base_path, model_id, meta["dimension"], meta["dtype"], meta["capacity"], create=False
+                )
+                self.logger.info(f"Opened disk cache for {model_id} ({len(store.index)} entries)")
+            elif dimension is not None:
+                store = _ModelDiskStore(
+                    base_path, model_id, dimension, self.dtype, self.capacity, create=True
+                )
+                meta_path.write_text(json.dumps({
+                    "model_id": model_id,
+                    "dimension": dimension,
+                    "dtype": self.dtype,
+                    "capacity": self.capacity
+                }))
+                self.logger.info(f"Created disk cache for {model_id} (dimension: {dimension})")
+            else:
+                self._missing.add(model_id)
+                return None
+        except Exception as e:
+            self.logger.warning(f"Disk cache unavailable for {model_id}: {e}")
+            return None
+
+        self._missing.discard(model_id)
+        self._stores[model_id] = store
+        return store
+
+    @staticmethod
+    def _file_stem(model_id: str) -> str:
+        """Build a filesystem-safe, collision-free file stem for a model id."""
+        safe_name = re.sub(r"[^A-Za-z0-9_-]+", "_", model_id).strip("_")[:64]
+        suffix = hashlib.md5(model_id.encode("utf-8")).hexdigest()[:8]
+        return f"{safe_name}-{suffix}"
@@ -8,16 +8,27 @@ Extracted from services.py as part of module refactoring.
 import logging
 import time
 import hashlib
-from typing import Dict, Any, List, Union
+from collections import OrderedDict
+from typing import Dict, Any, List, Tuple, Union
+import numpy as np
 from core.error_utils import Result
 from ..settings import ModelManagerSettings
+from .eviction import create_eviction_policy
+from .storage import EmbeddingSlab
+from .disk_tier import DiskEmbeddingStore
 
 # Module identity for logging
 MODULE_ID = "core.model_manager.cache"
 
 
 class EmbeddingCache:
-    """Embedding cache with TTL and memory management."""
+    """Embedding cache with TTL, LRU/LFU eviction and a byte budget.
+
+    Vectors are stored in per-model NumPy slabs (float32 or float16) and
+    returned as float32 arrays; conversion to lists happens at the API edge.
+    With persist_to_disk enabled, a memory-mapped disk tier backs the memory
+    tier and disk hits are promoted back into memory.
+    """
 
     def __init__(self, settings: ModelManagerSettings):
         """Initialize embedding cache.
@@ -27,69 +38,131 @@ class EmbeddingCache:
         """
         self.settings = settings
         self.logger = logging.getLogger(f"{MODULE_ID}.embedding_cache")
-        
-        # Cache storage
-        self._embedding_cache: Dict[str, Any] = {}
-        self._cache_timestamps: Dict[str, float] = {}
-        
-        self.logger.info("Embedding cache initialized")
-    
+
+        # Cache storage: cache_key -> (model_id, slot) in that model's slab
+        self._embedding_cache: Dict[str, Tuple[str, int]] = {}
+        self._slabs: Dict[str, EmbeddingSlab] = {}
+        # Insertion-ordered so expired entries are always at the front
+        self._cache_timestamps: "OrderedDict[str, float]" = OrderedDict()
+        self._total_bytes = 0
+
+        # Eviction policy (O(1) victim selection)
+        self._eviction_policy = create_eviction_policy(self.settings.embedding_cache.eviction_policy)
+
+        # Optional persistent tier
+        self._disk_tier = self._create_disk_tier() if self.settings.embedding_cache.persist_to_disk else None
+
+        # Counters exposed via get_status()
+        self._hits = 0
+        self._disk_hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+        self.logger.info(
+            f"Embedding cache initialized (policy: {self._eviction_policy.name}, "
+            f"max entries: {self.settings.embedding_cache.max_cache_size}, "
+            f"max bytes: {self.settings.embedding_cache.max_bytes or 'unlimited'})"
+        )
+
     async def get_embeddings(self, texts: Union[str, List[str]], model_id: str) -> Result:
         """Check if embeddings are cached.
 
+        Only succeeds when every text is cached. Use lookup_embeddings() to get
+        partial hits as arrays.
+
+        Args:
+            texts: Text(s) to check for cached embeddings
+            model_id: Model ID for cache key generation
+
+        Returns:
+            Result with cached embeddings (lists of floats) or cache miss error
+        """
+        lookup_result = await self.lookup_embeddings(texts, model_id)
+        if not lookup_result.success:
+            return lookup_result
+
+        hits = lookup_result.data["hits"]
+        if lookup_result.data["miss_indices"]:
+            if hits:
+                return Result.error(code="PARTIAL_CACHE_HIT", message="Partial cache hit")
+            return Result.error(code="CACHE_MISS", message="Not in cache")
+
+        # All texts found in cache
+        return Result.success(data={
+            "embeddings": [hits[i].tolist() for i in range(len(hits))],
+            "model_id": model_id,
+            "cached": True,
+            "cache_hits": len(hits)
+        })
+
+    async def lookup_embeddings(self, texts: Union[str, List[str]], model_id: str) -> Result:
+        """Look up cached embeddings per text, separating hits from misses.
+
         Args:
             texts: Text(s) to check for cached embeddings
             model_id: Model ID for cache key generation
 
         Returns:
-            Result with cached embeddings or cache miss error
+            Result with data:
+            {
+                "hits": {index: np.ndarray},  # float32 vectors by input position
+                "miss_indices": [index, ...],  # Ascending input positions
+                "total": int
+            }
         """
         try:
             if not self.settings.embedding_cache.enabled:
                 return Result.error(code="CACHE_DISABLED", message="Cache is disabled")
-            
+
             # Convert single string to list for uniform processing
             text_list = [texts] if isinstance(texts, str) else texts
-            
-            cached_embeddings = []
-            cache_hits = 0
-            
-            for text in text_list:
+
+            hits: Dict[int, Any] = {}
+            miss_indices: List[int] = []
+
+            for index, text in enumerate(text_list):
                 cache_key = self._get_cache_key(text, model_id)
+                if cache_key in self._embedding_cache and self._is_cache_valid(cache_key):
+                    hits[index] = self._read_entry(cache_key)
+                    self._eviction_policy.record_access(cache_key)
+                    continue
+
                 if cache_key in self._embedding_cache:
-                    # Check if cache entry is still valid
-                    if self._is_cache_valid(cache_key):
-                        cached_embeddings.append(self._embedding_cache[cache_key])
-                        cache_hits += 1
-                    else:
-                        # Cache expired
-                        del self._embedding_cache[cache_key]
-                        del self._cache_timestamps[cache_key]
-                        return Result.error(code="CACHE_MISS", message="Cache expired")
-                else:
-                    return Result.error(code="CACHE_MISS", message="Not in cache")
-            
-            # All texts found in cache
-            if len(cached_embeddings) == len(text_list):
-                return Result.success(data={
-                    "embeddings": cached_embeddings,
-                    "model_id": model_id,
-                    "cached": True,
-                    "cache_hits": cache_hits
-                })
-            
-            return Result.error(code="PARTIAL_CACHE_HIT", message="Partial cache hit")
-            
+                    # Cache expired
+                    self._remove_entry(cache_key)
+                    self._expirations += 1
+
+                if self._disk_tier:
+                    vector = self._disk_tier.get(cache_key, model_id)
+                    if vector is not None:
+                        hits[index] = vector
+                        self._disk_hits += 1
+                        # Promote to the memory tier
+                        self._store_entry(cache_key, model_id, vector, time.time())
+                        continue
+
+                miss_indices.append(index)
+
+            self._hits += len(hits)
+            self._misses += len(miss_indices)
+
+            return Result.success(data={
+                "hits": hits,
+                "miss_indices": miss_indices,
+                "total": len(text_list)
+            })
+
         except Exception as e:
             self.logger.error(f"Cache lookup error: {e}")
             return Result.error(code="CACHE_ERROR", message="Cache lookup failed")
-    
-    async def cache_embeddings(self, texts: Union[str, List[str]], embeddings: Union[List[float], List[List[float]]], model_id: str):
+
+    async def cache_embeddings(self, texts: Union[str, List[str]], embeddings: Union[np.ndarray, List[float], List[List[float]]], model_id: str):
         """Cache embeddings for future use.
 
         Args:
             texts: Text(s) that were embedded
-            embeddings: Corresponding embedding results
+            embeddings: Corresponding embedding results (array or lists, 1D for a single text)
             model_id: Model ID for cache key generation
         """
         try:
@@ -97,39 +170,47 @@ class EmbeddingCache:
                 return
 
             current_time = time.time()
-            max_cache_size = self.settings.embedding_cache.max_cache_size
-            
-            # Clean old cache entries if needed
-            if len(self._embedding_cache) >= max_cache_size:
-                await self._cleanup_cache()
-            
-            # Convert to lists for uniform processing
+
+            # Drop expired entries first so they are not counted against the limits
+            self._purge_expired(current_time)
+
+            # Convert to a 2D array for uniform processing
             text_list = [texts] if isinstance(texts, str) else texts
-            embedding_list = [embeddings] if isinstance(embeddings[0] if embeddings else None, (int, float)) else embeddings
-            
-            for text, embedding in zip(text_list, embedding_list):
+            vectors = np.asarray(embeddings, dtype=np.float32)
+            if vectors.size == 0:
+                return
+            if vectors.ndim == 1:
+                vectors = vectors.reshape(1, -1)
+
+            slab = self._get_slab(model_id, vectors.shape[1])
+            if slab is None:
+                return
+
+            for text, vector in zip(text_list, vectors):
                 cache_key = self._get_cache_key(text, model_id)
-                self._embedding_cache[cache_key] = embedding
-                self._cache_timestamps[cache_key] = current_time
-            
+                if not self._store_entry(cache_key, model_id, vector, current_time, slab):
+                    break
+                if self._disk_tier:
+                    self._disk_tier.put(cache_key, model_id, vector)
+
             self.logger.debug(f"Cached embeddings for {len(text_list)} texts with model {model_id}")
-            
+
         except Exception as e:
             self.logger.warning(f"Failed to cache embeddings: {e}")
-    
+
     def _get_cache_key(self, text: str, model_id: str) -> str:
         """Generate cache key for text and model.
-        
+
         Args:
             text: Input text
             model_id: Model identifier
-            
+
         Returns:
             Cache key string
         """
         combined = f"{model_id}:{text}"
         return hashlib.md5(combined.encode('utf-8')).hexdigest()
-    
+
     def _is_cache_valid(self, cache_key: str) -> bool:
         """Check if cache entry is still valid.
 
@@ -144,44 +225,188 @@ class EmbeddingCache:
 
         ttl = self.settings.embedding_cache.ttl_seconds
         return (time.time() - self._cache_timestamps[cache_key]) < ttl
-    
-    async def _cleanup_cache(self):
-        """Clean up old cache entries."""
+
+    def _get_slab(self, model_id: str, dimension: int):
+        """Get (or create) the storage slab for a model.
+
+        Args:
+            model_id: Model identifier
+            dimension: Embedding dimension of the vectors being stored
+
+        Returns:
+            EmbeddingSlab, or None if the dimension does not match the existing slab
+        """
+        slab = self._slabs.get(model_id)
+        if slab is None:
+            slab = EmbeddingSlab(
+                dimension=dimension,
+                dtype=self.settings.embedding_cache.storage_dtype,
+                max_capacity=self.settings.embedding_cache.max_cache_size
+            )
+            self._slabs[model_id] = slab
+        elif slab.dimension != dimension:
+            self.logger.warning(
+                f"Not caching embeddings for {model_id}: dimension {dimension} "
+                f"does not match cached dimension {slab.dimension}"
+            )
+            return None
+        return slab
+
+    def _store_entry(self, cache_key: str, model_id: str, vector: np.ndarray, current_time: float, slab: EmbeddingSlab = None) -> bool:
+        """Store one vector in the memory tier, evicting as needed.
+
+        Args:
+            cache_key: Cache key for the entry
+            model_id: Model identifier
+            vector: 1D float32 embedding
+            current_time: Insert time used for TTL
+            slab: Slab for model_id (looked up if not given)
+
+        Returns:
+            True if the vector was stored
+        """
+        slab = slab or self._get_slab(model_id, vector.shape[-1])
+        if slab is None:
+            return False
+
+        if cache_key in self._embedding_cache:
+            self._remove_entry(cache_key)
+
+        # Make room first so the slab always has a free slot
+        self._enforce_limits(incoming_bytes=slab.entry_bytes)
+        slot = slab.store(vector)
+        if slot is None:
+            return False
+
+        self._embedding_cache[cache_key] = (model_id, slot)
+        self._cache_timestamps[cache_key] = current_time
+        self._total_bytes += slab.entry_bytes
+        self._eviction_policy.record_insert(cache_key)
+        return True
+
+    def _create_disk_tier(self):
+        """Create the on-disk tier, or return None if it cannot be opened."""
         try:
-            current_time = time.time()
-            ttl = self.settings.embedding_cache.ttl_seconds
-
-            # Find expired entries
-            expired_keys = [
-                key for key, timestamp in self._cache_timestamps.items()
-                if (current_time - timestamp) > ttl
-            ]
-            
-            # Remove expired entries
-            for key in expired_keys:
-                del self._embedding_cache[key]
-                del self._cache_timestamps[key]
-            
-            self.logger.debug(f"Cleaned up {len(expired_keys)} expired cache entries")
-            
+            cache_config = self.settings.embedding_cache
+            if cache_config.disk_cache_dir:
+                directory = cache_config.disk_cache_dir
+            else:
+                from core.paths import get_module_data_path
+                directory = get_module_data_path("model_manager", "embedding_cache")
+            return DiskEmbeddingStore(
+                directory=directory,
+                dtype=cache_config.storage_dtype,
+                capacity=cache_config.max_disk_entries,
+                ttl_seconds=cache_config.disk_ttl_seconds
+            )
         except Exception as e:
-            self.logger.warning(f"Cache cleanup failed: {e}")
-    
+            self.logger.warning(f"Embedding disk tier disabled: {e}")
+            return None
+
+    def _read_entry(self, cache_key: str) -> np.ndarray:
+        """Read a cached vector as a float32 array.
+
+        Args:
+            cache_key: Key of an existing entry
+        """
+        model_id, slot = self._embedding_cache[cache_key]
+        return self._slabs[model_id].read(slot)
+
+    def _remove_entry(self, cache_key: str):
+        """Remove a single entry from storage and all bookkeeping.
+
+        Args:
+            cache_key: Key to remove
+        """
+        entry = self._embedding_cache.pop(cache_key, None)
+        self._cache_timestamps.pop(cache_key, None)
+        self._eviction_policy.remove(cache_key)
+        if entry is None:
+            return
+
+        model_id, slot = entry
+        slab = self._slabs[model_id]
+        slab.free(slot)
+        self._total_bytes -= slab.entry_bytes
+
+    def _purge_expired(self, current_time: float):
+        """Remove expired entries from the front of the timestamp order.
+
+        Amortized O(1) per insert: stops at the first entry that is still valid.
+
+        Args:
+            current_time: Reference time for TTL checks
+        """
+        ttl = self.settings.embedding_cache.ttl_seconds
+        while self._cache_timestamps:
+            cache_key, timestamp = next(iter(self._cache_timestamps.items()))
+            if (current_time - timestamp) < ttl:
+                break
+            self._remove_entry(cache_key)
+            self._expirations += 1
+
+    def _enforce_limits(self, incoming_bytes: int = 0):
+        """Evict entries until a new entry fits the entry count and byte budget.
+
+        Args:
+            incoming_bytes: Size of the entry about to be inserted
+        """
+        max_cache_size = self.settings.embedding_cache.max_cache_size
+        max_bytes = self.settings.embedding_cache.max_bytes
+
+        while self._embedding_cache and (
+            len(self._embedding_cache) + 1 > max_cache_size
+            or (max_bytes and self._total_bytes + incoming_bytes > max_bytes)
+        ):
+            victim = self._eviction_policy.select_victim()
+            if victim is None:
+                break
+            self._remove_entry(victim)
+            self._evictions += 1
+
     def get_status(self) -> Dict[str, Any]:
         """Get cache status information.
 
         Returns:
             Cache status dictionary
         """
+        lookups = self._hits + self._misses
         return {
             "enabled": self.settings.embedding_cache.enabled,
             "cache_size": len(self._embedding_cache),
             "max_cache_size": self.settings.embedding_cache.max_cache_size,
-            "ttl_seconds": self.settings.embedding_cache.ttl_seconds
+            "cache_bytes": self._total_bytes,
+            "allocated_bytes": sum(slab.allocated_bytes for slab in self._slabs.values()),
+            "max_bytes": self.settings.embedding_cache.max_bytes,
+            "storage_dtype": self.settings.embedding_cache.storage_dtype,
+            "eviction_policy": self._eviction_policy.name,
+            "ttl_seconds": self.settings.embedding_cache.ttl_seconds,
+            "hits": self._hits,
+            "disk_hits": self._disk_hits,
+            "misses": self._misses,
+            "hit_ratio": (self._hits / lookups) if lookups else 0.0,
+            "evictions": self._evictions,
+            "expirations": self._expirations,
+            "persist_to_disk": self._disk_tier is not None,
+            "disk_tier": self._disk_tier.get_status() if self._disk_tier else None
         }
-    
+
+    def flush(self):
+        """Flush the disk tier (if enabled) so entries survive a restart."""
+        if self._disk_tier:
+            self._disk_tier.flush()
+
+    def close(self):
+        """Flush and release the disk tier. The memory tier is left intact."""
+        if self._disk_tier:
+            self._disk_tier.close()
+            self.logger.info("Embedding disk tier flushed and closed")
+
     def clear_cache(self):
-        """Clear all cached entries."""
+        """Clear all in-memory entries. Persisted disk entries are kept."""
         self._embedding_cache.clear()
+        self._slabs.clear()
         self._cache_timestamps.clear()
-        self.logger.info("Embedding cache cleared")
\ No newline at end of file
+        self._total_bytes = 0
+        self._eviction_policy.clear()
+        self.logger.info("Embedding cache cleared")
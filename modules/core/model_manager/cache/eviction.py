@@ -0,0 +1,156 @@
+"""
+modules/core/model_manager/cache/eviction.py
+Constant-time eviction policies for the embedding cache.
+
+Policies only track keys; the cache owns the stored values and decides
+when to evict (entry count or byte budget exceeded).
+"""
+
+from abc import ABC, abstractmethod
+from collections import OrderedDict, defaultdict
+from typing import Dict, Hashable, Optional
+
+
+class EvictionPolicy(ABC):
+    """Abstract base class for cache eviction policies."""
+
+    name = "base"
+
+    @abstractmethod
+    def record_insert(self, key: Hashable):
+        """Track a newly inserted (or replaced) key."""
+        pass
+
+    @abstractmethod
+    def record_access(self, key: Hashable):
+        """Track a cache hit for key."""
+        pass
+
+    @abstractmethod
+    def remove(self, key: Hashable):
+        """Stop tracking key (evicted, expired or cleared)."""
+        pass
+
+    @abstractmethod
+    def select_victim(self) -> Optional[Hashable]:
+        """Return the key that should be evicted next, or None if empty."""
+        pass
+
+    @abstractmethod
+    def clear(self):
+        """Forget all tracked keys."""
+        pass
+
+
+class LRUEvictionPolicy(EvictionPolicy):
+    """Least-recently-used eviction backed by an OrderedDict."""
+
+    name = "lru"
+
+    def __init__(self):
+        self._order: "OrderedDict[Hashable, None]" = OrderedDict()
+
+    def record_insert(self, key: Hashable):
+        self._order[key] = None
+        self._order.move_to_end(key)
+
+    def record_access(self, key: Hashable):
+        if key in self._order:
+            self._order.move_to_end(key)
+
+    def remove(self, key: Hashable):
+        self._order.pop(key, None)
+
+    def select_victim(self) -> Optional[Hashable]:
+        return next(iter(self._order), None)
+
+    def clear(self):
+        self._order.clear()
+
+
+class LFUEvictionPolicy(EvictionPolicy):
+    """Least-frequently-used eviction with O(1) frequency buckets.
+
+    Ties within the lowest frequency are broken by recency (oldest first).
+    """
+
+    name = "lfu"
+
+    def __init__(self):
+        self._frequencies: Dict[Hashable, int] = {}
+        self._buckets: Dict[int, "OrderedDict[Hashable, None]"] = defaultdict(OrderedDict)
+        self._min_frequency = 0
+
+    def record_insert(self, key: Hashable):
+        if key in self._frequencies:
+            self.record_access(key)
+            return
+        self._frequencies[key] = 1
+        self._buckets[1][key] = None
+        self._min_frequency = 1
+
+    def record_access(self, key: Hashable):
+        frequency = self._frequencies.get(key)
+        if frequency is None:
+            return
+
+        bucket = self._buckets[frequency]
+        del bucket[key]
+        if not bucket:
+            del self._buckets[frequency]
+            if self._min_frequency == frequency:
+                self._min_frequency = frequency + 1
+
+        self._frequencies[key] = frequency + 1
+        self._buckets[frequency + 1][key] = None
+
+    def remove(self, key: Hashable):
+        frequency = self._frequencies.pop(key, None)
+        if frequency is None:
+            return
+
+        bucket = self._buckets[frequency]
+        del bucket[key]
+        if not bucket:
+            del self._buckets[frequency]
+            if self._min_frequency == frequency:
+                # Only hit on explicit removal; bounded by distinct frequencies
+                self._min_frequency = min(self._buckets) if self._buckets else 0
+
+    def select_victim(self) -> Optional[Hashable]:
+        if not self._frequencies:
+            return None
+        bucket = self._buckets.get(self._min_frequency)
+        if not bucket:
+            self._min_frequency = min(self._buckets)
+            bucket = self._buckets[self._min_frequency]
+        return next(iter(bucket))
+
+    def clear(self):
+        self._frequencies.clear()
+        self._buckets.clear()
+        self._min_frequency = 0
+
+
+EVICTION_POLICIES = {
+    LRUEvictionPolicy.name: LRUEvictionPolicy,
+    LFUEvictionPolicy.name: LFUEvictionPolicy,
+}
+
+
+def create_eviction_policy(name: str) -> EvictionPolicy:
+    """Create an eviction policy by name.
+
+    Args:
+        name: Policy name ("lru" or "lfu")
+
+    Returns:
+        New EvictionPolicy instance
+
+    Raises:
+        ValueError: If the policy name is unknown
+    """
+    policy_class = EVICTION_POLICIES.get(name)
+    if policy_class is None:
+        raise ValueError(f"Unknown eviction policy '{name}'. Must be one of: {list(EVICTION_POLICIES)}")
+    return policy_class()
@@ -0,0 +1,99 @@
+"""
+modules/core/model_manager/cache/storage.py
+Contiguous NumPy storage for cached embedding vectors.
+
+Vectors for one model are kept in a single preallocated 2D array (a slab)
+and addressed by slot index, instead of one Python list of floats per entry.
+"""
+
+import numpy as np
+from typing import List, Optional
+
+
+class EmbeddingSlab:
+    """Preallocated 2D array of embedding vectors addressed by slot.
+
+    The slab grows geometrically up to max_capacity. Freed slots are reused
+    before the slab grows again.
+    """
+
+    def __init__(self, dimension: int, dtype: str, max_capacity: int, initial_capacity: int = 1024):
+        """Initialize an empty slab.
+
+        Args:
+            dimension: Embedding dimension (row width)
+            dtype: Storage dtype ("float32" or "float16")
+            max_capacity: Upper bound on rows (cache entry limit)
+            initial_capacity: Rows allocated up front
+        """
+        self.dimension = dimension
+        self.dtype = np.dtype(dtype)
+        self.max_capacity = max_capacity
+        capacity = max(1, min(initial_capacity, max_capacity))
+        self._vectors = np.empty((capacity, dimension), dtype=self.dtype)
+        self._free_slots: List[int] = []
+        self._next_slot = 0
+        self.count = 0
+
+    @property
+    def capacity(self) -> int:
+        """Number of rows currently allocated."""
+        return self._vectors.shape[0]
+
+    @property
+    def entry_bytes(self) -> int:
+        """Bytes used by a single stored vector."""
+        return self.dimension * self.dtype.itemsize
+
+    @property
+    def allocated_bytes(self) -> int:
+        """Bytes allocated for the whole slab."""
+        return self._vectors.nbytes
+
+    def store(self, vector: np.ndarray) -> Optional[int]:
+        """Copy a vector into a free slot.
+
+        Args:
+            vector: 1D array with self.dimension elements
+
+        Returns:
+            Slot index, or None if the slab is at max_capacity
+        """
+        if self._free_slots:
+            slot = self._free_slots.pop()
+        elif self._next_slot < self.capacity or self._grow():
+            slot = self._next_slot
+            self._next_slot += 1
+        else:
+            return None
+
+        self._vectors[slot] = vector
+        self.count += 1
+        return slot
+
+    def read(self, slot: int) -> np.ndarray:
+        """Return a float32 copy of the vector in slot.
+
+        A copy is returned so callers are unaffected if the slot is later reused.
+        """
+        return np.array(self._vectors[slot], dtype=np.float32)
+
+    def free(self, slot: int):
+        """Release a slot for reuse."""
+        self._free_slots.append(slot)
+        self.count -= 1
+
+    def _grow(self) -> bool:
+        """Double the allocated rows, bounded by max_capacity.
+
+        Returns:
+            True if the slab grew
+        """
+        current = self.capacity
+        if current >= self.max_capacity:
+            return False
+        new_capacity = min(current * 2, self.max_capacity)
+        vectors = np.empty((new_capacity, self.dimension), dtype=self.dtype)
+        vectors[:current] = self._vectors
+        self._vectors = vectors
+        return True
@@ -7,12 +7,16 @@ Exports:
 - EmbeddingLoader: SentenceTransformer and embedding model loading
 - TextGenerationLoader: T5, BERT, and text generation model loading
 - LoaderFactory: Model loader selection and instantiation
+- ModelSnapshotStore: Local safetensors snapshots for fast model reloads
+- precision_variant, cosine_drift: Reduced-precision embedding variants
 """
 
 # Import extracted components
 from .base import BaseLoader
 from .embedding import EmbeddingLoader
 from .text_generation import TextGenerationLoader
+from .snapshot import ModelSnapshotStore
+from .precision import PRECISIONS, precision_variant, cosine_drift
 from .factory import LoaderFactory
 
 __all__ = [
@@ -20,4 +24,8 @@ __all__ = [
     'EmbeddingLoader',
     'TextGenerationLoader',
     'LoaderFactory',
+    'ModelSnapshotStore',
+    'PRECISIONS',
+    'precision_variant',
+    'cosine_drift',
 ]
\ No newline at end of file
@@ -5,12 +5,17 @@ Abstract base classes and common patterns for model loading.
 Extracted from services.py as part of module refactoring.
 """
 
+import asyncio
 import logging
 from abc import ABC, abstractmethod
-from typing import Dict, Any
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, TYPE_CHECKING
 from core.error_utils import Result
 from ..settings import ModelManagerSettings
 
+if TYPE_CHECKING:
+    from .snapshot import ModelSnapshotStore
+
 # Module identity for logging
 MODULE_ID = "core.model_manager.loaders"
 
@@ -18,13 +23,15 @@ MODULE_ID = "core.model_manager.loaders"
 class BaseLoader(ABC):
     """Abstract base class for model loaders."""
 
-    def __init__(self, settings: ModelManagerSettings):
+    def __init__(self, settings: ModelManagerSettings, snapshots: Optional["ModelSnapshotStore"] = None):
         """Initialize base loader.
 
         Args:
             settings: Typed ModelManagerSettings instance
+            snapshots: Optional local snapshot store for fast reloads
         """
         self.settings = settings
+        self.snapshots = snapshots
         self.logger = logging.getLogger(f"{MODULE_ID}.{self.__class__.__name__.lower()}")
     
     @abstractmethod
@@ -118,6 +125,24 @@ class BaseLoader(ABC):
             except (ImportError, RuntimeError) as e:
                 raise RuntimeError(f"CUDA setup failed for {device}: {e}")
     
+    def _find_snapshot(self, model_name: str) -> Optional[Path]:
+        """Get a saved snapshot of the model's current revision, if snapshots are enabled."""
+        if self.snapshots is None:
+            return None
+        return self.snapshots.find(model_name, self.get_model_type())
+
+    def _save_snapshot(self, model_name: str, writer: Callable[[Path], Any]):
+        """Save a snapshot of a freshly loaded model in the background.
+
+        Args:
+            model_name: HuggingFace repo id the model was loaded from
+            writer: Saves the model into the directory it is given
+        """
+        if self.snapshots is None or not self.snapshots.enabled:
+            return
+        loop = asyncio.get_event_loop()
+        loop.run_in_executor(None, self.snapshots.save, model_name, self.get_model_type(), writer)
+
     def _get_model_config(self, model_id: str, key: str, default=None):
         """Get model-specific configuration value.
 
@@ -8,6 +8,7 @@ Extracted from services.py as part of module refactoring.
 import logging
 from typing import Dict, Any
 from .base import BaseLoader
+from .precision import PRECISIONS, apply_precision, split_precision_variant
 from core.error_utils import Result
 
 # Module identity for logging
@@ -17,13 +18,14 @@ MODULE_ID = "core.model_manager.loaders"
 class EmbeddingLoader(BaseLoader):
     """Loader for SentenceTransformer embedding models."""
     
-    def __init__(self, config: Dict[str, Any]):
+    def __init__(self, config: Dict[str, Any], snapshots=None):
         """Initialize embedding loader.
         
         Args:
             config: Configuration dictionary
+            snapshots: Optional ModelSnapshotStore for fast reloads
         """
-        super().__init__(config)
+        super().__init__(config, snapshots)
         self.logger = logging.getLogger(f"{MODULE_ID}.embedding")
     
     def supports_model(self, model_id: str) -> bool:
@@ -51,7 +53,8 @@ class EmbeddingLoader(BaseLoader):
         """Load a SentenceTransformer embedding model.
         
         Args:
-            model_id: Identifier for the embedding model to load
+            model_id: Identifier for the embedding model to load, optionally with
+                      an "@<precision>" suffix (e.g. "BAAI/bge-small-en-v1.5@int8")
             device: Target device (e.g., 'cuda:0', 'cpu')
             
         Returns:
@@ -65,12 +68,15 @@ class EmbeddingLoader(BaseLoader):
                     message=f"Invalid device format: {device}"
                 )
 
+            # Precision variants load the base model, then convert it
+            base_model_id, precision = split_precision_variant(model_id)
+
             # Note: Removed CPU refusal check - models can explicitly request CPU now
             # This is part of device-agnostic architecture
 
             # Get model path from configuration - try local_path first, fallback to name
-            model_path = self._get_model_config(model_id, "local_path")
-            model_name = self._get_model_config(model_id, "name")
+            model_path = self._get_model_config(base_model_id, "local_path")
+            model_name = self._get_model_config(base_model_id, "name")
 
             # Use local_path if available, otherwise use name (HuggingFace path)
             # With new simplified API, model_id IS the HuggingFace model name if no config exists
@@ -80,22 +86,38 @@ class EmbeddingLoader(BaseLoader):
                 model_path_or_name = model_name
             else:
                 # New simplified API: model_id is the HuggingFace model name directly
-                model_path_or_name = model_id
-                self.logger.info(f"Using model_id as HuggingFace model name: {model_id}")
+                model_path_or_name = base_model_id
+                self.logger.info(f"Using model_id as HuggingFace model name: {base_model_id}")
 
             # Set up CUDA device if needed
             if device.startswith("cuda"):
                 self._setup_cuda_device(device)
 
-            self.logger.info(f"Loading SentenceTransformer model {model_path_or_name} on {device}")
-
-            # Load SentenceTransformer model (uses default HuggingFace cache)
             from sentence_transformers import SentenceTransformer
 
-            model = SentenceTransformer(
-                model_path_or_name,
-                device=device
-            )
+            # Prefer a local snapshot (memory-mapped safetensors, configs already resolved)
+            snapshot_path = self._find_snapshot(model_path_or_name)
+            if snapshot_path:
+                self.logger.info(f"Loading SentenceTransformer model {model_path_or_name} on {device} from snapshot {snapshot_path}")
+                model = SentenceTransformer(str(snapshot_path), device=device)
+            else:
+                self.logger.info(f"Loading SentenceTransformer model {model_path_or_name} on {device}")
+
+                # Load SentenceTransformer model (uses default HuggingFace cache)
+                model = SentenceTransformer(
+                    model_path_or_name,
+                    device=device
+                )
+                if precision == "fp32":
+                    # Snapshots hold the full-precision weights; variants convert after loading
+                    self._save_snapshot(
+                        model_path_or_name,
+                        lambda path: model.save(str(path), safe_serialization=True)
+                    )
+
+            if precision != "fp32":
+                self.logger.info(f"Converting {model_path_or_name} to {precision}")
+                model = apply_precision(model, precision, device)
 
             # Get model dimension from the model's architecture
             try:
@@ -119,7 +141,9 @@ class EmbeddingLoader(BaseLoader):
                 "dimension": dimension,
                 "device": device,
                 "loader_type": self.__class__.__name__,
-                "model_path": model_path
+                "model_path": model_path,
+                "precision": precision,
+                "snapshot_path": str(snapshot_path) if snapshot_path else None
             })
             
         except ImportError as e:
@@ -149,6 +173,9 @@ class EmbeddingLoader(BaseLoader):
             Result with download status and cache location
         """
         try:
+            # Precision variants share the base model's files
+            model_id, _ = split_precision_variant(model_id)
+
             # Get model path from configuration - try local_path first, fallback to name
             model_path = self._get_model_config(model_id, "local_path")
             model_name = self._get_model_config(model_id, "name")
@@ -245,6 +272,7 @@ class EmbeddingLoader(BaseLoader):
         info = super().get_loader_info()
         info.update({
             "supported_formats": ["SentenceTransformer"],
+            "precisions": list(PRECISIONS),
             "output_format": "embeddings",
             "requires_tokenizer": False,
         })
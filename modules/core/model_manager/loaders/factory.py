@@ -10,6 +10,7 @@ from typing import Dict, Any, List, Optional
 from .base import BaseLoader
 from .embedding import EmbeddingLoader
 from .text_generation import TextGenerationLoader
+from .snapshot import ModelSnapshotStore
 from core.error_utils import Result
 from ..settings import ModelManagerSettings
 
@@ -29,10 +30,13 @@ class LoaderFactory:
         self.settings = settings
         self.logger = logging.getLogger(f"{MODULE_ID}.factory")
 
+        # Local snapshots shared by all loaders (inactive unless settings.snapshots.enabled)
+        self.snapshots = ModelSnapshotStore(settings)
+
         # Initialize all available loaders
         self._loaders: List[BaseLoader] = [
-            EmbeddingLoader(settings),
-            TextGenerationLoader(settings),
+            EmbeddingLoader(settings, self.snapshots),
+            TextGenerationLoader(settings, self.snapshots),
         ]
 
         self.logger.info(f"Loader factory initialized with {len(self._loaders)} loaders")
@@ -182,5 +186,6 @@ class LoaderFactory:
             "total_loaders": len(self._loaders),
             "loader_types": [loader.get_model_type() for loader in self._loaders],
             "loader_classes": [loader.__class__.__name__ for loader in self._loaders],
-            "supported_models": self.get_supported_models()
+            "supported_models": self.get_supported_models(),
+            "snapshots": self.snapshots.get_status()
         }
\ No newline at end of file
@@ -0,0 +1,128 @@
+"""
+modules/core/model_manager/loaders/precision.py
+Reduced-precision embedding model variants.
+
+A precision variant is addressed as "<model name>@<precision>", for example
+"BAAI/bge-small-en-v1.5@int8". The service uses that name as the model key,
+so a variant gets its own worker group, queue, memory measurement and
+embedding cache entries. The loader splits the name again, loads the base
+model (from its snapshot if there is one) and converts it:
+
+- int8: dynamic quantization of Linear layers (CPU only)
+- fp16: half precision (GPU only)
+- bf16: bfloat16 (CPU, or GPUs that support it)
+"""
+
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+
+PRECISIONS = ("fp32", "fp16", "bf16", "int8")
+VARIANT_SEPARATOR = "@"
+
+
+def precision_variant(model_name: str, precision: Optional[str]) -> str:
+    """Get the model key for a precision variant.
+
+    Args:
+        model_name: Base model name
+        precision: One of PRECISIONS (None or "fp32" = the base model)
+
+    Returns:
+        model_name for full precision, otherwise "<model_name>@<precision>"
+    """
+    if precision is None or precision == "fp32":
+        return model_name
+    return f"{model_name}{VARIANT_SEPARATOR}{precision}"
+
+
+def split_precision_variant(model_id: str) -> Tuple[str, str]:
+    """Split a model key into base model name and precision.
+
+    Args:
+        model_id: Model key, possibly with an "@<precision>" suffix
+
+    Returns:
+        (base model name, precision) - precision is "fp32" without a suffix
+    """
+    base, separator, suffix = model_id.rpartition(VARIANT_SEPARATOR)
+    if separator and suffix in PRECISIONS:
+        return base, suffix
+    return model_id, "fp32"
+
+
+def precision_error(precision: str, device: str) -> Optional[str]:
+    """Check whether a precision can be used on a device.
+
+    Args:
+        precision: Requested precision
+        device: "gpu", "cpu" or a specific device such as "cuda:0"
+
+    Returns:
+        Reason the combination is unsupported, or None if it is allowed
+    """
+    if precision not in PRECISIONS:
+        return f"Unknown precision '{precision}'. Must be one of: {list(PRECISIONS)}"
+    on_cpu = device == "cpu"
+    if precision == "int8" and not on_cpu:
+        return "int8 dynamic quantization is only available on CPU"
+    if precision == "fp16" and on_cpu:
+        return "fp16 is only available on GPU (use bf16 on CPU)"
+    return None
+
+
+def apply_precision(model: Any, precision: str, device: str) -> Any:
+    """Convert a loaded full-precision model to the requested precision.
+
+    Args:
+        model: Loaded torch module (SentenceTransformer)
+        precision: One of PRECISIONS
+        device: Device the model is on
+
+    Returns:
+        Converted model (quantization returns a new module)
+
+    Raises:
+        ValueError: If the precision is not supported on the device
+    """
+    if precision == "fp32":
+        return model
+
+    error = precision_error(precision, device)
+    if error:
+        raise ValueError(error)
+
+    import torch
+
+    if precision == "int8":
+        return torch.ao.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+    if precision == "fp16":
+        return model.half()
+    if device.startswith("cuda") and not torch.cuda.is_bf16_supported():
+        raise ValueError(f"bf16 is not supported on {device}")
+    return model.to(torch.bfloat16)
+
+
+def cosine_drift(reference: np.ndarray, candidate: np.ndarray) -> Dict[str, Any]:
+    """Compare embeddings of the same texts from two precisions.
+
+    Args:
+        reference: fp32 embeddings, one row per text
+        candidate: Reduced-precision embeddings of the same texts
+
+    Returns:
+        Dict with texts, mean_cosine, min_cosine and max_drift (1 - min_cosine)
+    """
+    reference = np.atleast_2d(np.asarray(reference, dtype=np.float32))
+    candidate = np.atleast_2d(np.asarray(candidate, dtype=np.float32))
+    if reference.shape != candidate.shape:
+        raise ValueError(f"Embedding shapes differ: {reference.shape} vs {candidate.shape}")
+
+    norms = np.linalg.norm(reference, axis=1) * np.linalg.norm(candidate, axis=1)
+    cosines = np.einsum("ij,ij->i", reference, candidate) / np.maximum(norms, 1e-12)
+    return {
+        "texts": int(len(cosines)),
+        "mean_cosine": float(cosines.mean()),
+        "min_cosine": float(cosines.min()),
+        "max_drift": float(1.0 - cosines.min())
+    }
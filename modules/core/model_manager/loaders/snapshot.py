@@ -0,0 +1,200 @@
+"""
+modules/core/model_manager/loaders/snapshot.py
+Local model snapshots for fast reloads.
+
+Loading from a HuggingFace model name resolves the repo against the hub
+cache, parses its configs and converts weights on every load. After the
+first load of a model, loaders can save it once as a self-contained local
+directory: safetensors weights (memory-mapped on load) plus the already
+resolved config and tokenizer files. Snapshots are keyed by model name and
+hub revision, so a new upstream revision gets a new snapshot, and later
+loads, such as worker re-creation after auto-release, read from the
+snapshot instead.
+
+Layout: <directory>/<model name with "/" as "--">--<revision>/ containing
+the saved model files and snapshot.json, which is written last and marks
+the snapshot as complete.
+"""
+
+import json
+import logging
+import os
+import shutil
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+from ..settings import ModelManagerSettings
+
+# Module identity for logging
+MODULE_ID = "core.model_manager.loaders"
+
+METADATA_FILE = "snapshot.json"
+SNAPSHOT_FORMAT = "safetensors"
+
+
+def resolve_revision(model_name: str) -> Optional[str]:
+    """Get the hub commit hash of a cached model without network access.
+
+    Args:
+        model_name: HuggingFace repo id
+
+    Returns:
+        Commit hash, or None for local paths and models not in the hub cache
+    """
+    if Path(model_name).exists():
+        return None
+    try:
+        from huggingface_hub import snapshot_download
+        return Path(snapshot_download(repo_id=model_name, local_files_only=True)).name
+    except Exception:
+        return None
+
+
+class ModelSnapshotStore:
+    """Directory of saved model snapshots keyed by model name and revision."""
+
+    def __init__(self, settings: ModelManagerSettings):
+        """Initialize snapshot store.
+
+        Args:
+            settings: Typed ModelManagerSettings instance (uses settings.snapshots)
+        """
+        self.config = settings.snapshots
+        self.logger = logging.getLogger(f"{MODULE_ID}.snapshot")
+        self._directory: Optional[Path] = None
+        self._saving: set = set()
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.config.enabled
+
+    @property
+    def directory(self) -> Path:
+        if self._directory is None:
+            if self.config.directory:
+                self._directory = Path(self.config.directory)
+            else:
+                from core.paths import get_module_data_path
+                self._directory = Path(get_module_data_path("model_manager", "snapshots"))
+        return self._directory
+
+    @staticmethod
+    def _snapshot_name(model_name: str, revision: str) -> str:
+        return f"{model_name.replace('/', '--')}--{revision}"
+
+    def find(self, model_name: str, model_type: str) -> Optional[Path]:
+        """Find a complete snapshot of the model's current revision.
+
+        Args:
+            model_name: HuggingFace repo id
+            model_type: Loader model type ("embedding" or "text_generation")
+
+        Returns:
+            Snapshot directory, or None if there is no usable snapshot
+        """
+        if not self.enabled:
+            return None
+        revision = resolve_revision(model_name)
+        if revision is None:
+            return None
+
+        path = self.directory / self._snapshot_name(model_name, revision)
+        try:
+            metadata = json.loads((path / METADATA_FILE).read_text())
+        except (OSError, ValueError):
+            return None
+        if metadata.get("model_type") != model_type or metadata.get("format") != SNAPSHOT_FORMAT:
+            return None
+
+        # mtime of the metadata file tracks last use for pruning
+        os.utime(path / METADATA_FILE)
+        return path
+
+    def save(self, model_name: str, model_type: str, writer: Callable[[Path], Any]) -> Optional[Path]:
+        """Write a snapshot of a loaded model (blocking).
+
+        The writer saves the model into a temporary directory, which is
+        renamed into place once complete, so readers never see a partial
+        snapshot. Errors are logged, never raised.
+
+        Args:
+            model_name: HuggingFace repo id
+            model_type: Loader model type
+            writer: Called with the target directory; saves weights as
+                    safetensors plus config/tokenizer files
+
+        Returns:
+            Snapshot directory, or None if nothing was written
+        """
+        revision = resolve_revision(model_name)
+        if revision is None:
+            return None
+
+        name = self._snapshot_name(model_name, revision)
+        path = self.directory / name
+        with self._lock:
+            if name in self._saving or (path / METADATA_FILE).exists():
+                return None
+            self._saving.add(name)
+
+        temp_path = self.directory / f".{name}.tmp-{os.getpid()}-{threading.get_ident()}"
+        try:
+            start_time = time.time()
+            temp_path.mkdir(parents=True, exist_ok=True)
+            writer(temp_path)
+            (temp_path / METADATA_FILE).write_text(json.dumps({
+                "model_name": model_name,
+                "revision": revision,
+                "model_type": model_type,
+                "format": SNAPSHOT_FORMAT,
+                "created_at": time.time()
+            }))
+            os.replace(temp_path, path)
+            self.logger.info(f"Saved snapshot of {model_name}@{revision[:12]} in {time.time() - start_time:.2f}s")
+            self._prune(model_name, keep=name)
+            return path
+        except Exception as e:
+            self.logger.warning(f"Could not snapshot {model_name}: {e}")
+            shutil.rmtree(temp_path, ignore_errors=True)
+            return None
+        finally:
+            with self._lock:
+                self._saving.discard(name)
+
+    def _prune(self, model_name: str, keep: str):
+        """Drop older revisions of a model, then least recently used snapshots beyond max_snapshots."""
+        prefix = f"{model_name.replace('/', '--')}--"
+        snapshots = []
+        for path in self.directory.iterdir():
+            if path.name.startswith(".") or not (path / METADATA_FILE).exists():
+                continue
+            if path.name.startswith(prefix) and path.name != keep:
+                shutil.rmtree(path, ignore_errors=True)
+                continue
+            snapshots.append(path)
+
+        snapshots.sort(key=lambda p: (p / METADATA_FILE).stat().st_mtime, reverse=True)
+        for path in snapshots[self.config.max_snapshots:]:
+            self.logger.info(f"Removing least recently used snapshot {path.name}")
+            shutil.rmtree(path, ignore_errors=True)
+
+    def get_status(self) -> Dict[str, Any]:
+        """Get snapshot store status.
+
+        Returns:
+            Dictionary with enabled flag, directory and snapshot names
+        """
+        snapshots = []
+        if self.enabled and self.directory.exists():
+            snapshots = sorted(
+                path.name for path in self.directory.iterdir()
+                if not path.name.startswith(".") and (path / METADATA_FILE).exists()
+            )
+        return {
+            "enabled": self.enabled,
+            "directory": str(self.directory) if self.enabled else None,
+            "snapshots": snapshots
+        }
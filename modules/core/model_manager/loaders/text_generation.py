@@ -17,13 +17,14 @@ MODULE_ID = "core.model_manager.loaders"
 class TextGenerationLoader(BaseLoader):
     """Loader for T5 and other text generation models."""
     
-    def __init__(self, config: Dict[str, Any]):
+    def __init__(self, config: Dict[str, Any], snapshots=None):
         """Initialize text generation loader.
         
         Args:
             config: Configuration dictionary
+            snapshots: Optional ModelSnapshotStore for fast reloads
         """
-        super().__init__(config)
+        super().__init__(config, snapshots)
         self.logger = logging.getLogger(f"{MODULE_ID}.text_generation")
     
     def supports_model(self, model_id: str) -> bool:
@@ -80,17 +81,30 @@ class TextGenerationLoader(BaseLoader):
             if device.startswith("cuda"):
                 self._setup_cuda_device(device)
 
-            self.logger.info(f"Loading T5 model {model_name} on {device}")
-
-            # Load T5 model and tokenizer (uses default HuggingFace cache)
             from transformers import T5ForConditionalGeneration, AutoTokenizer
 
-            model = T5ForConditionalGeneration.from_pretrained(
-                model_name
-            ).to(device)
-            tokenizer = AutoTokenizer.from_pretrained(
-                model_name
-            )
+            # Prefer a local snapshot (memory-mapped safetensors, configs already resolved)
+            snapshot_path = self._find_snapshot(model_name)
+            if snapshot_path:
+                self.logger.info(f"Loading T5 model {model_name} on {device} from snapshot {snapshot_path}")
+                model = T5ForConditionalGeneration.from_pretrained(str(snapshot_path)).to(device)
+                tokenizer = AutoTokenizer.from_pretrained(str(snapshot_path))
+            else:
+                self.logger.info(f"Loading T5 model {model_name} on {device}")
+
+                # Load T5 model and tokenizer (uses default HuggingFace cache)
+                model = T5ForConditionalGeneration.from_pretrained(
+                    model_name
+                ).to(device)
+                tokenizer = AutoTokenizer.from_pretrained(
+                    model_name
+                )
+
+                def write_snapshot(path):
+                    model.save_pretrained(str(path), safe_serialization=True)
+                    tokenizer.save_pretrained(str(path))
+
+                self._save_snapshot(model_name, write_snapshot)
             
             # Test model with sample input to validate loading
             try:
@@ -117,7 +131,8 @@ class TextGenerationLoader(BaseLoader):
                 "model_type": self.get_model_type(),
                 "device": device,
                 "loader_type": self.__class__.__name__,
-                "model_name": model_name
+                "model_name": model_name,
+                "snapshot_path": str(snapshot_path) if snapshot_path else None
             })
             
         except ImportError as e:
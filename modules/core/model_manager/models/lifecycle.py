@@ -7,9 +7,11 @@ Handles both direct model loading and worker-pool-based model management.
 """
 
 import asyncio
+import heapq
+import itertools
 import logging
 import time
-from typing import Dict, Any, Optional, TYPE_CHECKING
+from typing import Dict, Any, List, Optional, TYPE_CHECKING
 from core.error_utils import Result
 
 # Avoid circular imports
@@ -19,6 +21,7 @@ if TYPE_CHECKING:
     from ..workers import WorkerPool
 
 from .reference import ModelReference
+from .memory import ModelMemoryRegistry
 
 MODULE_ID = "core.model_manager"
 
@@ -49,25 +52,66 @@ class ModelLifecycleManager:
         
         # Model registry - tracks registered model requirements from modules
         self.model_registry: Dict[str, Dict[str, Any]] = {}
+
+        # Measured model footprints, persisted across restarts
+        self.memory_registry = ModelMemoryRegistry()
+
+        # Per-model warm-up choices. Kept apart from model_registry, whose entries
+        # release_model() removes, so recreated workers still honour them.
+        self.warmup_choices: Dict[str, bool] = {}
         
-        # Background task for idle model cleanup
+        # Idle release scheduler: heap of (deadline, sequence, model_name). Entries
+        # superseded by later activity stay in the heap and are skipped when popped;
+        # _release_deadlines holds each model's current deadline.
         self._idle_checker_task = None
+        self._deadline_heap: List[tuple] = []
+        self._release_deadlines: Dict[str, float] = {}
+        self._deadline_sequence = itertools.count()
+        self._scheduler_wakeup: Optional[asyncio.Future] = None
+        self._release_tasks: set = set()
         
         self.logger.info("Model Lifecycle Manager initialized")
     
-    def estimate_model_memory(self, model_name: str, model_type: str) -> float:
+    def set_warmup(self, model_name: str, warmup: Optional[bool]):
+        """Remember a model's warm-up choice (None keeps the current choice).
+
+        Args:
+            model_name: Model identifier
+            warmup: Warm up new workers for this model
+        """
+        if warmup is not None:
+            self.warmup_choices[model_name] = warmup
+
+    def warmup_enabled(self, model_name: str) -> bool:
+        """Check whether new workers for a model should warm up.
+
+        Args:
+            model_name: Model identifier
+
+        Returns:
+            The model's remembered choice, otherwise settings.warmup.enabled
+        """
+        return self.warmup_choices.get(model_name, self.settings.warmup.enabled)
+
+    def estimate_model_memory(self, model_name: str, model_type: str, device: str = "gpu") -> float:
         """Estimate model memory requirements in GB.
 
-        This is a rough estimation based on model name patterns.
-        Actual memory usage will be tracked by workers after loading.
+        Uses the footprint measured the last time the model was loaded on the
+        same kind of device. Models that were never measured fall back to a
+        rough estimate based on model name patterns.
 
         Args:
             model_name: HuggingFace model name
             model_type: Model type
+            device: "gpu" (default) or "cpu"
 
         Returns:
             Estimated memory in GB
         """
+        measured_gb = self.memory_registry.get_memory_gb(model_name, device)
+        if measured_gb is not None:
+            return measured_gb
+
         model_name_lower = model_name.lower()
 
         # Sentence transformers / embeddings (typically small)
@@ -103,6 +147,105 @@ class ModelLifecycleManager:
             return 1.0  # Conservative default for text generation
         else:
             return 0.5  # Conservative default for unknown models
+
+    def record_model_memory(self, model_name: str, device: str, measurement: Dict[str, Any]) -> float:
+        """Persist a worker's post-load measurement and update the registry entry.
+
+        Args:
+            model_name: Model identifier
+            device: Device the worker loaded the model on (e.g., "cuda:0" or "cpu")
+            measurement: Result of measure_model_memory()
+
+        Returns:
+            Measured footprint in GB
+        """
+        registration = self.model_registry.get(model_name)
+        model_type = registration.get("model_type") if registration else None
+
+        memory_gb = self.memory_registry.record(model_name, model_type, device, measurement)
+        if registration is not None:
+            registration["model_memory_gb"] = memory_gb
+        return memory_gb
+
+    def _is_model_busy(self, model_name: str) -> bool:
+        """Check whether a model has queued tasks or a worker mid-task."""
+        if not self.worker_pool:
+            return False
+        model_queue = self.worker_pool._model_queues.get(model_name)
+        if model_queue is not None and not model_queue.empty():
+            return True
+        return any(
+            worker.state.value == "busy"
+            for worker in self.worker_pool._model_workers.get(model_name, [])
+        )
+
+    def _needs_gpu_room(self, model_name: str, model_memory_gb: float) -> bool:
+        """Check whether no GPU without this model has room for it."""
+        gpu_memory = self.worker_pool._gpu_memory if self.worker_pool else {}
+        if not gpu_memory:
+            return False
+        return not any(
+            info["free_vram_gb"] >= model_memory_gb
+            for info in gpu_memory.values()
+            if model_name not in info["loaded_models"]
+        )
+
+    async def enforce_shared_model_limit(self, model_name: str, model_memory_gb: float, device: str = "gpu") -> List[str]:
+        """Release idle models so a new model fits.
+
+        Evicts least recently used idle models while sharing.max_shared_models
+        models are loaded, and, for GPU models, while no GPU has enough free
+        VRAM for the new one. VRAM accounting uses measured footprints, so each
+        eviction frees what the evicted model actually occupied.
+
+        Args:
+            model_name: Model about to be loaded
+            model_memory_gb: Its (measured or estimated) size in GB
+            device: "gpu" or "cpu"
+
+        Returns:
+            Names of released models
+        """
+        if not self.settings.sharing.enabled:
+            return []
+
+        loaded = [
+            name for name, registration in self.model_registry.items()
+            if name != model_name and registration.get("loaded", False)
+        ]
+        candidates = sorted(
+            (name for name in loaded if not self._is_model_busy(name)),
+            key=lambda name: self.model_registry[name].get("last_activity", 0)
+        )
+
+        released = []
+        max_shared_models = self.settings.sharing.max_shared_models
+        while candidates:
+            if len(loaded) - len(released) >= max_shared_models:
+                victim = candidates.pop(0)
+                reason = f"max_shared_models={max_shared_models} reached"
+            elif device == "gpu" and self._needs_gpu_room(model_name, model_memory_gb):
+                # Only models that hold VRAM can make room on a GPU
+                on_gpu = [
+                    name for name in candidates
+                    if any(name in info["loaded_models"] for info in self.worker_pool._gpu_memory.values())
+                ]
+                if not on_gpu:
+                    break
+                victim = on_gpu[0]
+                candidates.remove(victim)
+                reason = f"{model_memory_gb:.2f}GB needed on GPU"
+            else:
+                break
+
+            self.logger.info(f"Evicting idle model {victim} for {model_name} ({reason})")
+            release_result = await self.release_model(victim, wait_for_tasks=False)
+            if release_result.success:
+                released.append(victim)
+            else:
+                self.logger.error(f"Failed to evict {victim}: {release_result.error}")
+
+        return released
     
     async def get_or_load_model(self, model_name: str, device: str) -> Result:
         """Get existing model or load new one using loader factory.
@@ -150,7 +293,8 @@ class ModelLifecycleManager:
         model_type: str,
         num_workers: int = 1,
         device: str = "gpu",
-        requester_module_id: Optional[str] = None
+        requester_module_id: Optional[str] = None,
+        warmup: Optional[bool] = None
     ) -> Result:
         """Register a model and create dedicated workers for it.
 
@@ -169,6 +313,9 @@ class ModelLifecycleManager:
                    - "gpu": Fails if no GPU available (safe default)
                    - "cpu": Explicitly uses CPU (developer responsibility)
             requester_module_id: Optional module ID requesting the model (for tracking)
+            warmup: Warm up workers before they take tasks, including workers
+                    recreated after release (None = keep the model's earlier
+                    choice, or settings.warmup.enabled)
 
         Returns:
             Result with registration status and actual workers created
@@ -203,6 +350,8 @@ class ModelLifecycleManager:
             )
         """
         try:
+            self.set_warmup(model_name, warmup)
+
             # Check if model already registered
             if model_name in self.model_registry:
                 # Model already registered - increment reference count
@@ -234,9 +383,8 @@ class ModelLifecycleManager:
                     details={"model_type": model_type, "valid_types": valid_types}
                 )
 
-            # Estimate model memory requirements
-            # This is a rough estimation - actual memory will be tracked by workers
-            model_memory_gb = self.estimate_model_memory(model_name, model_type)
+            # Measured footprint from an earlier load, or a name-based estimate
+            model_memory_gb = self.estimate_model_memory(model_name, model_type, device)
 
             self.logger.info(
                 f"Registering model {model_name} (type: {model_type}, "
@@ -261,6 +409,7 @@ class ModelLifecycleManager:
             workers_created = 0
             actual_workers = 0
             if self.worker_pool and self.worker_pool.is_enabled:
+                await self.enforce_shared_model_limit(model_name, model_memory_gb, device)
                 self.logger.info(f"Creating workers for model {model_name}...")
                 ensure_result = await self.worker_pool.ensure_workers(
                     model_name=model_name,
@@ -350,6 +499,7 @@ class ModelLifecycleManager:
                 })
 
             registration = self.model_registry[model_name]
+            self._cancel_release_deadline(model_name)
 
             # Check if model is already unloaded
             if not registration.get("loaded", False):
@@ -368,7 +518,12 @@ class ModelLifecycleManager:
                     self.logger.info(f"Waiting for pending tasks to complete for {model_name}...")
                     start_time = time.time()
 
-                    while not model_queue.empty():
+                    def pending() -> bool:
+                        # Queued tasks, plus tasks workers pulled into a batch and have not answered
+                        workers = self.worker_pool._model_workers.get(model_name, [])
+                        return not model_queue.empty() or any(worker.holds_tasks() for worker in workers)
+
+                    while pending():
                         if timeout and (time.time() - start_time) > timeout:
                             queue_size = model_queue.qsize()
                             self.logger.warning(
@@ -378,7 +533,7 @@ class ModelLifecycleManager:
                             break
                         await asyncio.sleep(0.1)  # Check every 100ms
 
-                    if model_queue.empty():
+                    if not pending():
                         elapsed = time.time() - start_time
                         self.logger.info(f"Queue for {model_name} drained successfully ({elapsed:.2f}s)")
 
@@ -478,76 +633,138 @@ class ModelLifecycleManager:
                 details={"error": str(e)}
             )
     
+    def touch_model(self, model_name: str):
+        """Record activity for a model and move its release deadline.
+
+        The model is released keep_alive_seconds after its last activity.
+        Models without keep_alive_seconds (registered via register_model())
+        are never auto-released.
+
+        Args:
+            model_name: Model identifier
+        """
+        registration = self.model_registry.get(model_name)
+        if registration is None:
+            return
+
+        now = time.time()
+        registration["last_activity"] = now
+        keep_alive_seconds = registration.get("keep_alive_seconds")
+        if keep_alive_seconds is None:
+            return
+
+        deadline = now + keep_alive_seconds
+        self._release_deadlines[model_name] = deadline
+        heapq.heappush(self._deadline_heap, (deadline, next(self._deadline_sequence), model_name))
+
+        # Drop superseded entries once they dominate the heap (keeps it O(models))
+        if len(self._deadline_heap) > 2 * len(self._release_deadlines) + 64:
+            self._deadline_heap = [
+                entry for entry in self._deadline_heap
+                if self._release_deadlines.get(entry[2]) == entry[0]
+            ]
+            heapq.heapify(self._deadline_heap)
+
+        if self._deadline_heap[0][2] == model_name:
+            self._wake_scheduler()
+
+    def _wake_scheduler(self):
+        """Wake the release scheduler so it re-reads the earliest deadline."""
+        if self._scheduler_wakeup is not None and not self._scheduler_wakeup.done():
+            self._scheduler_wakeup.set_result(None)
+
+    def _cancel_release_deadline(self, model_name: str):
+        """Forget a model's release deadline (its heap entry becomes stale)."""
+        self._release_deadlines.pop(model_name, None)
+
     async def start_idle_checker(self):
-        """Start background task that checks for idle models and auto-releases them."""
+        """Start background task that releases models at their keep-alive deadline."""
         if self._idle_checker_task is None or self._idle_checker_task.done():
             self._idle_checker_task = asyncio.create_task(self._idle_checker_loop())
-            self.logger.info("Started idle model checker background task")
+            self.logger.info("Started idle model release scheduler")
     
     async def stop_idle_checker(self):
-        """Stop the idle model checker background task."""
+        """Stop the idle release scheduler and any releases it started."""
         if self._idle_checker_task and not self._idle_checker_task.done():
             self._idle_checker_task.cancel()
             try:
                 await self._idle_checker_task
             except asyncio.CancelledError:
                 pass
-            self.logger.info("Stopped idle model checker")
+            self.logger.info("Stopped idle model release scheduler")
+
+        for release_task in list(self._release_tasks):
+            release_task.cancel()
+        if self._release_tasks:
+            await asyncio.gather(*self._release_tasks, return_exceptions=True)
     
     async def _idle_checker_loop(self):
-        """Background task loop that checks for idle models and auto-releases them.
+        """Release models exactly when their keep-alive deadline passes.
 
-        Runs every 60 seconds, checks each loaded model's last_activity time,
-        and releases models that have exceeded their keep_alive timeout.
+        Sleeps until the earliest deadline in the heap, or until touch_model()
+        makes a model the earliest deadline. Models that are due at the same time are
+        released concurrently.
         """
-        self.logger.info("Idle model checker started")
-        check_interval = 60  # Check every 60 seconds
+        self.logger.info("Idle model release scheduler started")
+        loop = asyncio.get_running_loop()
 
-        # Keep checking while lifecycle manager is active
         while True:
             try:
-                await asyncio.sleep(check_interval)
-
-                # Check each model in registry
-                models_to_release = []
-                current_time = time.time()
-
-                for model_name, registration in list(self.model_registry.items()):
-                    if not registration.get("loaded", False):
-                        # Model not loaded, skip
-                        continue
-
-                    last_activity = registration.get("last_activity", current_time)
-                    keep_alive_seconds = registration.get("keep_alive_seconds", 300)
-                    idle_time = current_time - last_activity
-
-                    if idle_time > keep_alive_seconds:
-                        # Model has been idle too long
-                        keep_alive_minutes = keep_alive_seconds // 60
-                        models_to_release.append((model_name, idle_time, keep_alive_minutes))
-
-                # Release idle models
-                for model_name, idle_time, keep_alive_minutes in models_to_release:
-                    idle_minutes = int(idle_time // 60)
-                    self.logger.info(
-                        f"Auto-releasing idle model {model_name} "
-                        f"(idle: {idle_minutes}min, keep_alive: {keep_alive_minutes}min)"
+                now = time.time()
+
+                while self._deadline_heap and self._deadline_heap[0][0] <= now:
+                    deadline, _, model_name = heapq.heappop(self._deadline_heap)
+                    if self._release_deadlines.get(model_name) != deadline:
+                        continue  # Superseded by later activity or cancelled
+                    del self._release_deadlines[model_name]
+
+                    release_task = asyncio.create_task(self._release_idle_model(model_name))
+                    self._release_tasks.add(release_task)
+                    release_task.add_done_callback(self._release_tasks.discard)
+
+                self._scheduler_wakeup = loop.create_future()
+                timer = None
+                if self._deadline_heap:
+                    timer = loop.call_at(
+                        loop.time() + max(0.0, self._deadline_heap[0][0] - now), self._wake_scheduler
                     )
-
-                    release_result = await self.release_model(model_name)
-                    if release_result.success:
-                        self.logger.info(f"Successfully auto-released {model_name}, VRAM freed")
-                    else:
-                        self.logger.error(f"Failed to auto-release {model_name}: {release_result.error}")
+                try:
+                    await self._scheduler_wakeup
+                finally:
+                    if timer is not None:
+                        timer.cancel()
 
             except asyncio.CancelledError:
-                self.logger.info("Idle model checker cancelled (shutting down)")
+                self.logger.info("Idle model release scheduler cancelled (shutting down)")
                 break
             except Exception as e:
-                self.logger.error(f"Error in idle model checker: {e}")
-                # Continue running even if one check fails
+                self.logger.error(f"Error in idle model release scheduler: {e}")
+                # Continue running even if one pass fails
 
-        self.logger.info("Idle model checker stopped")
+        self.logger.info("Idle model release scheduler stopped")
+
+    async def _release_idle_model(self, model_name: str):
+        """Release a model whose keep-alive deadline passed.
+
+        Args:
+            model_name: Model identifier
+        """
+        registration = self.model_registry.get(model_name)
+        if not registration or not registration.get("loaded", False):
+            return
+
+        keep_alive_seconds = registration.get("keep_alive_seconds", 300)
+        idle_time = time.time() - registration.get("last_activity", 0)
+        self.logger.info(
+            f"Auto-releasing idle model {model_name} "
+            f"(idle: {idle_time:.0f}s, keep_alive: {keep_alive_seconds // 60}min)"
+        )
+
+        release_result = await self.release_model(model_name)
+        if release_result.success:
+            self.logger.info(f"Successfully auto-released {model_name}, VRAM freed")
+        else:
+            self.logger.error(f"Failed to auto-release {model_name}: {release_result.error}")
     
     def get_loaded_models_status(self) -> Dict[str, Dict[str, Any]]:
         """Get status of all loaded models.
@@ -569,4 +786,7 @@ class ModelLifecycleManager:
         """Clean up lifecycle manager resources."""
         self.model_registry.clear()
         self._loaded_models.clear()
+        self._deadline_heap.clear()
+        self._release_deadlines.clear()
+        self.memory_registry.close()
         self.logger.info("Lifecycle manager cleanup completed")
@@ -0,0 +1,248 @@
+"""
+modules/core/model_manager/models/memory.py
+Measured model memory accounting.
+
+Workers measure each model right after loading it: parameter and buffer
+bytes of the torch module (what occupies VRAM on a GPU) and, on CPU, the
+process RSS delta across the load (which also covers tokenizers and Python
+objects). Measurements are persisted per model and device kind in a small
+SQLite table, so GPU placement and shared-model eviction can use real sizes
+instead of name-pattern guesses, including after a restart.
+"""
+
+import logging
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+# Module identity for logging
+MODULE_ID = "core.model_manager.models"
+
+BYTES_PER_GB = 1024 ** 3
+
+
+def current_rss_bytes() -> Optional[int]:
+    """Get the resident set size of the current process.
+
+    Returns:
+        RSS in bytes, or None where /proc is not available
+    """
+    try:
+        with open("/proc/self/statm") as statm:
+            resident_pages = int(statm.read().split()[1])
+        return resident_pages * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def _tensor_bytes(module: Any, attribute: str) -> int:
+    """Sum numel * element_size over module.parameters() or module.buffers()."""
+    tensors = getattr(module, attribute, None)
+    if not callable(tensors):
+        return 0
+    return sum(tensor.numel() * tensor.element_size() for tensor in tensors())
+
+
+def measure_model_memory(model_data: Dict[str, Any], rss_before: Optional[int] = None) -> Dict[str, Any]:
+    """Measure the footprint of a freshly loaded model.
+
+    Args:
+        model_data: Loader result ("model" is a torch module for both model types)
+        rss_before: current_rss_bytes() taken just before the load (None = skip RSS delta)
+
+    Returns:
+        Dict with parameter_bytes, buffer_bytes, rss_delta_bytes (or None) and measured_at
+    """
+    model = model_data.get("model")
+    rss_after = current_rss_bytes() if rss_before is not None else None
+
+    return {
+        "parameter_bytes": _tensor_bytes(model, "parameters"),
+        "buffer_bytes": _tensor_bytes(model, "buffers"),
+        "rss_delta_bytes": max(0, rss_after - rss_before) if rss_after is not None else None,
+        "measured_at": time.time()
+    }
+
+
+def device_kind(device: str) -> str:
+    """Map a device string ("cpu", "cuda:1", "gpu") to the registry key "cpu" or "gpu"."""
+    return "cpu" if device == "cpu" else "gpu"
+
+
+def footprint_gb(measurement: Dict[str, Any], device: str) -> float:
+    """Memory a model occupies on a device, from a measurement.
+
+    GPU placement only needs the tensors; on CPU the RSS delta is used when it
+    is larger, since it also covers the tokenizer and Python-side objects.
+
+    Args:
+        measurement: Result of measure_model_memory()
+        device: Device the model was loaded on
+
+    Returns:
+        Footprint in GB
+    """
+    footprint = measurement.get("parameter_bytes", 0) + measurement.get("buffer_bytes", 0)
+    if device_kind(device) == "cpu" and measurement.get("rss_delta_bytes"):
+        footprint = max(footprint, measurement["rss_delta_bytes"])
+    return footprint / BYTES_PER_GB
+
+
+def available_system_memory_gb() -> Optional[float]:
+    """Get memory available to new allocations (MemAvailable).
+
+    Returns:
+        Available RAM in GB, or None where /proc/meminfo is not available
+    """
+    try:
+        with open("/proc/meminfo") as meminfo:
+            for line in meminfo:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1]) * 1024 / BYTES_PER_GB
+    except (OSError, ValueError, IndexError):
+        pass
+    return None
+
+
+class ModelMemoryRegistry:
+    """SQLite-backed table of measured model footprints.
+
+    One row per (model_name, device_kind); a new measurement replaces the
+    previous one. The database is opened on first use; if it cannot be
+    opened, measurements are kept in memory for the lifetime of the process.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        """Initialize the registry.
+
+        Args:
+            path: SQLite file (default: data/model_manager/memory_registry.db)
+        """
+        self.path = path
+        self.logger = logging.getLogger(f"{MODULE_ID}.memory")
+        self._connection: Optional[sqlite3.Connection] = None
+        self._opened = False
+        self._lock = threading.Lock()
+        self._measurements: Dict[tuple, Dict[str, Any]] = {}
+
+    def _connect(self) -> Optional[sqlite3.Connection]:
+        """Open the database and load persisted rows (once)."""
+        if self._opened:
+            return self._connection
+        self._opened = True
+
+        try:
+            if self.path:
+                path = Path(self.path)
+            else:
+                from core.paths import get_module_data_path
+                path = get_module_data_path("model_manager", "memory_registry.db")
+            path.parent.mkdir(parents=True, exist_ok=True)
+
+            connection = sqlite3.connect(str(path), check_same_thread=False)
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS model_memory ("
+                " model_name TEXT NOT NULL,"
+                " device_kind TEXT NOT NULL,"
+                " model_type TEXT,"
+                " parameter_bytes INTEGER NOT NULL,"
+                " buffer_bytes INTEGER NOT NULL,"
+                " rss_delta_bytes INTEGER,"
+                " memory_gb REAL NOT NULL,"
+                " measured_at REAL NOT NULL,"
+                " PRIMARY KEY (model_name, device_kind))"
+            )
+            connection.commit()
+
+            rows = connection.execute(
+                "SELECT model_name, device_kind, model_type, parameter_bytes, buffer_bytes,"
+                " rss_delta_bytes, memory_gb, measured_at FROM model_memory"
+            ).fetchall()
+            for name, kind, model_type, parameter_bytes, buffer_bytes, rss_delta_bytes, memory_gb, measured_at in rows:
+                self._measurements[(name, kind)] = {
+                    "model_type": model_type,
+                    "parameter_bytes": parameter_bytes,
+                    "buffer_bytes": buffer_bytes,
+                    "rss_delta_bytes": rss_delta_bytes,
+                    "memory_gb": memory_gb,
+                    "measured_at": measured_at
+                }
+
+            self._connection = connection
+            self.logger.debug(f"Loaded {len(rows)} model memory measurement(s) from {path}")
+        except Exception as e:
+            self.logger.warning(f"Model memory registry not persisted: {e}")
+
+        return self._connection
+
+    def record(self, model_name: str, model_type: Optional[str], device: str, measurement: Dict[str, Any]) -> float:
+        """Store a measurement, replacing any previous one for the model and device kind.
+
+        Args:
+            model_name: Model identifier
+            model_type: Registered model_type (None if unknown)
+            device: Device the model was loaded on
+            measurement: Result of measure_model_memory()
+
+        Returns:
+            Measured footprint in GB
+        """
+        memory_gb = footprint_gb(measurement, device)
+        kind = device_kind(device)
+        entry = {
+            "model_type": model_type,
+            "parameter_bytes": measurement.get("parameter_bytes", 0),
+            "buffer_bytes": measurement.get("buffer_bytes", 0),
+            "rss_delta_bytes": measurement.get("rss_delta_bytes"),
+            "memory_gb": memory_gb,
+            "measured_at": measurement.get("measured_at", time.time())
+        }
+
+        with self._lock:
+            connection = self._connect()
+            self._measurements[(model_name, kind)] = entry
+            if connection is not None:
+                try:
+                    connection.execute(
+                        "INSERT OR REPLACE INTO model_memory (model_name, device_kind, model_type, parameter_bytes,"
+                        " buffer_bytes, rss_delta_bytes, memory_gb, measured_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                        (model_name, kind, model_type, entry["parameter_bytes"], entry["buffer_bytes"],
+                         entry["rss_delta_bytes"], memory_gb, entry["measured_at"])
+                    )
+                    connection.commit()
+                except sqlite3.Error as e:
+                    self.logger.warning(f"Failed to persist memory measurement for {model_name}: {e}")
+
+        return memory_gb
+
+    def get_memory_gb(self, model_name: str, device: str) -> Optional[float]:
+        """Get the measured footprint of a model.
+
+        Args:
+            model_name: Model identifier
+            device: "gpu", "cpu" or a specific device such as "cuda:0"
+
+        Returns:
+            Footprint in GB, or None if the model has not been measured on that device kind
+        """
+        with self._lock:
+            self._connect()
+            entry = self._measurements.get((model_name, device_kind(device)))
+        return entry["memory_gb"] if entry else None
+
+    def get_status(self) -> Dict[str, Dict[str, Any]]:
+        """Get all measurements keyed by "model_name@device_kind"."""
+        with self._lock:
+            self._connect()
+            return {f"{name}@{kind}": dict(entry) for (name, kind), entry in self._measurements.items()}
+
+    def close(self):
+        """Close the database connection."""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
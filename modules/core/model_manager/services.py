@@ -17,10 +17,13 @@ Provides high-level API for:
 """
 
 import asyncio
+import hashlib
+import inspect
 import logging
 import time
 import uuid
-from typing import Dict, Any, Optional, List, Union, TYPE_CHECKING
+from typing import AsyncIterator, Callable, Dict, Any, Optional, List, Union, TYPE_CHECKING
+import numpy as np
 from core.error_utils import Result, error_message
 
 # Type checking imports (not executed at runtime to avoid circular imports)
@@ -28,9 +31,11 @@ if TYPE_CHECKING:
     from .schemas import ModelRequirement
 
 # Import modular components
-from .workers import WorkerPool, WorkerTask, WorkerResult
+from .workers import WorkerPool, WorkerTask, WorkerResult, WorkerAutoscaler, InferenceMetrics
+from .workers.metrics import format_metric
 from .cache import EmbeddingCache
-from .loaders import LoaderFactory
+from .loaders import LoaderFactory, precision_variant, cosine_drift
+from .loaders.precision import precision_error
 from .models import ModelReference, ModelLifecycleManager
 
 # Module identity (matches MODULE_ID in api.py)
@@ -56,6 +61,12 @@ class ModelManagerService:
         self.embedding_cache = None
         self.loader_factory = None
         self.lifecycle_manager = None
+        self.autoscaler = None
+        self.metrics = None
+
+        # Single-flight embedding requests: (model_name, text digest) -> Future
+        self._inflight_embeddings: Dict[tuple, asyncio.Future] = {}
+        self._coalesced_embeddings = 0
 
         # Initialization state
         self._initialized = False
@@ -98,6 +109,10 @@ class ModelManagerService:
             # Start background task for idle model cleanup (via lifecycle manager)
             await self.lifecycle_manager.start_idle_checker()
 
+            # Start queue-depth-driven worker autoscaling
+            if self.settings.worker_pool.enabled and self.settings.autoscaling.enabled:
+                await self.autoscaler.start()
+
             self._initialized = True
             self.logger.info(f"{MODULE_ID}: Service initialization completed successfully")
             return Result.success(data={"initialized": True})
@@ -135,6 +150,12 @@ class ModelManagerService:
             worker_pool=self.worker_pool
         )
 
+        # Initialize worker autoscaler (started only if enabled)
+        self.autoscaler = WorkerAutoscaler(self.settings, self.worker_pool, self.lifecycle_manager)
+
+        # Inference histograms, recorded by workers after every model call
+        self.metrics = InferenceMetrics() if self.settings.metrics_enabled else None
+
         self.logger.info("Modular components initialized successfully")
     
     async def task(
@@ -145,6 +166,11 @@ class ModelManagerService:
         num_workers: int = 1,
         device: str = "gpu",
         keep_alive: Optional[int] = None,
+        priority: int = 5,
+        return_format: str = "list",
+        stream: bool = False,
+        warmup: Optional[bool] = None,
+        precision: Optional[str] = None,
         **kwargs
     ) -> Result:
         """Unified task processing API - single entry point for all model operations.
@@ -164,7 +190,23 @@ class ModelManagerService:
             device: "gpu" (default) or "cpu"
             keep_alive: Minutes of inactivity before auto-release (default from settings)
                        Auto-release frees VRAM after inactivity. Next use recreates workers.
-            **kwargs: Additional task-specific parameters (e.g., max_length for text generation)
+            priority: Queue priority from 0 (most urgent) to 9 (bulk). Lower values are
+                      served first; waiting tasks age so bulk work is never starved.
+            return_format: Embedding output format - "list" (default, JSON-friendly lists of
+                           floats) or "numpy" (float32 np.ndarray, no per-vector list copies).
+                           Ignored for other task types.
+            stream: Text generation only. When True, returns immediately with
+                    data["stream"], an async iterator of events: {"type": "token", "text"}
+                    as text is generated, then {"type": "done", ...} or {"type": "error", ...}.
+            warmup: Run a warm-up pass on new workers for this model before they take tasks
+                    (None = the model's earlier choice, or settings.warmup.enabled). The choice
+                    is remembered across releases, so it also applies when workers are recreated.
+            precision: Embedding only - "fp32" (default), "int8" (CPU), "fp16" (GPU) or "bf16".
+                       Reduced precisions run as a separate worker group named
+                       "<model_name>@<precision>" with their own cache entries.
+            **kwargs: Additional task-specific parameters (e.g., max_length for text generation,
+                      progress_callback(completed, total) for embeddings, sync or async, called
+                      as worker results arrive)
 
         Returns:
             Result with task output (or confirmation if task_data=None for pre-load)
@@ -179,6 +221,51 @@ class ModelManagerService:
                 device="gpu"
             )
 
+            # Interactive query that should jump ahead of queued bulk work
+            await model_manager.task(
+                task_data="user search query",
+                task_type="embedding",
+                model_name="mixedbread-ai/mxbai-embed-large-v1",
+                priority=0
+            )
+
+            # Embeddings as a float32 ndarray for feeding a vector store
+            await model_manager.task(
+                task_data=chunks,
+                task_type="embedding",
+                model_name="mixedbread-ai/mxbai-embed-large-v1",
+                return_format="numpy"
+            )
+
+            # Bulk re-index: split into chunks that interleave with other requests
+            await model_manager.task(
+                task_data=all_documents,
+                task_type="embedding",
+                model_name="mixedbread-ai/mxbai-embed-large-v1",
+                priority=9,
+                progress_callback=lambda done, total: print(f"{done}/{total}")
+            )
+
+            # Stream generated text as it is produced
+            result = await model_manager.task(
+                task_data="Write a haiku about GPUs",
+                task_type="text_generation",
+                model_name="google-t5/t5-small",
+                stream=True
+            )
+            async for event in result.data["stream"]:
+                if event["type"] == "token":
+                    print(event["text"], end="")
+
+            # int8-quantized embeddings on CPU (separate workers from the fp32 model)
+            await model_manager.task(
+                task_data=texts,
+                task_type="embedding",
+                model_name="BAAI/bge-small-en-v1.5",
+                device="cpu",
+                precision="int8"
+            )
+
             # Pre-load model with 30 minute keep-alive
             await model_manager.task(
                 task_data=None,  # Pre-load only, no processing
@@ -199,6 +286,14 @@ class ModelManagerService:
                 keep_alive=10,  # Custom 10 minute timeout
                 max_length=128
             )
+
+            # Several prompts with greedy decoding (one batched generate() call)
+            await model_manager.task(
+                task_data=["summarize: ...", "summarize: ..."],
+                task_type="text_generation",
+                model_name="google-t5/t5-small",
+                generation_profile="fast"
+            )
         """
         try:
             if not self._initialized:
@@ -216,13 +311,42 @@ class ModelManagerService:
                     details={"task_type": task_type, "valid_types": valid_types}
                 )
 
+            if not 0 <= priority <= 9:
+                return Result.error(
+                    code="INVALID_PRIORITY",
+                    message=f"Invalid priority {priority}. Must be between 0 (most urgent) and 9",
+                    details={"priority": priority}
+                )
+
+            valid_formats = ["list", "numpy"]
+            if return_format not in valid_formats:
+                return Result.error(
+                    code="INVALID_RETURN_FORMAT",
+                    message=f"Invalid return_format '{return_format}'. Must be one of: {valid_formats}",
+                    details={"return_format": return_format, "valid_formats": valid_formats}
+                )
+
+            if stream and (task_type != "text_generation" or not isinstance(task_data, str)):
+                return Result.error(
+                    code="STREAMING_NOT_SUPPORTED",
+                    message="stream=True requires task_type='text_generation' and a single prompt string",
+                    details={"task_type": task_type}
+                )
+
+            if precision is not None:
+                precision_result = self._check_precision(precision, task_type, device)
+                if precision_result:
+                    return precision_result
+                model_name = precision_variant(model_name, precision)
+
             # Ensure workers exist for this model (auto-create or auto-recreate)
             await self._ensure_model_workers(
                 model_name=model_name,
                 task_type=task_type,
                 num_workers=num_workers,
                 device=device,
-                keep_alive=keep_alive
+                keep_alive=keep_alive,
+                warmup=warmup
             )
 
             # If task_data is None, this is a pre-load request - just return success
@@ -241,9 +365,19 @@ class ModelManagerService:
 
             # Route to appropriate handler based on task type
             if task_type == "embedding":
-                return await self._process_embedding_task(task_data, model_name, **kwargs)
+                return await self._process_embedding_task(
+                    task_data, model_name, priority=priority, return_format=return_format, **kwargs
+                )
             elif task_type == "text_generation":
-                return await self._process_text_generation_task(task_data, model_name, **kwargs)
+                if stream:
+                    profile_error = self._validate_generation_profile(kwargs)
+                    if profile_error:
+                        return profile_error
+                    return Result.success(data={
+                        "stream": self._stream_text_generation(task_data, model_name, kwargs, priority),
+                        "model_name": model_name
+                    })
+                return await self._process_text_generation_task(task_data, model_name, priority=priority, **kwargs)
             else:
                 return Result.error(
                     code="UNSUPPORTED_TASK_TYPE",
@@ -258,13 +392,41 @@ class ModelManagerService:
                 details={"error": str(e), "task_type": task_type, "model_name": model_name}
             )
 
+    @staticmethod
+    def _check_precision(precision: str, task_type: str, device: str) -> Optional[Result]:
+        """Validate a precision option.
+
+        Args:
+            precision: Requested precision
+            task_type: Task or model type
+            device: Requested device
+
+        Returns:
+            Result.error if the precision cannot be used, None if valid
+        """
+        if task_type != "embedding" and precision != "fp32":
+            return Result.error(
+                code="INVALID_PRECISION",
+                message="precision is only supported for embedding models",
+                details={"precision": precision, "task_type": task_type}
+            )
+        reason = precision_error(precision, device)
+        if reason:
+            return Result.error(
+                code="INVALID_PRECISION",
+                message=reason,
+                details={"precision": precision, "device": device}
+            )
+        return None
+
     async def _ensure_model_workers(
         self,
         model_name: str,
         task_type: str,
         num_workers: int,
         device: str,
-        keep_alive: Optional[int] = None
+        keep_alive: Optional[int] = None,
+        warmup: Optional[bool] = None
     ):
         """Ensure workers exist for a model, creating or recreating them if needed.
 
@@ -274,6 +436,7 @@ class ModelManagerService:
             num_workers: Number of workers requested
             device: Device specification ("gpu" or "cpu")
             keep_alive: Minutes of inactivity before auto-release (None = use default)
+            warmup: Warm up new workers (None = keep the model's earlier choice or use settings)
         """
         import time
 
@@ -284,8 +447,8 @@ class ModelManagerService:
         }
         model_type = task_to_model_type.get(task_type, task_type)
 
-        # Estimate model memory early - needed for both scaling and creation paths
-        model_memory_gb = self.lifecycle_manager.estimate_model_memory(model_name, model_type)
+        # Measured (or estimated) model memory - needed for both scaling and creation paths
+        model_memory_gb = self.lifecycle_manager.estimate_model_memory(model_name, model_type, device)
 
         # Get default keep_alive from settings (in seconds, convert to minutes)
         if keep_alive is None:
@@ -294,6 +457,14 @@ class ModelManagerService:
 
         keep_alive_seconds = keep_alive * 60  # Convert minutes to seconds for storage
 
+        # Remembered across releases, so workers recreated later warm up the same way
+        self.lifecycle_manager.set_warmup(model_name, warmup)
+
+        # With autoscaling, num_workers is only the initial count (clamped to the autoscaling bounds)
+        autoscaling = self.settings.autoscaling
+        if autoscaling.enabled:
+            num_workers = min(max(num_workers, autoscaling.min_workers), autoscaling.max_workers)
+
         # Check if workers exist
         if self.worker_pool and model_name in self.worker_pool._model_workers:
             workers = self.worker_pool._model_workers[model_name]
@@ -301,11 +472,11 @@ class ModelManagerService:
             if current_worker_count > 0:
                 # Workers exist and are running
                 if model_name in self.lifecycle_manager.model_registry:
-                    self.lifecycle_manager.model_registry[model_name]["last_activity"] = time.time()
                     self.lifecycle_manager.model_registry[model_name]["keep_alive_seconds"] = keep_alive_seconds
+                    self.lifecycle_manager.touch_model(model_name)
 
-                # Check if num_workers changed from request
-                if num_workers != current_worker_count:
+                # Check if num_workers changed from request (the autoscaler owns the count when enabled)
+                if num_workers != current_worker_count and not autoscaling.enabled:
                     # Scale workers to match requested count (add or remove as needed)
                     scale_result = await self.worker_pool.scale_model_workers(
                         model_name=model_name,
@@ -332,7 +503,7 @@ class ModelManagerService:
         # Workers don't exist or were stopped - create them
         self.logger.info(f"Creating workers for {model_name} on first use...")
 
-        # Store/update config in registry for future recreations (model_memory_gb already estimated at line 381)
+        # Store/update config in registry for future recreations (model_memory_gb already estimated above)
         if model_name not in self.lifecycle_manager.model_registry:
             self.lifecycle_manager.model_registry[model_name] = {
                 "model_type": model_type,
@@ -354,8 +525,9 @@ class ModelManagerService:
                 "keep_alive_seconds": keep_alive_seconds
             })
 
-        # Create workers
+        # Create workers, first evicting idle models if the shared-model limit or VRAM requires it
         if self.worker_pool and self.worker_pool.is_enabled:
+            await self.lifecycle_manager.enforce_shared_model_limit(model_name, model_memory_gb, device)
             ensure_result = await self.worker_pool.ensure_workers(
                 model_name=model_name,
                 num_workers=num_workers,
@@ -366,6 +538,8 @@ class ModelManagerService:
             if ensure_result.success:
                 workers_created = ensure_result.data.get("workers_created", 0)
                 self.lifecycle_manager.model_registry[model_name]["loaded"] = workers_created > 0
+                if workers_created > 0:
+                    self.lifecycle_manager.touch_model(model_name)
                 self.logger.info(f"Created {workers_created} worker(s) for {model_name} (keep_alive: {keep_alive}min)")
             else:
                 self.logger.error(f"Failed to create workers for {model_name}: {ensure_result.error}")
@@ -374,51 +548,297 @@ class ModelManagerService:
             raise RuntimeError("Worker pool not enabled")
 
 
-    async def _process_embedding_task(self, texts: Union[str, List[str]], model_name: str, **kwargs) -> Result:
+    async def _process_embedding_task(
+        self, texts: Union[str, List[str]], model_name: str, priority: int = 5,
+        return_format: str = "list", **kwargs
+    ) -> Result:
         """Process an embedding task using worker pool.
 
         Args:
             texts: Text(s) to embed
             model_name: Model name
-            **kwargs: Additional parameters
+            priority: Queue priority (lower is more urgent)
+            return_format: "list" or "numpy"
+            **kwargs: Additional parameters (progress_callback)
+
+        Concurrent requests for the same (model_name, text) share one in-flight
+        worker computation instead of each submitting a WorkerTask.
 
         Returns:
-            Result with embeddings
+            Result with embeddings as lists of floats, or a float32 np.ndarray
+            when return_format is "numpy"
         """
-        # Check cache first if enabled
-        cache_result = await self.embedding_cache.get_embeddings(texts, model_name)
-        if cache_result.success:
-            self.logger.debug(f"Cache hit for {len(texts) if isinstance(texts, list) else 1} text(s)")
-            return cache_result
+        text_list = [texts] if isinstance(texts, str) else texts
 
-        # Use worker pool
-        return await self._generate_embeddings_worker_pool(texts, model_name)
+        # Check cache first if enabled - per-text so partial hits are reused
+        lookup_result = await self.embedding_cache.lookup_embeddings(texts, model_name)
+        if lookup_result.success:
+            hits = lookup_result.data["hits"]
+            miss_indices = lookup_result.data["miss_indices"]
+        else:
+            # Cache disabled or failed - every text needs the worker pool
+            hits = {}
+            miss_indices = list(range(len(text_list)))
+
+        if not miss_indices:
+            self.logger.debug(f"Cache hit for {len(hits)} text(s)")
+            return Result.success(data={
+                "embeddings": self._format_embeddings(
+                    np.stack([hits[i] for i in range(len(hits))]), return_format
+                ),
+                "model_id": model_name,
+                "cached": True,
+                "cache_hits": len(hits)
+            })
+
+        # Single-flight: identical texts already being embedded share one future
+        pending: Dict[int, asyncio.Future] = {}
+        owned: Dict[tuple, asyncio.Future] = {}
+        owned_indices: List[int] = []
+        loop = asyncio.get_running_loop()
+        for index in miss_indices:
+            key = self._inflight_key(model_name, text_list[index])
+            future = self._inflight_embeddings.get(key)
+            if future is None:
+                future = loop.create_future()
+                self._inflight_embeddings[key] = future
+                owned[key] = future
+                owned_indices.append(index)
+            pending[index] = future
+
+        coalesced = len(miss_indices) - len(owned_indices)
+        self._coalesced_embeddings += coalesced
+
+        try:
+            worker_result = None
+            if owned_indices:
+                if len(owned_indices) == len(text_list):
+                    # Nothing cached or shared - keep the caller's input shape for the worker
+                    worker_input = texts
+                else:
+                    worker_input = [text_list[i] for i in owned_indices]
+                    self.logger.debug(
+                        f"Embedding {len(owned_indices)} of {len(text_list)} text(s) "
+                        f"({len(hits)} cached, {coalesced} coalesced)"
+                    )
+                worker_result = await self._generate_embeddings_worker_pool(
+                    worker_input, model_name, priority, progress_callback=kwargs.get("progress_callback")
+                )
+
+                if worker_result.success:
+                    vectors = worker_result.data["embeddings"]
+                    if vectors.ndim == 1:
+                        vectors = vectors.reshape(1, -1)
+                    for future, vector in zip(owned.values(), vectors):
+                        future.set_result(vector)
+                else:
+                    for future in owned.values():
+                        future.set_result(worker_result)
+                    return worker_result
+
+                if len(owned_indices) == len(text_list):
+                    worker_result.data["embeddings"] = self._format_embeddings(
+                        worker_result.data["embeddings"], return_format
+                    )
+                    return worker_result
+        finally:
+            for key, future in owned.items():
+                self._inflight_embeddings.pop(key, None)
+                if not future.done():
+                    # Owner was cancelled or failed unexpectedly - release any waiters
+                    future.set_result(Result.error(
+                        code="EMBEDDING_REQUEST_CANCELLED",
+                        message="Shared embedding request was cancelled before completing"
+                    ))
+
+        # Wait for shared results (shielded so one cancelled caller cannot cancel the others)
+        shared_values = await asyncio.gather(*(asyncio.shield(pending[i]) for i in miss_indices))
+
+        # Merge cached, fresh and shared embeddings back in the original order
+        merged = dict(hits)
+        for index, value in zip(miss_indices, shared_values):
+            if isinstance(value, Result):
+                # The request we joined failed - report its error
+                return value
+            merged[index] = value
+
+        data = dict(worker_result.data) if worker_result else {"model_name": model_name, "cached": False}
+        data["embeddings"] = self._format_embeddings(
+            np.stack([merged[i] for i in range(len(merged))]), return_format
+        )
+        data["cache_hits"] = len(hits)
+        data["coalesced"] = coalesced
+        return Result.success(data=data)
 
-    async def _process_text_generation_task(self, input_text: str, model_name: str, **kwargs) -> Result:
+    @staticmethod
+    def _inflight_key(model_name: str, text: str) -> tuple:
+        """Build the single-flight key for an embedding request.
+
+        Args:
+            model_name: Model name
+            text: Input text
+
+        Returns:
+            (model_name, text digest) tuple
+        """
+        return (model_name, hashlib.sha1(text.encode("utf-8")).hexdigest())
+
+    @staticmethod
+    def _format_embeddings(embeddings: np.ndarray, return_format: str) -> Union[np.ndarray, List]:
+        """Convert embeddings to the caller's requested format.
+
+        Embeddings stay as NumPy arrays inside the service and cache; this is
+        the single conversion point before results leave the model manager.
+        For "numpy" the array is returned as-is (for fresh results, a view of
+        the worker's batch output), so no per-vector copies are made.
+
+        Args:
+            embeddings: float32 array (1D for a single text, 2D otherwise)
+            return_format: "list" or "numpy"
+
+        Returns:
+            Lists of floats, or the np.ndarray itself
+        """
+        if return_format == "numpy":
+            return embeddings
+        return embeddings.tolist()
+
+    async def _process_text_generation_task(
+        self, input_text: Union[str, List[str]], model_name: str, priority: int = 5, **kwargs
+    ) -> Result:
         """Process a text generation task using worker pool.
 
+        Workers batch prompts from concurrent tasks into shared generate()
+        calls, grouped by prompt length.
+
         Args:
-            input_text: Input text
+            input_text: Prompt text, or a list of prompts
             model_name: Model name
-            **kwargs: Additional parameters (e.g., max_length)
+            priority: Queue priority (lower is more urgent)
+            **kwargs: Additional parameters (e.g., max_length, generation_profile, num_beams)
 
         Returns:
-            Result with generated text
+            Result with generated text (generated_texts for list input)
         """
+        profile_error = self._validate_generation_profile(kwargs)
+        if profile_error:
+            return profile_error
+
         # Use worker pool
-        return await self._generate_text_worker_pool(input_text, model_name, kwargs)
+        return await self._generate_text_worker_pool(input_text, model_name, kwargs, priority)
+
+    def _validate_generation_profile(self, params: Dict[str, Any]) -> Optional[Result]:
+        """Check a task's generation_profile against the configured profiles.
+
+        Args:
+            params: Text generation parameters
+
+        Returns:
+            Result.error for an unknown profile, None if valid
+        """
+        profile = params.get("generation_profile")
+        available_profiles = list(self.settings.text_generation.profiles)
+        if profile is not None and profile not in available_profiles:
+            return Result.error(
+                code="INVALID_GENERATION_PROFILE",
+                message=f"Unknown generation_profile '{profile}'. Must be one of: {available_profiles}",
+                details={"generation_profile": profile, "available_profiles": available_profiles}
+            )
+        return None
+
+    async def _stream_text_generation(
+        self, input_text: str, model_name: str, params: Dict[str, Any], priority: int = 5
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Submit a streaming text generation task and yield its output as it is produced.
+
+        Args:
+            input_text: Prompt text
+            model_name: Model name (HuggingFace name)
+            params: Generation parameters
+            priority: Queue priority (lower is more urgent)
+
+        Yields:
+            {"type": "token", "text": str} for each generated chunk, then a final
+            {"type": "done", "generated_text", "processing_time", "worker_id"} or
+            {"type": "error", "code", "message"} event
+        """
+        task = WorkerTask(
+            task_id=str(uuid.uuid4()),
+            task_type="text_generation",
+            model_name=model_name,
+            input_data=input_text,
+            metadata=params,
+            created_at=time.time(),
+            priority=priority,
+            stream=True
+        )
+        chunks = self.worker_pool.open_stream(task.task_id)
+        result_waiter = None
+        try:
+            future = await self.worker_pool.submit_task(task)
+            result_waiter = asyncio.ensure_future(self.worker_pool.wait_for_result(task, future))
+
+            while not result_waiter.done():
+                next_chunk = asyncio.ensure_future(chunks.get())
+                await asyncio.wait({next_chunk, result_waiter}, return_when=asyncio.FIRST_COMPLETED)
+                if next_chunk.done():
+                    yield {"type": "token", "text": next_chunk.result()}
+                else:
+                    next_chunk.cancel()
+
+            # Chunks delivered just before the result
+            while not chunks.empty():
+                yield {"type": "token", "text": chunks.get_nowait()}
+
+            result = result_waiter.result()
+            if result and result.success:
+                yield {
+                    "type": "done",
+                    "generated_text": result.data["generated_text"],
+                    "model_name": model_name,
+                    "processing_time": result.processing_time,
+                    "worker_id": result.worker_id
+                }
+            else:
+                yield {
+                    "type": "error",
+                    "code": result.error_code if result and result.error_code else "WORKER_POOL_TEXT_GENERATION_FAILED",
+                    "message": f"Worker pool text generation failed: {result.error if result else 'No result returned'}"
+                }
 
-    async def _generate_embeddings_worker_pool(self, texts: Union[str, List[str]], model_name: str) -> Result:
+        except Exception as e:
+            self.logger.error(f"Streaming text generation error: {e}")
+            yield {"type": "error", "code": "WORKER_POOL_TEXT_ERROR", "message": str(e)}
+        finally:
+            self.worker_pool.close_stream(task.task_id)
+            if result_waiter is not None and not result_waiter.done():
+                result_waiter.cancel()
+
+    async def _generate_embeddings_worker_pool(
+        self, texts: Union[str, List[str]], model_name: str, priority: int = 5,
+        progress_callback: Optional[Callable[[int, int], Any]] = None
+    ) -> Result:
         """Generate embeddings using worker pool.
 
+        Lists longer than worker_pool.embedding_chunk_size are split into
+        chunks (see _generate_embeddings_chunked).
+
         Args:
             texts: Text(s) to embed
             model_name: Model name (HuggingFace name, e.g., "sentence-transformers/all-MiniLM-L6-v2")
+            priority: Queue priority (lower is more urgent)
+            progress_callback: Called with (completed, total) texts as results arrive
 
         Returns:
-            Result with embedding data
+            Result with embedding data (embeddings as a float32 np.ndarray)
         """
         try:
+            chunk_size = self.settings.worker_pool.embedding_chunk_size
+            if chunk_size and not isinstance(texts, str) and len(texts) > chunk_size:
+                return await self._generate_embeddings_chunked(
+                    list(texts), model_name, priority, chunk_size, progress_callback
+                )
+
             task_id = str(uuid.uuid4())
             task = WorkerTask(
                 task_id=task_id,
@@ -426,19 +846,23 @@ class ModelManagerService:
                 model_name=model_name,
                 input_data=texts,
                 metadata={},
-                created_at=time.time()
+                created_at=time.time(),
+                priority=priority
             )
 
             # Submit task to worker pool (returns future immediately)
             future = await self.worker_pool.submit_task(task)
 
-            # Wait for result
-            result = await future
+            # Wait for result (bounded by the task deadline plus worker_timeout)
+            result = await self.worker_pool.wait_for_result(task, future)
 
             if result and result.success:
                 # Cache the results
                 await self.embedding_cache.cache_embeddings(texts, result.data["embeddings"], model_name)
 
+                text_count = 1 if isinstance(texts, str) else len(texts)
+                await self._report_progress(progress_callback, text_count, text_count)
+
                 return Result.success(data={
                     "embeddings": result.data["embeddings"],
                     "model_name": model_name,
@@ -450,8 +874,10 @@ class ModelManagerService:
             else:
                 error_msg = result.error if result else "No result returned"
                 return Result.error(
-                    code="WORKER_POOL_PROCESSING_FAILED",
-                    message=f"Worker pool processing failed: {error_msg}"
+                    # Overload/deadline failures keep their specific code (e.g. WORKER_QUEUE_FULL)
+                    code=result.error_code if result and result.error_code else "WORKER_POOL_PROCESSING_FAILED",
+                    message=f"Worker pool processing failed: {error_msg}",
+                    details={"model_name": model_name, "priority": priority}
                 )
                 
         except Exception as e:
@@ -462,13 +888,116 @@ class ModelManagerService:
                 details={"error": str(e)}
             )
 
-    async def _generate_text_worker_pool(self, input_text: str, model_name: str, params: Dict[str, Any]) -> Result:
+    async def _generate_embeddings_chunked(
+        self, texts: List[str], model_name: str, priority: int, chunk_size: int,
+        progress_callback: Optional[Callable[[int, int], Any]] = None
+    ) -> Result:
+        """Embed a large list as separate chunk tasks and reassemble the results.
+
+        Texts are sorted by length before chunking, so each encode call pads
+        to similar lengths. Only as many chunks as the model has workers are
+        queued at a time; each new chunk joins the back of the queue, so other
+        tasks are served between chunks instead of waiting for the whole job.
+        Each chunk is cached as it completes, so a retried job reuses the
+        chunks that already finished.
+
+        Args:
+            texts: Texts to embed
+            model_name: Model name
+            priority: Queue priority for every chunk
+            chunk_size: Texts per chunk
+            progress_callback: Called with (completed, total) texts after each chunk
+
+        Returns:
+            Result with embeddings (float32 np.ndarray) in input order
+        """
+        start_time = time.time()
+        order = sorted(range(len(texts)), key=lambda index: len(texts[index]))
+        chunks = [order[start:start + chunk_size] for start in range(0, len(order), chunk_size)]
+        window = max(1, len(self.worker_pool._model_workers.get(model_name, [])))
+
+        self.logger.info(f"Splitting {len(texts)} texts for {model_name} into {len(chunks)} chunks of up to {chunk_size}")
+
+        async def run_chunk(indices: List[int]):
+            task = WorkerTask(
+                task_id=str(uuid.uuid4()),
+                task_type="embedding",
+                model_name=model_name,
+                input_data=[texts[index] for index in indices],
+                metadata={},
+                created_at=time.time(),
+                priority=priority
+            )
+            future = await self.worker_pool.submit_task(task)
+            return indices, await self.worker_pool.wait_for_result(task, future)
+
+        embeddings = None
+        completed = 0
+        worker_ids = set()
+        next_chunk = 0
+        running = set()
+        try:
+            while next_chunk < len(chunks) or running:
+                while next_chunk < len(chunks) and len(running) < window:
+                    running.add(asyncio.ensure_future(run_chunk(chunks[next_chunk])))
+                    next_chunk += 1
+
+                done, running = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for finished in done:
+                    indices, result = finished.result()
+                    if not (result and result.success):
+                        error_msg = result.error if result else "No result returned"
+                        return Result.error(
+                            code=result.error_code if result and result.error_code else "WORKER_POOL_PROCESSING_FAILED",
+                            message=f"Worker pool processing failed: {error_msg}",
+                            details={"model_name": model_name, "priority": priority, "completed_texts": completed}
+                        )
+
+                    vectors = result.data["embeddings"]
+                    if embeddings is None:
+                        embeddings = np.empty((len(texts), vectors.shape[-1]), dtype=np.float32)
+                    embeddings[indices] = vectors
+                    await self.embedding_cache.cache_embeddings(
+                        [texts[index] for index in indices], vectors, model_name
+                    )
+
+                    worker_ids.add(result.worker_id)
+                    completed += len(indices)
+                    await self._report_progress(progress_callback, completed, len(texts))
+        finally:
+            for pending in running:
+                pending.cancel()
+
+        return Result.success(data={
+            "embeddings": embeddings,
+            "model_name": model_name,
+            "cached": False,
+            "processing_time": time.time() - start_time,
+            "worker_id": result.worker_id,
+            "metadata": dict(result.metadata or {}, chunks=len(chunks), worker_ids=sorted(worker_ids))
+        })
+
+    async def _report_progress(self, progress_callback: Optional[Callable[[int, int], Any]], completed: int, total: int):
+        """Call a caller-supplied progress callback (sync or async); errors are logged, not raised."""
+        if progress_callback is None:
+            return
+        try:
+            outcome = progress_callback(completed, total)
+            if inspect.isawaitable(outcome):
+                await outcome
+        except Exception as e:
+            self.logger.warning(f"Progress callback failed: {e}")
+
+    async def _generate_text_worker_pool(
+        self, input_text: Union[str, List[str]], model_name: str, params: Dict[str, Any], priority: int = 5
+    ) -> Result:
         """Generate text using worker pool.
 
         Args:
-            input_text: Input text
+            input_text: Prompt text, or a list of prompts
             model_name: Model name (HuggingFace name)
             params: Generation parameters
+            priority: Queue priority (lower is more urgent)
 
         Returns:
             Result with generated text
@@ -484,16 +1013,27 @@ class ModelManagerService:
                 model_name=model_name,
                 input_data=input_text,
                 metadata=params,
-                created_at=time.time()
+                created_at=time.time(),
+                priority=priority
             )
             
             # Submit task to worker pool (returns future immediately)
             future = await self.worker_pool.submit_task(task)
 
-            # Wait for result
-            result = await future
+            # Wait for result (bounded by the task deadline plus worker_timeout)
+            result = await self.worker_pool.wait_for_result(task, future)
 
             if result and result.success:
+                if not isinstance(input_text, str):
+                    return Result.success(data={
+                        "generated_texts": result.data["generated_texts"],
+                        "model_name": model_name,
+                        "processing_time": result.processing_time,
+                        "worker_id": result.worker_id,
+                        "input_lengths": result.data["input_lengths"],
+                        "output_lengths": result.data["output_lengths"]
+                    })
+
                 return Result.success(data={
                     "generated_text": result.data["generated_text"],
                     "model_name": model_name,
@@ -505,8 +1045,9 @@ class ModelManagerService:
             else:
                 error_msg = result.error if result else "No result returned"
                 return Result.error(
-                    code="WORKER_POOL_TEXT_GENERATION_FAILED",
-                    message=f"Worker pool text generation failed: {error_msg}"
+                    code=result.error_code if result and result.error_code else "WORKER_POOL_TEXT_GENERATION_FAILED",
+                    message=f"Worker pool text generation failed: {error_msg}",
+                    details={"model_name": model_name, "priority": priority}
                 )
                 
         except Exception as e:
@@ -535,7 +1076,9 @@ class ModelManagerService:
         model_type: str,
         num_workers: int = 1,
         device: str = "gpu",
-        requester_module_id: Optional[str] = None
+        requester_module_id: Optional[str] = None,
+        precision: Optional[str] = None,
+        warmup: Optional[bool] = None
     ) -> Result:
         """Register a model and create dedicated workers - delegates to lifecycle manager.
 
@@ -545,14 +1088,75 @@ class ModelManagerService:
             num_workers: Number of workers to create
             device: Device specification (gpu, cpu)
             requester_module_id: Optional module ID requesting the model
+            precision: Embedding precision variant to register (see task())
+            warmup: Warm up the model's workers before they take tasks, including
+                    after auto-release (None = keep the earlier choice or use settings)
 
         Returns:
             Result with registration status
         """
+        if precision is not None:
+            precision_result = self._check_precision(precision, model_type, device)
+            if precision_result:
+                return precision_result
+            model_name = precision_variant(model_name, precision)
+
         return await self.lifecycle_manager.register_model(
-            model_name, model_type, num_workers, device, requester_module_id
+            model_name, model_type, num_workers, device, requester_module_id, warmup
         )
 
+    async def validate_precision(
+        self,
+        model_name: str,
+        precision: str,
+        sample_texts: List[str],
+        device: str = "cpu"
+    ) -> Result:
+        """Measure how far a reduced-precision variant's embeddings drift from fp32.
+
+        Embeds the sample with the fp32 model and with the variant (loading
+        either on demand) and compares them per text.
+
+        Args:
+            model_name: Base embedding model name
+            precision: Variant to check ("int8", "fp16" or "bf16")
+            sample_texts: Representative texts
+            device: Device for both models
+
+        Returns:
+            Result with texts, mean_cosine, min_cosine and max_drift
+        """
+        if not sample_texts:
+            return Result.error(
+                code="INVALID_SAMPLE",
+                message="validate_precision needs at least one sample text"
+            )
+
+        results = []
+        for variant in ("fp32", precision):
+            result = await self.task(
+                task_data=list(sample_texts),
+                task_type="embedding",
+                model_name=model_name,
+                device=device,
+                precision=variant,
+                return_format="numpy"
+            )
+            if not result.success:
+                return result
+            results.append(result.data["embeddings"])
+
+        try:
+            drift = cosine_drift(results[0], results[1])
+        except ValueError as e:
+            return Result.error(code="PRECISION_VALIDATION_FAILED", message=str(e))
+
+        self.logger.info(
+            f"{model_name}@{precision} vs fp32 on {drift['texts']} texts: "
+            f"mean cosine {drift['mean_cosine']:.5f}, min {drift['min_cosine']:.5f}"
+        )
+        return Result.success(data=dict(drift, model_name=model_name, precision=precision, device=device))
+
     async def release_model(
         self,
         model_name: str,
@@ -624,8 +1228,14 @@ class ModelManagerService:
                 "initialized": self._initialized,
                 "worker_pool": worker_status.data if worker_status.success else {"error": worker_status.error},
                 "embedding_cache": cache_status,
+                "request_coalescing": {
+                    "in_flight": len(self._inflight_embeddings),
+                    "coalesced_texts": self._coalesced_embeddings
+                },
                 "loaded_models": models_status,
                 "total_loaded_models": total_loaded_models,
+                "autoscaling": self.autoscaler.get_status() if self.autoscaler else {},
+                "measured_model_memory": self.lifecycle_manager.memory_registry.get_status() if self.lifecycle_manager else {},
                 "loader_factory": self.loader_factory.get_factory_status() if self.loader_factory else {}
             })
             
@@ -636,6 +1246,78 @@ class ModelManagerService:
                 details={"error": str(e)}
             )
     
+    async def get_metrics(self) -> Result:
+        """Get inference metrics in Prometheus text format.
+
+        Histograms come from InferenceMetrics; worker counters, queue depth
+        and embedding cache counters are read at scrape time.
+
+        Returns:
+            Result with the exposition text as data
+        """
+        try:
+            lines = []
+            model_workers = dict(self.worker_pool._model_workers) if self.worker_pool else {}
+            model_queues = dict(self.worker_pool._model_queues) if self.worker_pool else {}
+
+            if self.metrics is not None:
+                self.metrics.remove_workers(
+                    worker.worker_id for workers in model_workers.values() for worker in workers
+                )
+                lines.extend(self.metrics.render())
+
+            worker_samples = [
+                ({"model": model_name, "worker": worker.worker_id}, worker)
+                for model_name, workers in model_workers.items()
+                for worker in workers
+            ]
+            for name, attribute, help_text in (
+                ("worker_tasks_processed_total", "tasks_processed", "Tasks completed by the worker"),
+                ("worker_batches_total", "batches_processed", "Micro-batched model calls made by the worker"),
+                ("worker_errors_total", "errors", "Tasks that failed in the worker"),
+                ("worker_tasks_expired_total", "tasks_expired", "Tasks dropped after their deadline passed in the queue"),
+                ("worker_processing_seconds_total", "total_processing_time", "Time the worker spent in model calls"),
+            ):
+                lines.extend(format_metric(name, "counter", help_text, (
+                    (labels, getattr(worker, attribute)) for labels, worker in worker_samples
+                )))
+
+            lines.extend(format_metric("workers", "gauge", "Workers serving the model", (
+                ({"model": model_name}, len(workers)) for model_name, workers in model_workers.items()
+            )))
+            lines.extend(format_metric("queue_depth", "gauge", "Tasks waiting in the model queue", (
+                ({"model": model_name}, queue.qsize()) for model_name, queue in model_queues.items()
+            )))
+            lines.extend(format_metric("queue_oldest_wait_seconds", "gauge", "Age of the oldest queued task", (
+                ({"model": model_name}, queue.oldest_wait_seconds()) for model_name, queue in model_queues.items()
+            )))
+
+            if self.embedding_cache:
+                cache_status = self.embedding_cache.get_status()
+                for name, key, metric_type, help_text in (
+                    ("embedding_cache_hits_total", "hits", "counter", "Embedding cache lookups served from cache"),
+                    ("embedding_cache_disk_hits_total", "disk_hits", "counter", "Embedding cache hits served from the disk tier"),
+                    ("embedding_cache_misses_total", "misses", "counter", "Embedding cache lookups that missed"),
+                    ("embedding_cache_hit_ratio", "hit_ratio", "gauge", "Embedding cache hits per lookup since start"),
+                    ("embedding_cache_entries", "cache_size", "gauge", "Embeddings held in memory"),
+                    ("embedding_cache_bytes", "cache_bytes", "gauge", "Bytes of embeddings held in memory"),
+                ):
+                    lines.extend(format_metric(name, metric_type, help_text, [({}, cache_status[key])]))
+
+            lines.extend(format_metric(
+                "coalesced_texts_total", "counter", "Embedding texts served by an identical in-flight request",
+                [({}, self._coalesced_embeddings)]
+            ))
+
+            return Result.success(data="\n".join(lines) + "\n")
+
+        except Exception as e:
+            return Result.error(
+                code="METRICS_ERROR",
+                message="Failed to collect metrics",
+                details={"error": str(e)}
+            )
+
     async def get_worker_pool_status(self) -> Result:
         """Get worker pool status specifically.
         
@@ -668,6 +1350,10 @@ class ModelManagerService:
         try:
             self.logger.info("Starting resource cleanup...")
 
+            # Stop autoscaling before workers go away
+            if self.autoscaler:
+                await self.autoscaler.stop()
+
             # Stop lifecycle manager (stops idle checker and cleans up lifecycle state)
             if self.lifecycle_manager:
                 await self.lifecycle_manager.stop_idle_checker()
@@ -690,8 +1376,9 @@ class ModelManagerService:
             if self.worker_pool:
                 await self.worker_pool.shutdown()
 
-            # Clear cache
+            # Persist disk tier (if enabled) and clear in-memory cache
             if self.embedding_cache:
+                self.embedding_cache.close()
                 self.embedding_cache.clear_cache()
 
             self._initialized = False
@@ -710,8 +1397,9 @@ class ModelManagerService:
             if self.lifecycle_manager:
                 self.lifecycle_manager.cleanup()
 
-            # Clear cache if available
+            # Persist disk tier and clear cache if available
             if self.embedding_cache:
+                self.embedding_cache.close()
                 self.embedding_cache.clear_cache()
 
             self._initialized = False
@@ -8,7 +8,7 @@ from HuggingFace, not pre-configured.
 """
 
 from pydantic import BaseModel, Field, ConfigDict
-from typing import Dict, List, Literal, Optional
+from typing import Any, Dict, List, Literal, Optional
 from enum import Enum
 
 # Define enums for better type safety
@@ -71,10 +71,38 @@ class EmbeddingCacheConfig(BaseModel):
         le=86400,
         description="Time to live for cached embeddings"
     )
+    max_bytes: int = Field(
+        default=0,
+        ge=0,
+        description="Approximate memory budget for cached embeddings in bytes (0 = entry limit only)"
+    )
+    eviction_policy: Literal["lru", "lfu"] = Field(
+        default="lru",
+        description="Eviction policy when max_cache_size or max_bytes is reached"
+    )
+    storage_dtype: Literal["float32", "float16"] = Field(
+        default="float32",
+        description="NumPy dtype used to store cached vectors (float16 halves memory)"
+    )
     persist_to_disk: bool = Field(
         default=False,
         description="Persist embedding cache to disk"
     )
+    disk_cache_dir: Optional[str] = Field(
+        default=None,
+        description="Directory for the on-disk cache tier (default: data/model_manager/embedding_cache)"
+    )
+    max_disk_entries: int = Field(
+        default=100000,
+        ge=1000,
+        le=10000000,
+        description="Maximum embeddings kept on disk per model (oldest slots are reused)"
+    )
+    disk_ttl_seconds: int = Field(
+        default=604800,
+        ge=0,
+        description="Time to live for on-disk embeddings (0 = never expire)"
+    )
 
 class WorkerPoolConfig(BaseModel):
     """Configuration for multi-GPU worker pool."""
@@ -101,23 +129,67 @@ class WorkerPoolConfig(BaseModel):
             "  - ['cuda:0', 'cpu']: Mixed GPU + CPU workers (for small models on CPU)"
         )
     )
+    cpu_worker_mode: Literal["thread", "process"] = Field(
+        default="thread",
+        description=(
+            "How device='cpu' workers run inference:\n"
+            "  - 'thread': in the API process on a thread pool (shares the GIL)\n"
+            "  - 'process': in a dedicated child process per worker that owns the model"
+        )
+    )
     batch_size: int = Field(
         default=32,
         ge=1,
         le=128,
-        description="Batch size for worker processing"
+        description="Maximum texts per micro-batched embedding encode call"
+    )
+    batch_wait_ms: int = Field(
+        default=5,
+        ge=0,
+        le=1000,
+        description="Maximum milliseconds a worker waits for more embedding tasks to fill a batch"
+    )
+    embedding_chunk_size: int = Field(
+        default=256,
+        ge=0,
+        le=100000,
+        description=(
+            "Embedding requests with more texts are split into length-sorted chunks of this many "
+            "texts, queued a few at a time so other tasks interleave (0 = never split)"
+        )
+    )
+    priority_aging_seconds: float = Field(
+        default=10.0,
+        ge=0.0,
+        le=3600.0,
+        description="Queue wait time that counts as one priority level, so bulk work is not starved (0 = strict priority)"
+    )
+    max_queue_size: int = Field(
+        default=1000,
+        ge=1,
+        le=100000,
+        description="Maximum queued tasks per model before the admission policy applies"
+    )
+    admission_policy: Literal["reject", "wait", "shed_lowest"] = Field(
+        default="wait",
+        description=(
+            "What to do when a model queue is full:\n"
+            "  - 'reject': fail the new task immediately\n"
+            "  - 'wait': wait up to queue_timeout for space, then fail\n"
+            "  - 'shed_lowest': drop the least urgent queued task if the new one outranks it"
+        )
     )
     queue_timeout: int = Field(
         default=30,
         ge=1,
         le=300,
-        description="Task queue timeout in seconds"
+        description="Seconds a task may wait for queue space and in the queue before it is dropped unprocessed"
     )
     worker_timeout: int = Field(
         default=30,
         ge=1,
         le=600,
-        description="Individual worker timeout in seconds"
+        description="Seconds a caller waits for a worker to finish a task once it may have started"
     )
     require_gpu: bool = Field(
         default=False,
@@ -136,6 +208,146 @@ class WorkerPoolConfig(BaseModel):
         description="Timeout before unloading idle models"
     )
 
+class AutoscalingConfig(BaseModel):
+    """Configuration for queue-depth-driven worker autoscaling."""
+    model_config = ConfigDict(env_prefix="CORE_MODEL_MANAGER_AUTOSCALING_")
+
+    enabled: bool = Field(
+        default=False,
+        description="Scale each model's workers with load (task() num_workers only sets the initial count)"
+    )
+    min_workers: int = Field(
+        default=1,
+        ge=1,
+        le=8,
+        description="Fewest workers kept per loaded model"
+    )
+    max_workers: int = Field(
+        default=4,
+        ge=1,
+        le=16,
+        description="Most workers per model (GPU models are also capped by GPU count)"
+    )
+    check_interval_seconds: float = Field(
+        default=5.0,
+        ge=0.5,
+        le=300.0,
+        description="Seconds between autoscaling decisions"
+    )
+    scale_up_queue_depth: int = Field(
+        default=8,
+        ge=1,
+        le=10000,
+        description="Queued tasks per worker that trigger adding a worker"
+    )
+    scale_up_wait_seconds: float = Field(
+        default=2.0,
+        ge=0.0,
+        le=300.0,
+        description="Wait time of the oldest queued task that triggers adding a worker (0 = queue depth only)"
+    )
+    scale_down_utilization: float = Field(
+        default=0.25,
+        ge=0.0,
+        le=1.0,
+        description="Worker busy fraction below which an idle-queued model loses a worker"
+    )
+    scale_up_cooldown_seconds: float = Field(
+        default=30.0,
+        ge=0.0,
+        le=3600.0,
+        description="Minimum seconds between a scaling action and the next scale-up"
+    )
+    scale_down_cooldown_seconds: float = Field(
+        default=120.0,
+        ge=0.0,
+        le=7200.0,
+        description="Minimum seconds between a scaling action and the next scale-down"
+    )
+    memory_headroom_gb: float = Field(
+        default=1.0,
+        ge=0.0,
+        le=256.0,
+        description="Free memory (VRAM for GPU models, system RAM for CPU models) that must remain after adding a worker"
+    )
+
+class WarmupConfig(BaseModel):
+    """Configuration for the warm-up pass run when a worker loads its model."""
+    model_config = ConfigDict(env_prefix="CORE_MODEL_MANAGER_WARMUP_")
+
+    enabled: bool = Field(
+        default=False,
+        description="Warm up new workers before they accept tasks (task(warmup=...) overrides per model)"
+    )
+    sequence_lengths: List[int] = Field(
+        default=[8, 64, 256],
+        description="Words per synthetic warm-up input, one pass per length (used when texts is empty)"
+    )
+    texts: List[str] = Field(
+        default=[],
+        description="Representative warm-up inputs (replace the synthetic sequence_lengths inputs)"
+    )
+    batch_size: int = Field(
+        default=4,
+        ge=1,
+        le=128,
+        description="Copies of each warm-up input per embedding call, to exercise batched shapes"
+    )
+    max_new_tokens: int = Field(
+        default=8,
+        ge=1,
+        le=512,
+        description="Tokens generated per warm-up input for text generation models"
+    )
+
+class SnapshotConfig(BaseModel):
+    """Configuration for local model snapshots used to speed up reloads."""
+    model_config = ConfigDict(env_prefix="CORE_MODEL_MANAGER_SNAPSHOTS_")
+
+    enabled: bool = Field(
+        default=False,
+        description="Save loaded models as local safetensors snapshots and reload from them"
+    )
+    directory: Optional[str] = Field(
+        default=None,
+        description="Snapshot directory (default: data/model_manager/snapshots)"
+    )
+    max_snapshots: int = Field(
+        default=10,
+        ge=1,
+        le=1000,
+        description="Snapshots kept on disk (least recently used are removed first)"
+    )
+
+class TextGenerationConfig(BaseModel):
+    """Configuration for batched text generation."""
+    model_config = ConfigDict(env_prefix="CORE_MODEL_MANAGER_TEXT_GENERATION_")
+
+    default_profile: str = Field(
+        default="quality",
+        description="Generation profile used when a task does not pass generation_profile"
+    )
+    profiles: Dict[str, Dict[str, Any]] = Field(
+        default_factory=lambda: {
+            "quality": {"num_beams": 4, "early_stopping": True, "do_sample": False},
+            "balanced": {"num_beams": 2, "early_stopping": True, "do_sample": False},
+            "fast": {"num_beams": 1, "do_sample": False}
+        },
+        description="Named sets of model.generate() keyword arguments"
+    )
+    batch_size: int = Field(
+        default=8,
+        ge=1,
+        le=64,
+        description="Maximum prompts per generate() call (prompts are grouped by length to limit padding)"
+    )
+    max_input_length: int = Field(
+        default=512,
+        ge=16,
+        le=8192,
+        description="Maximum prompt length in tokens (longer prompts are truncated)"
+    )
+
 # Main settings model
 class ModelManagerSettings(BaseModel):
     """
@@ -187,6 +399,22 @@ class ModelManagerSettings(BaseModel):
         default_factory=WorkerPoolConfig,
         description="Multi-GPU worker pool configuration"
     )
+    autoscaling: AutoscalingConfig = Field(
+        default_factory=AutoscalingConfig,
+        description="Queue-depth-driven worker autoscaling configuration"
+    )
+    snapshots: SnapshotConfig = Field(
+        default_factory=SnapshotConfig,
+        description="Local model snapshot configuration"
+    )
+    warmup: WarmupConfig = Field(
+        default_factory=WarmupConfig,
+        description="Worker warm-up configuration"
+    )
+    text_generation: TextGenerationConfig = Field(
+        default_factory=TextGenerationConfig,
+        description="Text generation batching and profile configuration"
+    )
     
     # General module settings - Framework infrastructure only
     enabled: bool = Field(
@@ -201,5 +429,9 @@ class ModelManagerSettings(BaseModel):
         default=True,
         description="Monitor GPU and system memory usage"
     )
+    metrics_enabled: bool = Field(
+        default=True,
+        description="Record queue wait and inference histograms for the /metrics endpoint"
+    )
 
     # Note: Configuration moved to model_config above for Pydantic v2 compatibility
\ No newline at end of file
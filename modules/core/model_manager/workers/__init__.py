@@ -5,20 +5,32 @@ Worker pool management components for model processing.
 Exports:
 - WorkerState: Worker state enumeration
 - WorkerTask, WorkerResult: Task processing data structures  
+- PriorityTaskQueue: Per-model task queue ordered by priority with aging
 - ModelWorker: Individual worker for GPU model processing
+- ProcessModelWorker: CPU worker that runs its model in a child process
 - WorkerPool: Worker pool management and load balancing
+- WorkerAutoscaler: Queue-depth-driven scaling of each model's workers
+- InferenceMetrics: Queue wait/inference histograms in Prometheus format
 """
 
 # Import extracted components
 from .states import WorkerState
 from .tasks import WorkerTask, WorkerResult
+from .queues import PriorityTaskQueue
 from .worker import ModelWorker
+from .process_worker import ProcessModelWorker
 from .pool import WorkerPool
+from .autoscaler import WorkerAutoscaler
+from .metrics import InferenceMetrics
 
 __all__ = [
     'WorkerState',
     'WorkerTask', 
     'WorkerResult',
+    'PriorityTaskQueue',
     'ModelWorker',
+    'ProcessModelWorker',
     'WorkerPool',
+    'WorkerAutoscaler',
+    'InferenceMetrics',
 ]
\ No newline at end of file
@@ -0,0 +1,239 @@
+"""
+modules/core/model_manager/workers/autoscaler.py
+Queue-depth-driven autoscaling of model workers.
+
+A background loop samples every loaded model's queue depth, the wait time
+of its oldest queued task, and how busy its workers were since the last
+sample (from each worker's total_processing_time). It then adds or removes
+one worker at a time through WorkerPool.scale_model_workers(), within
+autoscaling.min_workers/max_workers, separated by cooldowns, and only adds
+a worker when enough memory would remain free afterwards.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, Dict, Optional, TYPE_CHECKING
+
+from .states import WorkerState
+from ..models.memory import available_system_memory_gb
+
+if TYPE_CHECKING:
+    from ..settings import ModelManagerSettings
+    from ..models import ModelLifecycleManager
+    from .pool import WorkerPool
+
+# Module identity for logging
+MODULE_ID = "core.model_manager.workers"
+
+
+class WorkerAutoscaler:
+    """Scales each loaded model's workers with its load."""
+
+    def __init__(self, settings: "ModelManagerSettings", worker_pool: "WorkerPool",
+                 lifecycle_manager: "ModelLifecycleManager"):
+        """Initialize autoscaler.
+
+        Args:
+            settings: Model manager settings (uses settings.autoscaling)
+            worker_pool: Pool whose workers are scaled
+            lifecycle_manager: Source of each model's device and memory size
+        """
+        self.settings = settings
+        self.worker_pool = worker_pool
+        self.lifecycle_manager = lifecycle_manager
+        self.logger = logging.getLogger(f"{MODULE_ID}.autoscaler")
+
+        self._task: Optional[asyncio.Task] = None
+        # worker_id -> (sample time, total_processing_time) from the previous check
+        self._busy_samples: Dict[str, tuple] = {}
+        # model_name -> time of the last scaling action
+        self._last_scaled: Dict[str, float] = {}
+        # model_name -> last observed load and decision, for status reporting
+        self._model_status: Dict[str, Dict[str, Any]] = {}
+        self.scale_ups = 0
+        self.scale_downs = 0
+
+    async def start(self):
+        """Start the autoscaling loop."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._autoscale_loop())
+            self.logger.info("Started worker autoscaler")
+
+    async def stop(self):
+        """Stop the autoscaling loop."""
+        if self._task and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self.logger.info("Stopped worker autoscaler")
+
+    async def _autoscale_loop(self):
+        """Run one autoscaling pass every check_interval_seconds."""
+        while True:
+            try:
+                await asyncio.sleep(self.settings.autoscaling.check_interval_seconds)
+                await self.check_models()
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                self.logger.error(f"Error in worker autoscaler: {e}")
+
+    async def check_models(self):
+        """Make one scaling decision for every model that has workers."""
+        now = time.time()
+        for model_name in list(self.worker_pool._model_workers.keys()):
+            workers = self.worker_pool._model_workers.get(model_name)
+            model_queue = self.worker_pool._model_queues.get(model_name)
+            registration = self.lifecycle_manager.model_registry.get(model_name)
+            if not workers or model_queue is None or registration is None:
+                continue
+
+            load = self._sample_load(workers, model_queue, now)
+            target = self._target_workers(model_name, len(workers), load, registration, now)
+            self._model_status[model_name] = dict(load, workers=len(workers), target_workers=target)
+
+            if target != len(workers):
+                await self._scale(model_name, len(workers), target, registration, now)
+
+        # Forget samples of workers that no longer exist
+        live_workers = {
+            worker.worker_id
+            for workers in self.worker_pool._model_workers.values()
+            for worker in workers
+        }
+        for worker_id in list(self._busy_samples):
+            if worker_id not in live_workers:
+                del self._busy_samples[worker_id]
+        for model_name in list(self._model_status):
+            if model_name not in self.worker_pool._model_workers:
+                del self._model_status[model_name]
+
+    def _sample_load(self, workers, model_queue, now: float) -> Dict[str, float]:
+        """Measure a model's current load.
+
+        Returns:
+            Dict with queue_depth, oldest_wait_seconds and utilization (0.0-1.0
+            busy fraction of the model's workers since the previous check)
+        """
+        busy_seconds = 0.0
+        elapsed_seconds = 0.0
+        for worker in workers:
+            previous = self._busy_samples.get(worker.worker_id)
+            self._busy_samples[worker.worker_id] = (now, worker.total_processing_time)
+            if previous is None:
+                continue
+            busy_seconds += worker.total_processing_time - previous[1]
+            elapsed_seconds += now - previous[0]
+
+        return {
+            "queue_depth": model_queue.qsize(),
+            "oldest_wait_seconds": model_queue.oldest_wait_seconds(),
+            "utilization": min(1.0, busy_seconds / elapsed_seconds) if elapsed_seconds > 0 else 0.0
+        }
+
+    def _target_workers(self, model_name: str, current: int, load: Dict[str, float],
+                        registration: Dict[str, Any], now: float) -> int:
+        """Decide the worker count for a model (at most one step from current).
+
+        Args:
+            model_name: Model identifier
+            current: Current worker count
+            load: Result of _sample_load()
+            registration: Lifecycle registry entry (device, model_memory_gb)
+            now: Current time
+
+        Returns:
+            Target worker count
+        """
+        config = self.settings.autoscaling
+        since_last_scale = now - self._last_scaled.get(model_name, 0.0)
+
+        if current < config.min_workers:
+            return current + 1 if self._has_headroom(model_name, registration) else current
+        if current > config.max_workers:
+            return current - 1
+
+        backlogged = (
+            load["queue_depth"] >= config.scale_up_queue_depth * current
+            or (config.scale_up_wait_seconds > 0 and load["oldest_wait_seconds"] >= config.scale_up_wait_seconds)
+        )
+        if backlogged:
+            if (current < config.max_workers
+                    and since_last_scale >= config.scale_up_cooldown_seconds
+                    and self._has_headroom(model_name, registration)):
+                return current + 1
+            return current
+
+        if (current > config.min_workers
+                and load["queue_depth"] == 0
+                and load["utilization"] < config.scale_down_utilization
+                and since_last_scale >= config.scale_down_cooldown_seconds):
+            return current - 1
+
+        return current
+
+    def _has_headroom(self, model_name: str, registration: Dict[str, Any]) -> bool:
+        """Check that one more worker fits and leaves memory_headroom_gb free.
+
+        GPU models need a GPU that does not hold the model yet; CPU models
+        need available system memory (skipped where it cannot be read).
+        """
+        required_gb = registration.get("model_memory_gb", 0.0) + self.settings.autoscaling.memory_headroom_gb
+
+        if registration.get("device") == "cpu":
+            available_gb = available_system_memory_gb()
+            return available_gb is None or available_gb >= required_gb
+
+        return any(
+            info["free_vram_gb"] >= required_gb
+            for info in self.worker_pool._gpu_memory.values()
+            if model_name not in info["loaded_models"]
+        )
+
+    async def _scale(self, model_name: str, current: int, target: int, registration: Dict[str, Any], now: float):
+        """Apply a scaling decision through the worker pool."""
+        workers = self.worker_pool._model_workers[model_name]
+        if target < current and workers[-1].state == WorkerState.BUSY:
+            # scale_model_workers() stops the newest worker; never cut off a running task
+            return
+
+        self.logger.info(
+            f"Autoscaling {model_name}: {current} -> {target} worker(s) "
+            f"(queue: {self._model_status[model_name]['queue_depth']}, "
+            f"oldest wait: {self._model_status[model_name]['oldest_wait_seconds']:.1f}s, "
+            f"utilization: {self._model_status[model_name]['utilization']:.0%})"
+        )
+        scale_result = await self.worker_pool.scale_model_workers(
+            model_name=model_name,
+            target_workers=target,
+            model_memory_gb=registration.get("model_memory_gb", 0.0),
+            device=registration.get("device", "gpu")
+        )
+        self._last_scaled[model_name] = now
+
+        if not scale_result.success:
+            self.logger.error(f"Autoscaling {model_name} failed: {scale_result.error}")
+        elif scale_result.data.get("workers_added", 0):
+            self.scale_ups += 1
+        elif scale_result.data.get("workers_removed", 0):
+            self.scale_downs += 1
+
+    def get_status(self) -> Dict[str, Any]:
+        """Get autoscaler status.
+
+        Returns:
+            Dict with configuration bounds, action counters and per-model load
+        """
+        config = self.settings.autoscaling
+        return {
+            "enabled": config.enabled,
+            "running": bool(self._task and not self._task.done()),
+            "min_workers": config.min_workers,
+            "max_workers": config.max_workers,
+            "scale_ups": self.scale_ups,
+            "scale_downs": self.scale_downs,
+            "models": {name: dict(status) for name, status in self._model_status.items()}
+        }
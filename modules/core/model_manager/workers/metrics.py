@@ -0,0 +1,161 @@
+"""
+modules/core/model_manager/workers/metrics.py
+Inference metrics with fixed-bucket histograms and Prometheus text output.
+
+Workers record every model call: how long each task waited in the queue,
+how long the call took, how many texts it carried, and the resulting
+texts per second. Each observation goes into a per-worker histogram and a
+per-model histogram. Per-model series survive worker churn from autoscaling
+and auto-release. Recording is a bisect plus a few additions on the event
+loop thread, so no locks are needed. Rendering happens only when /metrics
+is scraped.
+"""
+
+import time
+from bisect import bisect_left
+from typing import Any, Dict, Iterable, List, Sequence, Tuple
+
+# Prometheus text exposition format
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+BATCH_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128, 256, 512)
+THROUGHPUT_BUCKETS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+# name -> (help text, bucket bounds)
+HISTOGRAMS = {
+    "queue_wait_seconds": ("Time tasks spent queued before a worker picked them up", LATENCY_BUCKETS),
+    "inference_seconds": ("Duration of model calls", LATENCY_BUCKETS),
+    "batch_texts": ("Texts or prompts per model call", BATCH_BUCKETS),
+    "throughput_texts_per_second": ("Texts or prompts processed per second of model call", THROUGHPUT_BUCKETS),
+}
+
+METRIC_PREFIX = "model_manager_"
+
+
+class Histogram:
+    """Cumulative-on-render histogram with fixed upper bounds."""
+
+    __slots__ = ("bounds", "counts", "sum", "count")
+
+    def __init__(self, bounds: Sequence[float]):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)  # last slot is +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+def _escape(value: Any) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(labels: Dict[str, Any]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in labels.items()) + "}"
+
+
+def _number(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+def format_metric(name: str, metric_type: str, help_text: str,
+                  samples: Iterable[Tuple[Dict[str, Any], float]]) -> List[str]:
+    """Render a counter or gauge family in Prometheus text format.
+
+    Args:
+        name: Metric name without the model_manager_ prefix
+        metric_type: "counter" or "gauge"
+        help_text: HELP line text
+        samples: (labels, value) pairs
+
+    Returns:
+        Lines of the metric family
+    """
+    full_name = METRIC_PREFIX + name
+    lines = [f"# HELP {full_name} {help_text}", f"# TYPE {full_name} {metric_type}"]
+    lines.extend(f"{full_name}{_labels(labels)} {_number(value)}" for labels, value in samples)
+    return lines
+
+
+class InferenceMetrics:
+    """Per-model and per-worker inference histograms."""
+
+    def __init__(self):
+        # (histogram name, model, task_type) -> Histogram
+        self._model_histograms: Dict[Tuple[str, str, str], Histogram] = {}
+        # (histogram name, model, worker_id, task_type) -> Histogram
+        self._worker_histograms: Dict[Tuple[str, str, str, str], Histogram] = {}
+        self.started_at = time.time()
+
+    def _observe(self, name: str, model_name: str, worker_id: str, task_type: str, value: float):
+        model_key = (name, model_name, task_type)
+        histogram = self._model_histograms.get(model_key)
+        if histogram is None:
+            histogram = self._model_histograms[model_key] = Histogram(HISTOGRAMS[name][1])
+        histogram.observe(value)
+
+        worker_key = (name, model_name, worker_id, task_type)
+        histogram = self._worker_histograms.get(worker_key)
+        if histogram is None:
+            histogram = self._worker_histograms[worker_key] = Histogram(HISTOGRAMS[name][1])
+        histogram.observe(value)
+
+    def record_call(self, model_name: str, worker_id: str, task_type: str,
+                    queue_waits: Iterable[float], seconds: float, texts: int):
+        """Record one completed model call.
+
+        Args:
+            model_name: Model the worker serves
+            worker_id: Worker that made the call
+            task_type: "embedding" or "text_generation"
+            queue_waits: Queue wait of each task in the call
+            seconds: Duration of the call
+            texts: Texts or prompts processed by the call
+        """
+        for wait in queue_waits:
+            self._observe("queue_wait_seconds", model_name, worker_id, task_type, max(0.0, wait))
+        self._observe("inference_seconds", model_name, worker_id, task_type, seconds)
+        self._observe("batch_texts", model_name, worker_id, task_type, texts)
+        if seconds > 0:
+            self._observe("throughput_texts_per_second", model_name, worker_id, task_type, texts / seconds)
+
+    def remove_workers(self, live_worker_ids: Iterable[str]):
+        """Drop per-worker series of workers that no longer exist."""
+        live = set(live_worker_ids)
+        for key in [key for key in self._worker_histograms if key[2] not in live]:
+            del self._worker_histograms[key]
+
+    def render(self) -> List[str]:
+        """Render all histograms in Prometheus text format.
+
+        Returns:
+            Lines for model_manager_<name> (per model) and
+            model_manager_worker_<name> (per worker) families
+        """
+        lines: List[str] = []
+        for prefix, histograms, label_names in (
+            ("", self._model_histograms, ("model", "task_type")),
+            ("worker_", self._worker_histograms, ("model", "worker", "task_type")),
+        ):
+            for name, (help_text, _) in HISTOGRAMS.items():
+                full_name = f"{METRIC_PREFIX}{prefix}{name}"
+                lines.append(f"# HELP {full_name} {help_text}")
+                lines.append(f"# TYPE {full_name} histogram")
+                for key in sorted(k for k in histograms if k[0] == name):
+                    histogram = histograms[key]
+                    labels = dict(zip(label_names, key[1:]))
+                    cumulative = 0
+                    for bound, count in zip(list(histogram.bounds) + [float("inf")], histogram.counts):
+                        cumulative += count
+                        lines.append(f"{full_name}_bucket{_labels(dict(labels, le=_number(bound)))} {cumulative}")
+                    lines.append(f"{full_name}_sum{_labels(labels)} {_number(float(histogram.sum))}")
+                    lines.append(f"{full_name}_count{_labels(labels)} {histogram.count}")
+        return lines
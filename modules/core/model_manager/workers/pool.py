@@ -7,10 +7,13 @@ Extracted from services.py as part of module refactoring.
 
 import logging
 import asyncio
+import time
 from typing import Dict, Any, Optional, List
 from .worker import ModelWorker
+from .process_worker import ProcessModelWorker
 from .states import WorkerState
 from .tasks import WorkerTask, WorkerResult
+from .queues import PriorityTaskQueue
 from core.error_utils import Result, error_message
 from ..settings import ModelManagerSettings
 
@@ -50,7 +53,7 @@ class WorkerPool:
         # }
 
         # Per-model tracking
-        self._model_queues: Dict[str, asyncio.Queue] = {}  # model_name -> Queue
+        self._model_queues: Dict[str, PriorityTaskQueue] = {}  # model_name -> priority queue
         self._model_workers: Dict[str, List[ModelWorker]] = {}  # model_name -> [workers]
         self._gpu_assignments: Dict[str, List[ModelWorker]] = {}  # gpu -> [workers]
 
@@ -59,6 +62,14 @@ class WorkerPool:
         self._global_job_queue = None
         self._pending_tasks = {}  # task_id -> asyncio.Future for O(1) result delivery
 
+        # Streaming tasks: task_id -> queue of generated text chunks
+        self._task_streams: Dict[str, asyncio.Queue] = {}
+
+        # Admission control counters
+        self._tasks_rejected = 0
+        self._tasks_shed = 0
+        self._tasks_timed_out = 0
+
         self.logger.info("Worker pool manager initialized")
     
     async def initialize(self) -> Result:
@@ -302,6 +313,46 @@ class WorkerPool:
         else:
             self.logger.warning(f"Model {model_name} not found in {gpu} loaded_models tracking")
 
+    def _record_worker_memory(self, worker: ModelWorker, model_memory_gb: float) -> float:
+        """Persist a started worker's measured footprint and return the size to account for.
+
+        Args:
+            worker: Worker whose model just loaded
+            model_memory_gb: Estimate used to place the worker
+
+        Returns:
+            Measured footprint in GB, or the estimate if the worker was not measured
+        """
+        lifecycle_manager = getattr(self.model_manager, "lifecycle_manager", None)
+        if worker.memory_usage is None or lifecycle_manager is None:
+            return model_memory_gb
+
+        measured_gb = lifecycle_manager.record_model_memory(worker.model_name, worker.assigned_gpu, worker.memory_usage)
+        self.logger.info(
+            f"Measured {worker.model_name} on {worker.assigned_gpu}: {measured_gb:.3f}GB "
+            f"(estimated {model_memory_gb:.3f}GB)"
+        )
+        return measured_gb
+
+    def _create_worker(self, worker_id: str, model_name: str, assigned_device: str, model_queue: PriorityTaskQueue) -> ModelWorker:
+        """Create a worker of the type configured for its device.
+
+        CPU workers run in their own process when worker_pool.cpu_worker_mode
+        is "process"; all other workers run in the API process.
+
+        Args:
+            worker_id: Unique identifier for the worker
+            model_name: Model the worker will load
+            assigned_device: "cpu" or a CUDA device (e.g., "cuda:0")
+            model_queue: Shared queue for this model
+
+        Returns:
+            Unstarted worker
+        """
+        if assigned_device == "cpu" and self.settings.worker_pool.cpu_worker_mode == "process":
+            return ProcessModelWorker(worker_id, model_name, assigned_device, model_queue, self.model_manager)
+        return ModelWorker(worker_id, model_name, assigned_device, model_queue, self.model_manager)
+
     async def ensure_workers(self, model_name: str, num_workers: int, model_memory_gb: float, device: str = "gpu") -> Result:
         """Create dedicated workers for a specific model.
 
@@ -328,8 +379,11 @@ class WorkerPool:
                     "message": f"Model {model_name} already has workers"
                 })
 
-            # Create queue for this model (shared by all workers)
-            model_queue = asyncio.Queue()
+            # Create queue for this model (shared by all workers, ordered by task priority)
+            model_queue = PriorityTaskQueue(
+                maxsize=self.settings.worker_pool.max_queue_size,
+                aging_seconds=self.settings.worker_pool.priority_aging_seconds
+            )
             self._model_queues[model_name] = model_queue
             self._model_workers[model_name] = []
 
@@ -341,8 +395,9 @@ class WorkerPool:
                 for i in range(num_workers):
                     worker_id = f"{model_name}_worker_{i}"
                     try:
-                        worker = ModelWorker(worker_id, model_name, "cpu", model_queue, self.model_manager)
+                        worker = self._create_worker(worker_id, model_name, "cpu", model_queue)
                         if await worker.start():
+                            model_memory_gb = self._record_worker_memory(worker, model_memory_gb)
                             self._model_workers[model_name].append(worker)
                             workers_created += 1
                             self.logger.info(f"Created CPU worker {worker_id} for {model_name}")
@@ -400,8 +455,9 @@ class WorkerPool:
 
                     worker_id = f"{model_name}_worker_{i}"
                     try:
-                        worker = ModelWorker(worker_id, model_name, assigned_gpu, model_queue, self.model_manager)
+                        worker = self._create_worker(worker_id, model_name, assigned_gpu, model_queue)
                         if await worker.start():
+                            model_memory_gb = self._record_worker_memory(worker, model_memory_gb)
                             self._model_workers[model_name].append(worker)
                             self._gpu_assignments[assigned_gpu].append(worker)
 
@@ -465,8 +521,11 @@ class WorkerPool:
         """Submit a task to the model-specific queue and return a future for the result.
 
         Workers for the specific model pull from their shared model queue, providing
-        natural load balancing. This is non-blocking - it submits the task and
-        immediately returns a future.
+        natural load balancing. Queues are bounded by worker_pool.max_queue_size;
+        when full, worker_pool.admission_policy decides whether the task is
+        rejected, waits up to queue_timeout for space, or displaces the least
+        urgent queued task. Rejected and displaced tasks resolve to a failed
+        WorkerResult with error_code set, so callers never wait on them.
 
         Args:
             task: Task to process (must have model_name attribute)
@@ -490,6 +549,11 @@ class WorkerPool:
             future.set_exception(RuntimeError(f"No workers available for model {model_name}"))
             return future
 
+        pool_config = self.settings.worker_pool
+        if task.deadline is None:
+            # Stale tasks are dropped by workers before they reach the model
+            task.deadline = task.created_at + pool_config.queue_timeout
+
         # Create a future for this task (O(1) result delivery)
         future = asyncio.Future()
         self._pending_tasks[task.task_id] = future
@@ -497,11 +561,129 @@ class WorkerPool:
         # Submit to model-specific queue - workers for this model will pull from it
         model_queue = self._model_queues[model_name]
         self.logger.info(f"Submitting task {task.task_id[:8]} to queue for model {model_name}")
-        await model_queue.put(task)
 
-        # Return the future immediately (non-blocking!)
+        if not model_queue.full():
+            model_queue.put_nowait(task)
+            return future
+
+        policy = pool_config.admission_policy
+        if policy == "wait":
+            try:
+                await asyncio.wait_for(model_queue.put(task), timeout=max(task.deadline - time.time(), 0))
+                return future
+            except asyncio.TimeoutError:
+                pass
+        elif policy == "shed_lowest":
+            shed_task = model_queue.shed_lowest(task.priority)
+            if shed_task is not None:
+                self._tasks_shed += 1
+                self.logger.warning(
+                    f"Queue for {model_name} full - shed task {shed_task.task_id[:8]} "
+                    f"(priority {shed_task.priority}) for task {task.task_id[:8]} (priority {task.priority})"
+                )
+                self._fail_task(
+                    shed_task,
+                    "TASK_SHED",
+                    f"Task displaced by a higher-priority task while queue for {model_name} was full"
+                )
+                model_queue.put_nowait(task)
+                return future
+
+        # Overloaded - fail fast instead of growing the queue without limit
+        self._tasks_rejected += 1
+        self.logger.warning(
+            f"Queue for {model_name} full ({model_queue.qsize()}/{model_queue.maxsize}, "
+            f"policy: {policy}) - rejected task {task.task_id[:8]}"
+        )
+        self._fail_task(
+            task,
+            "WORKER_QUEUE_FULL",
+            f"Model {model_name} is overloaded ({model_queue.qsize()} queued tasks), try again later"
+        )
         return future
 
+    async def wait_for_result(self, task: WorkerTask, future: asyncio.Future) -> WorkerResult:
+        """Wait for a submitted task's result, bounded by its deadline.
+
+        The caller waits for the time the task may still spend queued plus
+        worker_pool.worker_timeout for processing.
+
+        Args:
+            task: Task passed to submit_task()
+            future: Future returned by submit_task()
+
+        Returns:
+            WorkerResult (error_code "WORKER_TIMEOUT" if no result arrived in time)
+        """
+        queue_budget = max(task.deadline - time.time(), 0) if task.deadline else 0
+        timeout = queue_budget + self.settings.worker_pool.worker_timeout
+        try:
+            # Shielded so a timeout does not cancel the shared future itself
+            return await asyncio.wait_for(asyncio.shield(future), timeout=timeout)
+        except asyncio.TimeoutError:
+            self._tasks_timed_out += 1
+            self._pending_tasks.pop(task.task_id, None)
+            self.logger.warning(f"Task {task.task_id[:8]} for {task.model_name} timed out after {timeout:.1f}s")
+            return WorkerResult(
+                task_id=task.task_id,
+                worker_id="",
+                success=False,
+                error=f"No result from workers for {task.model_name} within {timeout:.1f}s",
+                error_code="WORKER_TIMEOUT"
+            )
+
+    def open_stream(self, task_id: str) -> asyncio.Queue:
+        """Create the chunk channel for a streaming task (call before submit_task).
+
+        Args:
+            task_id: Task identifier
+
+        Returns:
+            Queue that receives generated text chunks in order
+        """
+        stream = asyncio.Queue()
+        self._task_streams[task_id] = stream
+        return stream
+
+    def push_stream_chunk(self, task_id: str, text: str):
+        """Deliver a generated text chunk to a streaming task's caller.
+
+        Must run on the event loop; workers use loop.call_soon_threadsafe().
+
+        Args:
+            task_id: Task identifier
+            text: Newly generated text
+        """
+        stream = self._task_streams.get(task_id)
+        if stream is not None:
+            stream.put_nowait(text)
+
+    def close_stream(self, task_id: str):
+        """Discard a streaming task's chunk channel.
+
+        Args:
+            task_id: Task identifier
+        """
+        self._task_streams.pop(task_id, None)
+
+    def _fail_task(self, task: WorkerTask, error_code: str, error: str):
+        """Resolve a task's pending future with a failed WorkerResult.
+
+        Args:
+            task: Task that will not be processed
+            error_code: Machine-readable failure reason
+            error: Human-readable error message
+        """
+        future = self._pending_tasks.pop(task.task_id, None)
+        if future and not future.done():
+            future.set_result(WorkerResult(
+                task_id=task.task_id,
+                worker_id="",
+                success=False,
+                error=error,
+                error_code=error_code
+            ))
+
     async def get_status(self) -> Result:
         """Get worker pool status.
 
@@ -531,6 +713,7 @@ class WorkerPool:
                 model_status[model_name] = {
                     "workers": len(workers),
                     "queue_size": self._model_queues[model_name].qsize() if model_name in self._model_queues else 0,
+                    "queue_capacity": self._model_queues[model_name].maxsize if model_name in self._model_queues else 0,
                     "tasks_processed": model_tasks,
                     "errors": model_errors,
                     "worker_details": worker_info
@@ -543,7 +726,14 @@ class WorkerPool:
                 "total_tasks_processed": total_tasks,
                 "total_errors": total_errors,
                 "model_status": model_status,
-                "result_queue_size": self._worker_result_queue.qsize() if self._worker_result_queue else 0
+                "result_queue_size": self._worker_result_queue.qsize() if self._worker_result_queue else 0,
+                "admission": {
+                    "policy": self.settings.worker_pool.admission_policy,
+                    "max_queue_size": self.settings.worker_pool.max_queue_size,
+                    "tasks_rejected": self._tasks_rejected,
+                    "tasks_shed": self._tasks_shed,
+                    "tasks_timed_out": self._tasks_timed_out
+                }
             })
 
         except Exception as e:
@@ -607,9 +797,14 @@ class WorkerPool:
                     self.logger.warning(f"Clearing {queue_size} pending task(s) from queue for model {model_name}")
                     while not queue.empty():
                         try:
-                            queue.get_nowait()
+                            dropped_task = queue.get_nowait()
                         except asyncio.QueueEmpty:
                             break
+                        self._fail_task(
+                            dropped_task,
+                            "MODEL_WORKERS_STOPPED",
+                            f"Workers for {model_name} were stopped before the task was processed"
+                        )
                 del self._model_queues[model_name]
 
             self.logger.info(f"Stopped {workers_stopped} worker(s) for model {model_name} and freed VRAM")
@@ -684,8 +879,9 @@ class WorkerPool:
                     for i in range(current_count, target_workers):
                         worker_id = f"{model_name}_worker_{i}"
                         try:
-                            worker = ModelWorker(worker_id, model_name, "cpu", model_queue, self.model_manager)
+                            worker = self._create_worker(worker_id, model_name, "cpu", model_queue)
                             if await worker.start():
+                                model_memory_gb = self._record_worker_memory(worker, model_memory_gb)
                                 self._model_workers[model_name].append(worker)
                                 workers_added += 1
                                 self.logger.info(f"Added CPU worker {worker_id} for {model_name}")
@@ -704,8 +900,9 @@ class WorkerPool:
 
                         worker_id = f"{model_name}_worker_{i}"
                         try:
-                            worker = ModelWorker(worker_id, model_name, assigned_gpu, model_queue, self.model_manager)
+                            worker = self._create_worker(worker_id, model_name, assigned_gpu, model_queue)
                             if await worker.start():
+                                model_memory_gb = self._record_worker_memory(worker, model_memory_gb)
                                 self._model_workers[model_name].append(worker)
                                 self._gpu_assignments[assigned_gpu].append(worker)
 
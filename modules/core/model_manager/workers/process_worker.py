@@ -0,0 +1,321 @@
+"""
+modules/core/model_manager/workers/process_worker.py
+Process-backed model worker for CPU inference.
+
+On CPU-only hosts, tokenization and pre/post-processing in a thread pool
+contend on the GIL with the FastAPI event loop. ProcessModelWorker keeps the
+queue handling of ModelWorker (priorities, micro-batching, deadlines) in the
+API process, but loads the model in a dedicated child process and runs every
+encode/generate call there over a multiprocessing pipe.
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+from .worker import ModelWorker, run_encode, run_text_generation, run_text_generation_stream
+from .states import WorkerState
+from ..models.memory import current_rss_bytes, measure_model_memory
+
+# Module identity for logging
+MODULE_ID = "core.model_manager"
+
+# Seconds to wait for a child process to exit before terminating it
+SHUTDOWN_TIMEOUT = 10.0
+
+
+def _process_worker_main(conn, loader_factory_cls, settings_data: Dict[str, Any],
+                         model_name: str, model_type: Optional[str], device: str):
+    """Child process entry point: load the model, then serve requests from the pipe.
+
+    Requests are (operation, payload) tuples; replies are ("ok", data) or
+    ("error", message), optionally preceded by ("chunk", text) messages for
+    streaming generation. The loop ends on "shutdown" or when the pipe closes.
+
+    Args:
+        conn: Child end of the multiprocessing pipe
+        loader_factory_cls: LoaderFactory class used by the parent service
+        settings_data: ModelManagerSettings.model_dump() from the parent
+        model_name: Model to load
+        model_type: Registered model_type (None = auto-detect)
+        device: Device string passed to the loader (always "cpu" here)
+    """
+    from ..settings import ModelManagerSettings
+
+    logger = logging.getLogger(f"{MODULE_ID}.process_worker")
+
+    try:
+        settings = ModelManagerSettings(**settings_data)
+        loader_factory = loader_factory_cls(settings)
+        rss_before = current_rss_bytes()
+        load_result = asyncio.run(loader_factory.load_model(model_name, device, model_type=model_type))
+        if not load_result.success:
+            conn.send(("error", f"Failed to load model {model_name}: {load_result.error}"))
+            return
+        model_data = load_result.data
+    except Exception as e:
+        conn.send(("error", f"Failed to load model {model_name}: {e}"))
+        return
+
+    # Only picklable metadata goes back to the parent; the model stays here
+    model_info = {k: v for k, v in model_data.items() if k not in ("model", "tokenizer")}
+    if settings.memory_monitoring:
+        # The RSS delta is exact here: nothing else runs in this process
+        model_info["memory_usage"] = measure_model_memory(model_data, rss_before)
+    conn.send(("ok", model_info))
+
+    while True:
+        try:
+            operation, payload = conn.recv()
+        except (EOFError, OSError):
+            break
+
+        if operation == "shutdown":
+            break
+
+        try:
+            if operation == "encode":
+                if "model" not in model_data:
+                    raise RuntimeError("No embedding model loaded")
+                conn.send(("ok", run_encode(model_data["model"], payload)))
+            elif operation == "generate":
+                prompts, generate_kwargs, batch_size, max_input_length = payload
+                conn.send(("ok", run_text_generation(
+                    model_data, prompts, generate_kwargs, device, batch_size, max_input_length
+                )))
+            elif operation == "generate_stream":
+                prompt, generate_kwargs, max_input_length = payload
+                conn.send(("ok", run_text_generation_stream(
+                    model_data, prompt, generate_kwargs, device, max_input_length,
+                    lambda text: conn.send(("chunk", text))
+                )))
+            else:
+                conn.send(("error", f"Unknown operation: {operation}"))
+        except Exception as e:
+            logger.error(f"Worker process error for {model_name} ({operation}): {e}")
+            conn.send(("error", str(e)))
+
+    conn.close()
+
+
+class ProcessModelWorker(ModelWorker):
+    """ModelWorker whose model lives in a separate OS process.
+
+    Used for device="cpu" workers when worker_pool.cpu_worker_mode is
+    "process". The child is started with the "spawn" method and loads the
+    model with the same LoaderFactory class as the parent service.
+    """
+
+    def __init__(self, worker_id: str, model_name: str, assigned_gpu: str, model_queue: asyncio.Queue, model_manager_service):
+        """Initialize process-backed worker.
+
+        Args:
+            worker_id: Unique identifier for this worker
+            model_name: Model to load (HuggingFace name)
+            assigned_gpu: Device for this worker (always "cpu")
+            model_queue: Shared queue for this model (workers compete for tasks)
+            model_manager_service: Reference to parent model manager
+        """
+        super().__init__(worker_id, model_name, assigned_gpu, model_queue, model_manager_service)
+        self._process = None
+        self._conn = None
+        # One thread per worker blocks on the pipe, so the event loop never does
+        self._pipe_executor: Optional[ThreadPoolExecutor] = None
+
+    async def _load_model(self):
+        """Start the worker process and wait until it has loaded the model."""
+        try:
+            self.state = WorkerState.LOADING
+
+            if not hasattr(self.model_manager, 'loader_factory'):
+                raise RuntimeError("LoaderFactory not initialized in model_manager")
+
+            context = multiprocessing.get_context("spawn")
+            parent_conn, child_conn = context.Pipe()
+            process = context.Process(
+                target=_process_worker_main,
+                args=(
+                    child_conn,
+                    type(self.model_manager.loader_factory),
+                    self.model_manager.settings.model_dump(),
+                    self.model_name,
+                    self._get_model_type(),
+                    self.assigned_gpu
+                ),
+                name=f"model-worker-{self.worker_id}",
+                daemon=True
+            )
+            try:
+                process.start()
+            except Exception:
+                parent_conn.close()
+                raise
+            finally:
+                child_conn.close()
+            self._process = process
+            self._conn = parent_conn
+            self._pipe_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"pipe-{self.worker_id}")
+
+            self.logger.info(f"Started worker process {self._process.pid} for {self.model_name}")
+
+            loop = asyncio.get_event_loop()
+            model_info = await loop.run_in_executor(self._pipe_executor, self._receive)
+
+            self.memory_usage = model_info.pop("memory_usage", None)
+            self.current_model = dict(model_info, process_pid=self._process.pid)
+
+            await self._warm_up()
+            self.last_activity = time.time()
+            self.state = WorkerState.IDLE
+
+            self.logger.info(f"Loaded model {self.model_name} in worker process {self._process.pid}")
+
+        except Exception as e:
+            self.logger.error(f"Failed to load model {self.model_name}: {e}")
+            self.state = WorkerState.ERROR
+            await self._unload_model()
+            raise
+
+    async def _unload_model(self):
+        """Stop the worker process, which frees the model's memory."""
+        process, conn, executor = self._process, self._conn, self._pipe_executor
+        self._process = self._conn = self._pipe_executor = None
+        self.current_model = None
+
+        if process is None:
+            self.logger.debug("No worker process running, skipping unload")
+            return
+
+        try:
+            if conn is not None:
+                try:
+                    conn.send(("shutdown", None))
+                except (BrokenPipeError, OSError):
+                    pass
+
+            loop = asyncio.get_event_loop()
+            await loop.run_in_executor(None, process.join, SHUTDOWN_TIMEOUT)
+            if process.is_alive():
+                self.logger.warning(f"Worker process {process.pid} did not exit, terminating")
+                process.terminate()
+                await loop.run_in_executor(None, process.join, SHUTDOWN_TIMEOUT)
+
+            self.logger.info(f"Worker process {process.pid} for {self.model_name} stopped")
+
+        except Exception as e:
+            self.logger.error(f"Error stopping worker process: {e}")
+        finally:
+            if conn is not None:
+                conn.close()
+            if executor is not None:
+                executor.shutdown(wait=False)
+
+    def _receive(self, on_chunk: Optional[Callable[[str], None]] = None) -> Any:
+        """Block until the worker process replies (runs on the pipe thread).
+
+        Args:
+            on_chunk: Called with each streamed text chunk before the final reply
+
+        Returns:
+            Reply data
+
+        Raises:
+            RuntimeError: If the process reported an error or exited
+        """
+        while True:
+            try:
+                status, data = self._conn.recv()
+            except (EOFError, OSError):
+                exit_code = self._process.exitcode if self._process else None
+                raise RuntimeError(f"Worker process for {self.model_name} exited unexpectedly (exit code: {exit_code})")
+
+            if status == "chunk":
+                if on_chunk is not None:
+                    on_chunk(data)
+                continue
+            if status != "ok":
+                raise RuntimeError(data)
+            return data
+
+    def _call(self, operation: str, payload: Any, on_chunk: Optional[Callable[[str], None]] = None) -> Any:
+        """Send one request to the worker process and wait for the reply (runs on the pipe thread)."""
+        if self._conn is None:
+            raise RuntimeError(f"Worker process for {self.model_name} is not running")
+        self._conn.send((operation, payload))
+        return self._receive(on_chunk)
+
+    async def _request(self, operation: str, payload: Any, on_chunk: Optional[Callable[[str], None]] = None) -> Any:
+        """Run a request in the worker process without blocking the event loop.
+
+        Args:
+            operation: "encode", "generate" or "generate_stream"
+            payload: Operation input
+            on_chunk: Thread-safe callback for streamed text chunks
+
+        Returns:
+            Reply data
+        """
+        if self._pipe_executor is None:
+            raise RuntimeError(f"Worker process for {self.model_name} is not running")
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(self._pipe_executor, self._call, operation, payload, on_chunk)
+
+    async def _encode_texts(self, texts: List[str]):
+        """Encode texts in the worker process.
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            2D float32 np.ndarray with one row per text
+        """
+        try:
+            return await self._request("encode", list(texts))
+        except Exception as e:
+            self.logger.error(f"Embedding error: {e}")
+            raise
+
+    async def _generate_texts(self, prompts: List[str], generate_kwargs: List[Dict[str, Any]]) -> List[str]:
+        """Generate text in the worker process.
+
+        Args:
+            prompts: Prompt texts
+            generate_kwargs: model.generate() arguments, one dict per prompt
+
+        Returns:
+            Generated texts in prompt order
+        """
+        config = self.model_manager.settings.text_generation
+        return await self._request(
+            "generate", (prompts, generate_kwargs, config.batch_size, config.max_input_length)
+        )
+
+    async def _stream_text(self, prompt: str, generate_kwargs: Dict[str, Any], on_text: Callable[[str], None]) -> str:
+        """Stream text generation from the worker process.
+
+        Args:
+            prompt: Prompt text
+            generate_kwargs: model.generate() arguments
+            on_text: Thread-safe chunk callback
+
+        Returns:
+            Full generated text
+        """
+        config = self.model_manager.settings.text_generation
+        return await self._request(
+            "generate_stream", (prompt, generate_kwargs, config.max_input_length), on_chunk=on_text
+        )
+
+    def get_status(self):
+        """Get worker status information, including the worker process.
+
+        Returns:
+            Worker status dictionary
+        """
+        status = super().get_status()
+        status["process_pid"] = self._process.pid if self._process else None
+        status["process_alive"] = bool(self._process and self._process.is_alive())
+        return status
@@ -0,0 +1,83 @@
+"""
+modules/core/model_manager/workers/queues.py
+Priority-aware task queue for per-model worker queues.
+
+Lower WorkerTask.priority values are served first. Aging keeps low-priority
+work from starving: every aging_seconds a task waits counts as one priority
+level, so a task eventually overtakes newer, more urgent ones.
+"""
+
+import asyncio
+import heapq
+import itertools
+import time
+from typing import Optional
+
+from .tasks import WorkerTask
+
+
+class PriorityTaskQueue(asyncio.Queue):
+    """asyncio.Queue ordered by WorkerTask.priority with aging.
+
+    The sort key is static (enqueue time + priority * aging_seconds), which
+    is equivalent to aging every waiting task at the same rate, so puts and
+    gets stay O(log n).
+    """
+
+    def __init__(self, maxsize: int = 0, aging_seconds: float = 10.0):
+        """Initialize the queue.
+
+        Args:
+            maxsize: Maximum queued tasks (0 = unbounded)
+            aging_seconds: Wait time worth one priority level (0 = strict priority)
+        """
+        self.aging_seconds = aging_seconds
+        self._sequence = itertools.count()
+        super().__init__(maxsize)
+
+    def _init(self, maxsize):
+        self._queue = []
+
+    def _sort_key(self, priority: int, now: float) -> tuple:
+        if self.aging_seconds > 0:
+            return (now + priority * self.aging_seconds,)
+        return (priority, now)
+
+    def _put(self, task: WorkerTask):
+        sort_key = self._sort_key(task.priority, time.monotonic())
+        heapq.heappush(self._queue, (sort_key, next(self._sequence), task))
+
+    def _get(self) -> WorkerTask:
+        return heapq.heappop(self._queue)[-1]
+
+    def oldest_wait_seconds(self) -> float:
+        """Seconds the longest-waiting queued task has been waiting (0.0 if empty)."""
+        if not self._queue:
+            return 0.0
+        return max(0.0, time.time() - min(entry[-1].created_at for entry in self._queue))
+
+    def shed_lowest(self, priority: int) -> Optional[WorkerTask]:
+        """Remove the least urgent queued task if it ranks below a new arrival.
+
+        Args:
+            priority: Priority of the task that needs a slot
+
+        Returns:
+            The removed task, or None if every queued task outranks the new one
+        """
+        if not self._queue:
+            return None
+
+        incoming_key = self._sort_key(priority, time.monotonic())
+        position = max(range(len(self._queue)), key=lambda i: self._queue[i][:2])
+        if self._queue[position][0] <= incoming_key:
+            return None
+
+        entry = self._queue[position]
+        self._queue[position] = self._queue[-1]
+        self._queue.pop()
+        heapq.heapify(self._queue)
+        # Keep join()/task_done() accounting consistent for the removed task
+        self.task_done()
+        return entry[-1]
+
@@ -5,7 +5,7 @@ Worker task and result data structures.
 Extracted from services.py as part of module refactoring.
 """
 
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from dataclasses import dataclass
 
 
@@ -18,7 +18,9 @@ class WorkerTask:
     input_data: Any
     metadata: Dict[str, Any]
     created_at: float
-    priority: int = 5
+    priority: int = 5  # Lower is more urgent (0 = interactive, 9 = bulk/backfill)
+    deadline: Optional[float] = None  # time.time() after which the task is dropped unprocessed
+    stream: bool = False  # Push generated text chunks to WorkerPool stream channel as they are produced
 
 
 @dataclass
@@ -30,4 +32,5 @@ class WorkerResult:
     data: Any = None
     error: str = None
     processing_time: float = 0.0
-    metadata: Dict[str, Any] = None
\ No newline at end of file
+    metadata: Dict[str, Any] = None
+    error_code: Optional[str] = None  # Machine-readable failure reason (e.g. "WORKER_QUEUE_FULL")
@@ -8,17 +8,181 @@ Extracted from services.py as part of module refactoring.
 import logging
 import time
 import asyncio
-from typing import Optional, Any, Dict
+from typing import Optional, Any, Callable, Dict, List, Tuple
 
 # Import from parent module components
 from .states import WorkerState
 from .tasks import WorkerTask, WorkerResult
+from ..models.memory import current_rss_bytes, measure_model_memory
 from core.error_utils import error_message, Result
 
 # Module identity for logging
 MODULE_ID = "core.model_manager"
 
 
+def run_encode(model, texts: List[str]):
+    """Encode texts with an embedding model (blocking).
+
+    Shared by thread-based workers and the CPU worker processes.
+
+    Args:
+        model: Loaded embedding model (SentenceTransformer-compatible)
+        texts: Texts to embed
+
+    Returns:
+        2D float32 np.ndarray with one row per text
+    """
+    import numpy as np
+
+    # convert_to_numpy=True ensures we get numpy arrays that can be safely converted
+    embeddings = model.encode(texts, convert_to_numpy=True, show_progress_bar=False)
+
+    # Results stay as one contiguous float32 array; the service converts
+    # to lists only when returning to callers. The copy detaches the
+    # result from the model's buffers.
+    return np.array(embeddings, dtype=np.float32, copy=True)
+
+
+# Per-task parameters passed straight through to model.generate()
+GENERATION_OVERRIDES = (
+    "num_beams", "do_sample", "temperature", "top_k", "top_p", "early_stopping",
+    "max_new_tokens", "min_length", "no_repeat_ngram_size", "repetition_penalty", "length_penalty"
+)
+
+
+def resolve_generation_kwargs(params: Dict[str, Any], config) -> Dict[str, Any]:
+    """Build model.generate() keyword arguments for one task.
+
+    Starts from the task's generation profile (or config.default_profile),
+    then applies max_length and any explicit GENERATION_OVERRIDES.
+
+    Args:
+        params: Task metadata (generation_profile, max_length, overrides)
+        config: TextGenerationConfig
+
+    Returns:
+        Keyword arguments for model.generate()
+    """
+    profile_name = params.get("generation_profile") or config.default_profile
+    if profile_name not in config.profiles:
+        raise ValueError(f"Unknown generation profile '{profile_name}'. Available: {list(config.profiles)}")
+
+    generate_kwargs = dict(config.profiles[profile_name])
+    generate_kwargs["max_length"] = params.get("max_length", 128)
+    generate_kwargs.update({key: params[key] for key in GENERATION_OVERRIDES if key in params})
+    return generate_kwargs
+
+
+def run_text_generation(model_data: Dict[str, Any], prompts: List[str], generate_kwargs: List[Dict[str, Any]],
+                        device: str, batch_size: int, max_input_length: int) -> List[str]:
+    """Generate text for many prompts with as few generate() calls as possible (blocking).
+
+    Prompts that share generation arguments are sorted by token length and
+    run in chunks of batch_size, so each call pads to similar lengths.
+
+    Args:
+        model_data: Loader result data with "model" and "tokenizer"
+        prompts: Prompt texts
+        generate_kwargs: model.generate() arguments, one dict per prompt
+        device: Device the model lives on
+        batch_size: Maximum prompts per generate() call
+        max_input_length: Prompt truncation length in tokens
+
+    Returns:
+        Generated texts in prompt order
+    """
+    if "model" not in model_data or "tokenizer" not in model_data:
+        raise RuntimeError("No text generation model loaded")
+
+    try:
+        import torch
+    except ImportError:
+        raise RuntimeError("PyTorch required for text generation")
+
+    model = model_data["model"]
+    tokenizer = model_data["tokenizer"]
+
+    # Only prompts with identical generation arguments can share a generate() call
+    groups: Dict[str, Tuple[Dict[str, Any], List[int]]] = {}
+    for index, kwargs in enumerate(generate_kwargs):
+        groups.setdefault(repr(sorted(kwargs.items())), (kwargs, []))[1].append(index)
+
+    outputs: List[Optional[str]] = [None] * len(prompts)
+    for kwargs, indices in groups.values():
+        token_counts = [
+            len(ids) for ids in
+            tokenizer([prompts[i] for i in indices], truncation=True, max_length=max_input_length)["input_ids"]
+        ]
+        ordered = [index for _, index in sorted(zip(token_counts, indices))]
+
+        for start in range(0, len(ordered), batch_size):
+            chunk = ordered[start:start + batch_size]
+            inputs = tokenizer(
+                [prompts[i] for i in chunk],
+                return_tensors="pt",
+                padding=True,
+                truncation=True,
+                max_length=max_input_length
+            )
+            inputs = {k: v.to(device) for k, v in inputs.items()}
+
+            with torch.no_grad():
+                generated = model.generate(**inputs, **kwargs)
+
+            for index, text in zip(chunk, tokenizer.batch_decode(generated, skip_special_tokens=True)):
+                outputs[index] = text
+
+    return outputs
+
+
+def run_text_generation_stream(model_data: Dict[str, Any], prompt: str, generate_kwargs: Dict[str, Any],
+                               device: str, max_input_length: int, on_text: Callable[[str], None]) -> str:
+    """Generate text for one prompt, reporting decoded text as tokens are produced (blocking).
+
+    Streamers do not support beam search, so num_beams is forced to 1 (greedy,
+    or sampling if the profile enables do_sample).
+
+    Args:
+        model_data: Loader result data with "model" and "tokenizer"
+        prompt: Prompt text
+        generate_kwargs: model.generate() arguments
+        device: Device the model lives on
+        max_input_length: Prompt truncation length in tokens
+        on_text: Called with each newly decoded text chunk (from this thread)
+
+    Returns:
+        Full generated text
+    """
+    if "model" not in model_data or "tokenizer" not in model_data:
+        raise RuntimeError("No text generation model loaded")
+
+    try:
+        import torch
+        from transformers import TextStreamer
+    except ImportError:
+        raise RuntimeError("PyTorch and transformers required for streaming text generation")
+
+    class _CallbackStreamer(TextStreamer):
+        def on_finalized_text(self, text: str, stream_end: bool = False):
+            if text:
+                on_text(text)
+
+    model = model_data["model"]
+    tokenizer = model_data["tokenizer"]
+
+    kwargs = dict(generate_kwargs, num_beams=1)
+    kwargs.pop("early_stopping", None)
+
+    inputs = tokenizer([prompt], return_tensors="pt", truncation=True, max_length=max_input_length)
+    inputs = {k: v.to(device) for k, v in inputs.items()}
+    streamer = _CallbackStreamer(tokenizer, skip_prompt=True, skip_special_tokens=True)
+
+    with torch.no_grad():
+        generated = model.generate(**inputs, streamer=streamer, **kwargs)
+
+    return tokenizer.decode(generated[0], skip_special_tokens=True)
+
+
 class ModelWorker:
     """Worker dedicated to a specific model, processing tasks from a shared model queue.
 
@@ -47,14 +211,21 @@ class ModelWorker:
         # State management
         self.state = WorkerState.IDLE
         self.current_model = None  # Loaded model instance
+        self.memory_usage: Optional[Dict[str, Any]] = None  # Measured right after load
+        self.warmup: Optional[Dict[str, Any]] = None  # Warm-up timing, if a warm-up ran
         self.last_activity = time.time()
         self.is_running = False
         self._worker_task = None
+        self._held_task: Optional[WorkerTask] = None  # Pulled while batching, processed next
+        self._inflight: List[WorkerTask] = []  # Pulled from the queue, result not posted yet
+
 
         # Performance tracking
         self.tasks_processed = 0
         self.total_processing_time = 0.0
         self.errors = 0
+        self.batches_processed = 0
+        self.tasks_expired = 0
 
         self.logger.info(f"Created for model {model_name} on {assigned_gpu}")
     
@@ -98,6 +269,9 @@ class ModelWorker:
             except asyncio.CancelledError:
                 pass
 
+        # Tasks this worker pulled but never answered go back to the other workers
+        self._return_unfinished_tasks()
+
         # Unload model and clear CUDA memory
         await self._unload_model()
 
@@ -160,21 +334,40 @@ class ModelWorker:
         while self.is_running:
             try:
                 # Pull from shared model queue - workers for this model compete
-                task = await self.model_queue.get()
+                if self._held_task is not None:
+                    task, self._held_task = self._held_task, None
+                else:
+                    task = await self.model_queue.get()
                 self.logger.info(f"Pulled task {task.task_id[:8]} from model queue")
 
-                # Process the task (model already loaded, no switching needed)
-                result = await self._process_task(task)
+                # Busy from the moment a task is held, so scale-down never picks this worker
+                # while it collects a batch
+                self.state = WorkerState.BUSY
+                self._inflight = [task]
 
-                # Mark task as done in queue
-                self.model_queue.task_done()
+                # Micro-batch concurrent tasks of the same type into one model call
+                batch = await self._collect_batch(task)
 
-                # Post result to result queue for background processor
-                if hasattr(self.model_manager, 'worker_pool') and self.model_manager.worker_pool:
-                    await self.model_manager.worker_pool._worker_result_queue.put(result)
-                    self.logger.info(f"Posted result for task {result.task_id[:8]} to result queue")
-                else:
-                    self.logger.error(f"Cannot route result for task {result.task_id} - worker_pool not available")
+                # Drop tasks whose deadline passed while queued - the caller has given up
+                now = time.time()
+                results = [self._expired_result(t) for t in batch if t.deadline and now > t.deadline]
+                batch = [t for t in batch if not (t.deadline and now > t.deadline)]
+
+                if len(batch) > 1:
+                    results.extend(await self._process_batch(batch))
+                elif batch:
+                    # Process the task (model already loaded, no switching needed)
+                    results.append(await self._process_task(batch[0]))
+
+                for result in results:
+                    # Mark task as done in queue
+                    self.model_queue.task_done()
+                    await self._post_result(result)
+                    self._inflight = [t for t in self._inflight if t.task_id != result.task_id]
+
+                if self.state == WorkerState.BUSY:
+                    # Every task in the batch had expired
+                    self.state = WorkerState.IDLE
 
             except asyncio.CancelledError:
                 # Worker is shutting down
@@ -188,10 +381,301 @@ class ModelWorker:
                     location="ModelWorker._worker_loop()"
                 ))
                 self.errors += 1
+                # Answer the tasks this iteration pulled; nothing else will
+                worker_pool = getattr(self.model_manager, 'worker_pool', None)
+                for task in self._inflight:
+                    self.model_queue.task_done()
+                    if worker_pool:
+                        worker_pool._fail_task(task, "WORKER_PROCESSING_ERROR", str(e))
+                self._inflight = []
+                self.state = WorkerState.ERROR
                 continue
 
         self.logger.info("Processing loop ended")
-    
+
+    def holds_tasks(self) -> bool:
+        """Check whether the worker has pulled tasks whose results are not posted yet."""
+        return bool(self._inflight) or self._held_task is not None
+
+    def _return_unfinished_tasks(self):
+        """Hand back tasks pulled from the queue whose results were never posted.
+
+        Covers the batch being collected or processed when the worker was
+        stopped and the task held over for the next batch. They are requeued
+        for the model's other workers; if the queue is full, or the pool is
+        stopping the whole model (which clears the queue), their callers get a
+        failed result instead of waiting until worker_timeout.
+        """
+        unfinished = list(self._inflight)
+        if self._held_task is not None:
+            unfinished.append(self._held_task)
+        self._inflight = []
+        self._held_task = None
+        if not unfinished:
+            return
+
+        worker_pool = getattr(self.model_manager, 'worker_pool', None)
+        requeued = 0
+        for task in unfinished:
+            # Settle the original get() before the task is queued again
+            self.model_queue.task_done()
+            try:
+                self.model_queue.put_nowait(task)
+                requeued += 1
+            except asyncio.QueueFull:
+                if worker_pool:
+                    worker_pool._fail_task(
+                        task,
+                        "WORKER_STOPPED",
+                        f"Worker {self.worker_id} stopped before the task was processed"
+                    )
+        self.logger.warning(
+            f"Returned {len(unfinished)} unfinished task(s) on stop "
+            f"({requeued} requeued, {len(unfinished) - requeued} failed)"
+        )
+
+    async def _post_result(self, result: WorkerResult):
+        """Post a result to the pool's result queue for future delivery.
+
+        Args:
+            result: Result to deliver
+        """
+        if hasattr(self.model_manager, 'worker_pool') and self.model_manager.worker_pool:
+            await self.model_manager.worker_pool._worker_result_queue.put(result)
+            self.logger.info(f"Posted result for task {result.task_id[:8]} to result queue")
+        else:
+            self.logger.error(f"Cannot route result for task {result.task_id} - worker_pool not available")
+
+    def _expired_result(self, task: WorkerTask) -> WorkerResult:
+        """Build the result for a task that exceeded its deadline before processing.
+
+        Args:
+            task: Expired task
+
+        Returns:
+            Failed WorkerResult with error_code "TASK_DEADLINE_EXCEEDED"
+        """
+        self.tasks_expired += 1
+        waited = time.time() - task.created_at
+        self.logger.warning(f"Dropping task {task.task_id[:8]} - deadline exceeded after {waited:.1f}s in queue")
+        return WorkerResult(
+            task_id=task.task_id,
+            worker_id=self.worker_id,
+            success=False,
+            error=f"Task waited {waited:.1f}s in queue and exceeded its deadline",
+            error_code="TASK_DEADLINE_EXCEEDED"
+        )
+
+    @staticmethod
+    def _count_texts(task: WorkerTask) -> int:
+        """Number of texts (or prompts) carried by a task."""
+        return 1 if isinstance(task.input_data, str) else len(task.input_data)
+
+    async def _collect_batch(self, first_task: WorkerTask) -> List[WorkerTask]:
+        """Drain queued tasks of the same type to fill one model call.
+
+        Collects tasks until worker_pool.batch_size texts are gathered or
+        worker_pool.batch_wait_ms has elapsed since the first task. A task that
+        does not fit (different task type or too many texts) is held for the
+        next loop iteration.
+
+        Args:
+            first_task: Task already pulled from the queue
+
+        Returns:
+            Tasks to process together (always includes first_task)
+        """
+        if first_task.stream:
+            # Streaming tasks own their generate() call
+            return [first_task]
+
+        pool_config = self.model_manager.settings.worker_pool
+        batch_size = pool_config.batch_size
+        max_wait = pool_config.batch_wait_ms / 1000
+
+        batch = [first_task]
+        text_count = self._count_texts(first_task)
+        loop = asyncio.get_event_loop()
+        deadline = loop.time() + max_wait
+
+        while text_count < batch_size:
+            try:
+                task = self.model_queue.get_nowait()
+            except asyncio.QueueEmpty:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    task = await asyncio.wait_for(self.model_queue.get(), timeout=remaining)
+                except asyncio.TimeoutError:
+                    break
+
+            task_texts = self._count_texts(task) if task.task_type == first_task.task_type and not task.stream else None
+            if task_texts is None or text_count + task_texts > batch_size:
+                self._held_task = task
+                break
+
+            batch.append(task)
+            self._inflight.append(task)
+            text_count += task_texts
+
+        if len(batch) > 1:
+            self.logger.debug(f"Collected {len(batch)} {first_task.task_type} tasks ({text_count} texts) into one batch")
+        return batch
+
+    async def _process_batch(self, tasks: List[WorkerTask]) -> List[WorkerResult]:
+        """Run several same-type tasks with one model call and split the results.
+
+        Args:
+            tasks: Tasks collected by _collect_batch()
+
+        Returns:
+            One WorkerResult per task, in the same order
+        """
+        start_time = time.time()
+        self.state = WorkerState.BUSY
+        self.last_activity = start_time
+
+        # Flatten texts and remember each task's slice
+        texts: List[str] = []
+        spans: List[Tuple[int, int]] = []
+        for task in tasks:
+            task_texts = [task.input_data] if isinstance(task.input_data, str) else list(task.input_data)
+            spans.append((len(texts), len(texts) + len(task_texts)))
+            texts.extend(task_texts)
+
+        is_embedding = tasks[0].task_type == "embedding"
+        task_errors: Dict[str, str] = {}
+        try:
+            if is_embedding:
+                embeddings = await self._encode_texts(texts)
+            else:
+                generated, task_errors = await self._generate_batch(tasks, spans, texts)
+        except Exception as e:
+            processing_time = time.time() - start_time
+            self.errors += len(tasks)
+            self.state = WorkerState.ERROR
+            self.logger.error(f"Failed to process batch of {len(tasks)} tasks: {e}")
+            return [
+                WorkerResult(
+                    task_id=task.task_id,
+                    worker_id=self.worker_id,
+                    success=False,
+                    error=str(e),
+                    processing_time=processing_time
+                )
+                for task in tasks
+            ]
+
+        processing_time = time.time() - start_time
+        self.tasks_processed += len(tasks) - len(task_errors)
+        self.errors += len(task_errors)
+        self.batches_processed += 1
+        self.total_processing_time += processing_time
+        self.state = WorkerState.IDLE
+        self._record_metrics(tasks, start_time, processing_time, len(texts))
+
+        self.logger.info(f"Completed batch of {len(tasks)} tasks ({len(texts)} texts) in {processing_time:.3f}s")
+
+        results = []
+        for task, (start, end) in zip(tasks, spans):
+            if task.task_id in task_errors:
+                results.append(WorkerResult(
+                    task_id=task.task_id,
+                    worker_id=self.worker_id,
+                    success=False,
+                    error=task_errors[task.task_id],
+                    processing_time=processing_time
+                ))
+                continue
+
+            if is_embedding:
+                # Keep the per-task output shape: 1D for str input, 2D for lists
+                task_embeddings = embeddings[start] if isinstance(task.input_data, str) else embeddings[start:end]
+                data = {
+                    "embeddings": task_embeddings,
+                    "model_name": self.model_name,
+                    "dimension": int(embeddings.shape[-1])
+                }
+            else:
+                data = self._text_generation_result(task.input_data, generated[start:end])
+
+            results.append(WorkerResult(
+                task_id=task.task_id,
+                worker_id=self.worker_id,
+                success=True,
+                data=data,
+                processing_time=processing_time,
+                metadata={
+                    "device": self.assigned_gpu,
+                    "model_name": self.model_name,
+                    "batch_tasks": len(tasks),
+                    "batch_texts": len(texts)
+                }
+            ))
+        return results
+
+    async def _generate_batch(
+        self, tasks: List[WorkerTask], spans: List[Tuple[int, int]], texts: List[str]
+    ) -> Tuple[List[Optional[str]], Dict[str, str]]:
+        """Generate text for a batch, one generate() group per set of generation arguments.
+
+        Tasks from different callers may carry overrides that make generate()
+        raise (e.g. do_sample with temperature 0). Each group runs on its own,
+        so such an error fails only the tasks that share those arguments.
+
+        Args:
+            tasks: Text generation tasks in the batch
+            spans: Each task's slice of texts
+            texts: Flattened prompts of all tasks
+
+        Returns:
+            (generated texts in prompt order, None for failed tasks;
+             {task_id: error} for tasks whose group raised)
+
+        Raises:
+            Exception: The last group's error if every group failed
+        """
+        groups: Dict[str, Tuple[Dict[str, Any], List[int]]] = {}
+        for position, task in enumerate(tasks):
+            kwargs = self._generation_kwargs(task)
+            groups.setdefault(repr(sorted(kwargs.items())), (kwargs, []))[1].append(position)
+
+        generated: List[Optional[str]] = [None] * len(texts)
+        task_errors: Dict[str, str] = {}
+        last_error = None
+        failed_groups = 0
+        for kwargs, positions in groups.values():
+            prompts = [text for position in positions for text in texts[slice(*spans[position])]]
+            try:
+                outputs = await self._generate_texts(prompts, [kwargs] * len(prompts))
+            except Exception as e:
+                last_error = e
+                failed_groups += 1
+                self.logger.warning(f"Generation failed for {len(positions)} of {len(tasks)} batched tasks: {e}")
+                for position in positions:
+                    task_errors[tasks[position].task_id] = str(e)
+                continue
+
+            offset = 0
+            for position in positions:
+                start, end = spans[position]
+                generated[start:end] = outputs[offset:offset + end - start]
+                offset += end - start
+
+        if failed_groups == len(groups):
+            raise last_error
+        return generated, task_errors
+
+    def _record_metrics(self, tasks: List[WorkerTask], start_time: float, processing_time: float, texts: int):
+        """Record queue wait and inference timing of a completed model call."""
+        metrics = getattr(self.model_manager, "metrics", None)
+        if metrics is not None:
+            metrics.record_call(
+                self.model_name, self.worker_id, tasks[0].task_type,
+                (start_time - task.created_at for task in tasks), processing_time, texts
+            )
+
     async def _process_task(self, task: WorkerTask) -> WorkerResult:
         """Process a single task.
 
@@ -220,6 +704,7 @@ class ModelWorker:
             self.tasks_processed += 1
             self.total_processing_time += processing_time
             self.state = WorkerState.IDLE
+            self._record_metrics([task], start_time, processing_time, self._count_texts(task))
 
             self.logger.info(f"Completed task {task.task_id[:8]} in {processing_time:.3f}s")
 
@@ -275,26 +760,21 @@ class ModelWorker:
                 raise RuntimeError("LoaderFactory not initialized in model_manager")
 
             loader_factory = self.model_manager.loader_factory
-
-            # Get model_type from lifecycle_manager registry (required for explicit loader selection)
-            model_type = None
-            if (hasattr(self.model_manager, 'lifecycle_manager') and
-                self.model_manager.lifecycle_manager and
-                hasattr(self.model_manager.lifecycle_manager, 'model_registry') and
-                self.model_name in self.model_manager.lifecycle_manager.model_registry):
-                model_type = self.model_manager.lifecycle_manager.model_registry[self.model_name].get("model_type")
-                self.logger.info(f"Retrieved model_type '{model_type}' from lifecycle_manager registry for {self.model_name}")
-            else:
-                self.logger.warning(f"Model {self.model_name} not found in lifecycle_manager registry, loader will auto-detect")
+            model_type = self._get_model_type()
 
             # Load model on assigned GPU with explicit model_type
             self.logger.info(f"Loading model {self.model_name} (type: {model_type}) on {self.assigned_gpu} via LoaderFactory")
+            rss_before = current_rss_bytes() if self.assigned_gpu == "cpu" else None
             model_result = await loader_factory.load_model(self.model_name, self.assigned_gpu, model_type=model_type)
 
             if not model_result.success:
                 raise RuntimeError(f"Failed to load model {self.model_name}: {model_result.error}")
 
             self.current_model = model_result.data
+            if self.model_manager.settings.memory_monitoring:
+                self.memory_usage = measure_model_memory(self.current_model, rss_before)
+
+            await self._warm_up()
             self.last_activity = time.time()
             self.state = WorkerState.IDLE
 
@@ -305,6 +785,65 @@ class ModelWorker:
             self.state = WorkerState.ERROR
             raise
 
+    def _warmup_enabled(self) -> bool:
+        """Check the model's remembered warm-up choice, then settings.warmup.enabled."""
+        lifecycle_manager = getattr(self.model_manager, 'lifecycle_manager', None)
+        if lifecycle_manager:
+            return lifecycle_manager.warmup_enabled(self.model_name)
+        return self.model_manager.settings.warmup.enabled
+
+    async def _warm_up(self):
+        """Run representative inputs through the model before it takes tasks.
+
+        Pays for lazy initialization (tokenizer caches, kernel selection,
+        allocator growth) here instead of in the first requests. Failures are
+        logged and do not fail the load.
+        """
+        if not self._warmup_enabled():
+            return
+
+        config = self.model_manager.settings.warmup
+        texts = list(config.texts) or [" ".join(["warmup"] * length) for length in config.sequence_lengths]
+        model_type = self.current_model.get("model_type") or self._get_model_type()
+
+        start_time = time.time()
+        try:
+            for text in texts:
+                if model_type == "text_generation":
+                    generate_kwargs = resolve_generation_kwargs(
+                        {"max_new_tokens": config.max_new_tokens}, self.model_manager.settings.text_generation
+                    )
+                    await self._generate_texts([text], [generate_kwargs])
+                else:
+                    await self._encode_texts([text] * config.batch_size)
+        except Exception as e:
+            self.logger.warning(f"Warm-up failed for {self.model_name}, continuing cold: {e}")
+            return
+
+        self.warmup = {
+            "inputs": len(texts),
+            "seconds": time.time() - start_time,
+            "completed_at": time.time()
+        }
+        self.logger.info(f"Warmed up {self.model_name} with {len(texts)} input(s) in {self.warmup['seconds']:.2f}s")
+
+    def _get_model_type(self) -> Optional[str]:
+        """Get model_type from the lifecycle_manager registry (required for explicit loader selection).
+
+        Returns:
+            Registered model_type, or None to let the loader auto-detect
+        """
+        if (hasattr(self.model_manager, 'lifecycle_manager') and
+            self.model_manager.lifecycle_manager and
+            hasattr(self.model_manager.lifecycle_manager, 'model_registry') and
+            self.model_name in self.model_manager.lifecycle_manager.model_registry):
+            model_type = self.model_manager.lifecycle_manager.model_registry[self.model_name].get("model_type")
+            self.logger.info(f"Retrieved model_type '{model_type}' from lifecycle_manager registry for {self.model_name}")
+            return model_type
+
+        self.logger.warning(f"Model {self.model_name} not found in lifecycle_manager registry, loader will auto-detect")
+        return None
+
     async def _process_embedding_task(self, task: WorkerTask):
         """Process an embedding task.
 
@@ -314,11 +853,33 @@ class ModelWorker:
         Returns:
             Embedding results
         """
+        texts = task.input_data
+
+        if isinstance(texts, str):
+            # Single vector (1D) for str input
+            result_embeddings = (await self._encode_texts([texts]))[0]
+        else:
+            result_embeddings = await self._encode_texts(texts)
+
+        return {
+            "embeddings": result_embeddings,  # np.ndarray: 1D for str input, 2D for lists
+            "model_name": self.model_name,
+            "dimension": int(result_embeddings.shape[-1])
+        }
+
+    async def _encode_texts(self, texts: List[str]):
+        """Encode a list of texts with the loaded embedding model.
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            2D float32 np.ndarray with one row per text
+        """
         if "model" not in self.current_model:
             raise RuntimeError("No embedding model loaded")
 
         model = self.current_model["model"]
-        texts = task.input_data
 
         # Generate embeddings with CUDA synchronization
         try:
@@ -328,27 +889,12 @@ class ModelWorker:
                 device_idx = int(self.assigned_gpu.split(':')[1]) if ':' in self.assigned_gpu else 0
                 torch.cuda.set_device(device_idx)
 
-            # Generate embeddings with explicit numpy conversion
-            # convert_to_numpy=True ensures we get numpy arrays that can be safely converted
             # Run in thread executor to avoid blocking event loop (enables true parallel processing)
             loop = asyncio.get_event_loop()
-
-            if isinstance(texts, str):
-                embeddings = await loop.run_in_executor(
-                    None,  # Use default ThreadPoolExecutor
-                    lambda: model.encode([texts], convert_to_numpy=True, show_progress_bar=False)
-                )
-                # Make a copy to avoid shared memory issues, then convert to list
-                import numpy as np
-                result_embeddings = np.array(embeddings[0], copy=True).tolist()
-            else:
-                embeddings = await loop.run_in_executor(
-                    None,  # Use default ThreadPoolExecutor
-                    lambda: model.encode(texts, convert_to_numpy=True, show_progress_bar=False)
-                )
-                # Make copies to avoid shared memory issues, then convert to lists
-                import numpy as np
-                result_embeddings = [np.array(emb, copy=True).tolist() for emb in embeddings]
+            result_embeddings = await loop.run_in_executor(
+                None,  # Use default ThreadPoolExecutor
+                run_encode, model, texts
+            )
 
             # Synchronize CUDA operations after processing
             if self.assigned_gpu.startswith("cuda"):
@@ -358,14 +904,10 @@ class ModelWorker:
             self.logger.error(f"Embedding error: {e}")
             raise
 
-        return {
-            "embeddings": result_embeddings,
-            "model_name": self.model_name,
-            "dimension": len(result_embeddings[0] if isinstance(result_embeddings[0], list) else result_embeddings)
-        }
-    
+        return result_embeddings
+
     async def _process_text_generation_task(self, task: WorkerTask):
-        """Process a text generation task.
+        """Process a text generation task (single prompt or list of prompts).
 
         Args:
             task: Text generation task
@@ -373,44 +915,82 @@ class ModelWorker:
         Returns:
             Generation results
         """
-        if "model" not in self.current_model or "tokenizer" not in self.current_model:
-            raise RuntimeError("No text generation model loaded")
+        prompts = [task.input_data] if isinstance(task.input_data, str) else list(task.input_data)
+        generate_kwargs = self._generation_kwargs(task)
 
-        model = self.current_model["model"]
-        tokenizer = self.current_model["tokenizer"]
+        if task.stream:
+            # Chunks are produced off the event loop - hop back onto it to deliver them
+            loop = asyncio.get_event_loop()
+            pool = self.model_manager.worker_pool
 
-        input_text = task.input_data
-        max_length = task.metadata.get("max_length", 128)
+            def on_text(text: str):
+                loop.call_soon_threadsafe(pool.push_stream_chunk, task.task_id, text)
 
-        # Tokenize input
-        inputs = tokenizer(input_text, return_tensors="pt", truncation=True, max_length=512)
-        inputs = {k: v.to(self.assigned_gpu) for k, v in inputs.items()}
+            generated_text = await self._stream_text(prompts[0], generate_kwargs, on_text)
+            return self._text_generation_result(task.input_data, [generated_text])
 
-        # Generate
-        try:
-            import torch
-        except ImportError:
-            raise RuntimeError("PyTorch required for text generation")
-
-        with torch.no_grad():
-            outputs = model.generate(
-                **inputs,
-                max_length=max_length,
-                num_beams=4,
-                early_stopping=True,
-                do_sample=False
-            )
+        generated = await self._generate_texts(prompts, [generate_kwargs] * len(prompts))
+        return self._text_generation_result(task.input_data, generated)
+
+    def _generation_kwargs(self, task: WorkerTask) -> Dict[str, Any]:
+        """Resolve model.generate() arguments for a task from its profile and overrides."""
+        return resolve_generation_kwargs(task.metadata, self.model_manager.settings.text_generation)
+
+    async def _generate_texts(self, prompts: List[str], generate_kwargs: List[Dict[str, Any]]) -> List[str]:
+        """Generate text for prompts with the loaded model.
+
+        Args:
+            prompts: Prompt texts
+            generate_kwargs: model.generate() arguments, one dict per prompt
 
-        # Decode result
-        generated_text = tokenizer.decode(outputs[0], skip_special_tokens=True)
+        Returns:
+            Generated texts in prompt order
+        """
+        config = self.model_manager.settings.text_generation
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(
+            None,
+            run_text_generation,
+            self.current_model, prompts, generate_kwargs, self.assigned_gpu,
+            config.batch_size, config.max_input_length
+        )
+
+    async def _stream_text(self, prompt: str, generate_kwargs: Dict[str, Any], on_text: Callable[[str], None]) -> str:
+        """Generate text for one prompt, calling on_text with each decoded chunk.
+
+        Args:
+            prompt: Prompt text
+            generate_kwargs: model.generate() arguments
+            on_text: Thread-safe chunk callback
 
+        Returns:
+            Full generated text
+        """
+        config = self.model_manager.settings.text_generation
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(
+            None,
+            run_text_generation_stream,
+            self.current_model, prompt, generate_kwargs, self.assigned_gpu,
+            config.max_input_length, on_text
+        )
+
+    def _text_generation_result(self, input_data, generated: List[str]) -> Dict[str, Any]:
+        """Shape generated texts to match the task input (str or list of prompts)."""
+        if isinstance(input_data, str):
+            return {
+                "generated_text": generated[0],
+                "model_name": self.model_name,
+                "input_length": len(input_data),
+                "output_length": len(generated[0])
+            }
         return {
-            "generated_text": generated_text,
+            "generated_texts": generated,
             "model_name": self.model_name,
-            "input_length": len(input_text),
-            "output_length": len(generated_text)
+            "input_lengths": [len(prompt) for prompt in input_data],
+            "output_lengths": [len(text) for text in generated]
         }
-    
+
     def get_status(self):
         """Get worker status information.
 
@@ -431,5 +1011,9 @@ class ModelWorker:
             "total_processing_time": self.total_processing_time,
             "average_processing_time": avg_processing_time,
             "errors": self.errors,
+            "batches_processed": self.batches_processed,
+            "tasks_expired": self.tasks_expired,
+            "memory_usage": self.memory_usage,
+            "warmup": self.warmup,
             "last_activity": self.last_activity
         }
\ No newline at end of file
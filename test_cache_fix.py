@@ -7,11 +7,22 @@ Fix: Always return list of embeddings, never unwrap
 """
 
 import asyncio
+import math
 import sys
 from modules.core.model_manager.cache.embedding_cache import EmbeddingCache
 from modules.core.model_manager.settings import ModelManagerSettings
 
 
+def embeddings_match(cached, fresh) -> bool:
+    """Compare embeddings allowing for float32 cache storage."""
+    if len(cached) != len(fresh):
+        return False
+    return all(
+        len(c) == len(f) and all(math.isclose(a, b, rel_tol=1e-6) for a, b in zip(c, f))
+        for c, f in zip(cached, fresh)
+    )
+
+
 async def test_cache_format_consistency():
     """Test that cache returns same format as fresh results."""
     print("Testing embedding cache format consistency...")
@@ -54,8 +65,8 @@ async def test_cache_format_consistency():
         print(f"Cached: embeddings[0] = {cached_embeddings[0][:3]}... (embedding vector)")
 
         # Verify actual content matches
-        if cached_embeddings == fresh_embedding:
-            print("\nSUCCESS: Cached content matches fresh content exactly")
+        if embeddings_match(cached_embeddings, fresh_embedding):
+            print("\nSUCCESS: Cached content matches fresh content (float32 precision)")
             return True
         else:
             print("\nERROR: Content mismatch!")
@@ -104,7 +115,7 @@ async def test_multiple_embeddings():
     print(f"Fresh:  {len(fresh_embeddings)} embeddings, each length {len(fresh_embeddings[0])}")
     print(f"Cached: {len(cached_embeddings)} embeddings, each length {len(cached_embeddings[0])}")
 
-    if cached_embeddings == fresh_embeddings:
+    if embeddings_match(cached_embeddings, fresh_embeddings):
         print("\nSUCCESS: Multiple embeddings cached and retrieved correctly")
         return True
     else: